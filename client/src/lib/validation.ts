@@ -48,6 +48,11 @@ function checkRule(value: unknown, rule: ValidationRule): string | null {
         return custom ?? `Must be at most ${param} characters.`;
       }
       break;
+    case "max_items":
+      if (Array.isArray(value) && value.length > (param as number)) {
+        return custom ?? `Must have at most ${param} items.`;
+      }
+      break;
     case "pattern":
       if (typeof value === "string" && !new RegExp(param as string).test(value)) {
         return custom ?? `Must match pattern ${param}.`;
@@ -4,6 +4,7 @@ export type ValidationRuleType =
   | "max"
   | "min_length"
   | "max_length"
+  | "max_items"
   | "pattern"
   | "one_of";
 
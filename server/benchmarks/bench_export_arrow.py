@@ -0,0 +1,126 @@
+"""Export throughput: NDJSON plus downstream conversion vs Parquet / Arrow IPC.
+
+Fills an in-memory store with N completed sessions, then times each path
+from the store to a columnar table: writing NDJSON and converting its JSON
+lines with `pa.Table.from_pylist` (the downstream ETL step), against writing
+Parquet or Arrow IPC directly and loading the file back (IPC memory-mapped).
+Needs pyarrow. Run from the server directory:
+
+    uv run python benchmarks/bench_export_arrow.py [--sizes 10000 100000] [--batch-size N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import tempfile
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import pyarrow as pa
+
+from interview.engine.schema_registry import schema_fingerprint
+from interview.export import export_ndjson
+from interview.export_arrow import DEFAULT_BATCH_SIZE, read_arrow, write_arrow
+from interview.models.schema import InterviewSchema
+from interview.session.store import InMemorySessionStore
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+DEFAULT_SCHEMA = Path(__file__).resolve().parents[2] / "schemas" / "user_profile.json"
+
+T0 = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def _data(rng: random.Random) -> dict[str, Any]:
+    status = rng.choice(["employed", "self_employed", "unemployed", "student", "retired"])
+    data: dict[str, Any] = {
+        "personal": {
+            "first_name": rng.choice(["Ana", "Bo", "Carla", "Dev"]),
+            "last_name": rng.choice(["Silva", "Ng", "Okafor"]),
+            "email": f"user{rng.randrange(10**6)}@example.com",
+            "age": rng.randrange(18, 90),
+            "marital_status": rng.choice(["single", "married", "divorced", "widowed"]),
+        },
+        "employment": {"status": status},
+        "children": [
+            {"name": rng.choice(["Eli", "Fay", "Gus"]), "age": rng.randrange(0, 30)}
+            for _ in range(rng.randrange(0, 4))
+        ],
+        "bio": "Likes hiking and reading. " * rng.randrange(1, 8),
+    }
+    if data["personal"]["marital_status"] == "married":
+        data["personal"]["spouse_name"] = rng.choice(["Eve", "Finn"])
+    if status in ("employed", "self_employed"):
+        data["employment"].update(company="Acme", job_title="Engineer")
+    return data
+
+
+def _store(schema: InterviewSchema, count: int, seed: int = 1) -> InMemorySessionStore:
+    rng = random.Random(seed)  # noqa: S311
+    store = InMemorySessionStore()
+    for i in range(count):
+        session = store.create(schema, _data(rng))
+        session.is_complete = True
+        session.completed_at = T0 + timedelta(seconds=i)
+        store.update(session)
+    return store
+
+
+def _time(fn: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def _ndjson_to_table(store: InMemorySessionStore, path: Path) -> None:
+    with path.open("w") as out:
+        out.writelines(export_ndjson(store))
+    with path.open() as lines:
+        pa.Table.from_pylist([json.loads(line)["data"] for line in lines])
+
+
+def _report(size: int, file_format: str, write: float, load: float | None, path: Path) -> None:
+    total = write + (load or 0.0)
+    load_text = f"{load:>6.2f}s" if load is not None else f"{'':>7}"
+    print(
+        f"  {size:>9}  {file_format:<8}  {write:>6.2f}s  {load_text}  "
+        f"{size / total:>11,.0f}  {path.stat().st_size / 2**20:.1f} MiB"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Arrow/Parquet export benchmark")
+    parser.add_argument("--schema", type=Path, default=DEFAULT_SCHEMA)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args()
+
+    schema = InterviewSchema.model_validate(json.loads(args.schema.read_text()))
+    schema_id = schema_fingerprint(schema)
+    print(f"batch size: {args.batch_size} (ndjson write includes the conversion to a table)")
+    print(f"  {'sessions':>9}  {'format':<8}  {'write':>7}  {'load':>7}  {'sessions/s':>11}  size")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            store = _store(schema, size)
+            path = Path(tmp) / "export.ndjson"
+            _report(
+                size, "ndjson", _time(lambda s=store, p=path: _ndjson_to_table(s, p)), None, path
+            )
+            for file_format in ("parquet", "arrow"):
+                path = Path(tmp) / f"export.{file_format}"
+                write = _time(
+                    lambda s=store, p=path, f=file_format: write_arrow(
+                        s, p, schema_id, f, batch_size=args.batch_size
+                    )
+                )
+                load = _time(lambda p=path, f=file_format: read_arrow(p, f))
+                _report(size, file_format, write, load, path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Per-turn allocations and store serialisation: pydantic models vs compact state.
+
+Reports allocations for building one conversation turn, and serialise /
+deserialise throughput for a session with a realistic history. The compact
+codec uses msgpack when installed and compact JSON otherwise. Run from the
+server directory:
+
+    uv run python benchmarks/bench_session_codec.py [--turns N] [--iterations N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+import tracemalloc
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from interview.models.schema import InterviewSchema
+from interview.models.session import ConversationTurn, Session
+from interview.session import compact
+from interview.session.store import InMemorySessionStore
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+DEFAULT_SCHEMA = Path(__file__).resolve().parents[2] / "schemas" / "user_profile.json"
+
+
+def _allocations(build: Callable[[], Any], repeat: int = 1000) -> float:
+    tracemalloc.start()
+    snapshot_before = tracemalloc.take_snapshot()
+    kept = [build() for _ in range(repeat)]
+    snapshot_after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = snapshot_after.compare_to(snapshot_before, "filename")
+    del kept
+    return sum(s.count_diff for s in stats) / repeat
+
+
+def _throughput(fn: Callable[[], Any], iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return iterations / (time.perf_counter() - start)
+
+
+def _session(turns: int) -> tuple[InMemorySessionStore, Session]:
+    store = InMemorySessionStore()
+    schema = InterviewSchema.model_validate(json.loads(DEFAULT_SCHEMA.read_text()))
+    session = store.create(schema, {})
+    for i in range(turns):
+        session.current_data[f"field_{i}"] = {"value": "x" * 24, "index": i}
+        session.conversation_history.append(
+            ConversationTurn(role="user" if i % 2 else "assistant", content="y" * 300)
+        )
+    store.update(session)
+    return store, session
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Session codec benchmark")
+    parser.add_argument("--turns", type=int, default=20)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    print("allocations per turn object:")
+    content = "z" * 200
+    for name, build in (
+        ("ConversationTurn(...)", lambda: ConversationTurn(role="user", content=content)),
+        (
+            "ConversationTurn.model_construct",
+            lambda: ConversationTurn.model_construct(role="user", content=content),
+        ),
+        ("CompactTurn", lambda: compact.CompactTurn("user", content)),
+    ):
+        print(f"  {name:<34} {_allocations(build):6.1f}")
+
+    store, session = _session(args.turns)
+    as_json = session.model_dump_json(by_alias=True)
+    packed = compact.dump_session(session)
+    codec = "msgpack" if compact.msgpack is not None else "json"
+    print(f"\nserialisation ({args.turns} turns, compact codec: {codec}):")
+    print(f"  payload bytes   pydantic JSON {len(as_json):8d}   compact {len(packed):8d}")
+    rows = (
+        (
+            "serialise",
+            lambda: session.model_dump_json(by_alias=True),
+            lambda: compact.dump_session(session),
+        ),
+        (
+            "deserialise",
+            lambda: Session.model_validate_json(as_json),
+            lambda: compact.load_compact_session(packed, store.interner),
+        ),
+    )
+    for name, baseline, fast in rows:
+        before = _throughput(baseline, args.iterations)
+        after = _throughput(fast, args.iterations)
+        print(f"  {name:<12} pydantic {before:10.0f}/s   compact {after:10.0f}/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Per-session memory with and without schema interning.
+
+Each /start request carries the schema inline, so every session used to
+hold its own parsed copy. Run from the server directory:
+
+    uv run python benchmarks/bench_session_memory.py [--sessions N] [--schema PATH]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import tracemalloc
+import uuid
+from pathlib import Path
+from typing import Any
+
+from interview.models.schema import InterviewSchema
+from interview.models.session import Session
+from interview.session.store import InMemorySessionStore
+
+DEFAULT_SCHEMA = Path(__file__).resolve().parents[2] / "schemas" / "user_profile.json"
+
+
+def _measure(build: Any, sessions: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = build(sessions)
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return (after - before) / sessions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Per-session memory benchmark")
+    parser.add_argument("--sessions", type=int, default=5000)
+    parser.add_argument("--schema", type=Path, default=DEFAULT_SCHEMA)
+    args = parser.parse_args()
+    raw: dict[str, Any] = json.loads(args.schema.read_text())
+
+    def copies(n: int) -> list[Session]:
+        return [
+            Session(id=str(uuid.uuid4()), schema_=InterviewSchema.model_validate(raw))
+            for _ in range(n)
+        ]
+
+    def interned(n: int) -> InMemorySessionStore:
+        store = InMemorySessionStore()
+        for _ in range(n):
+            store.create(InterviewSchema.model_validate(raw), {})
+        return store
+
+    before = _measure(copies, args.sessions)
+    after = _measure(interned, args.sessions)
+    print(f"schema: {args.schema.name}, sessions: {args.sessions}")
+    print(f"  per-session copies: {before:10.0f} bytes/session")
+    print(f"  interned:           {after:10.0f} bytes/session")
+    print(f"  reduction:          {before / after:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
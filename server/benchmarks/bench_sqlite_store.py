@@ -0,0 +1,78 @@
+"""Throughput of SQLiteSessionStore create/get/update under concurrent writers.
+
+Each worker thread runs an interview-shaped loop: create a session, then
+alternate get and update for a number of turns, appending a turn and
+filling a field each time. Run from the server directory:
+
+    uv run python benchmarks/bench_sqlite_store.py [--workers N] [--sessions N] [--turns N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from interview.models.schema import InterviewSchema
+from interview.models.session import ConversationTurn
+from interview.session.sqlite import SQLiteSessionStore
+
+DEFAULT_SCHEMA = Path(__file__).resolve().parents[2] / "schemas" / "user_profile.json"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="SQLite session store throughput")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--sessions", type=int, default=200, help="sessions per worker")
+    parser.add_argument("--turns", type=int, default=10)
+    parser.add_argument("--pool-size", type=int, default=8)
+    args = parser.parse_args()
+    schema = InterviewSchema.model_validate(json.loads(DEFAULT_SCHEMA.read_text()))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SQLiteSessionStore(Path(tmp) / "bench.db", pool_size=args.pool_size)
+        counts = {"create": 0.0, "get": 0.0, "update": 0.0}
+
+        def worker(_: int) -> dict[str, float]:
+            timings = dict.fromkeys(counts, 0.0)
+            for _ in range(args.sessions):
+                t0 = time.perf_counter()
+                session = store.create(schema, {})
+                timings["create"] += time.perf_counter() - t0
+                for turn in range(args.turns):
+                    t0 = time.perf_counter()
+                    loaded = store.get(session.id)
+                    timings["get"] += time.perf_counter() - t0
+                    assert loaded is not None
+                    loaded.current_data[f"field_{turn}"] = "x" * 32
+                    loaded.conversation_history.append(
+                        ConversationTurn(role="user", content="y" * 200)
+                    )
+                    loaded.version += 1
+                    t0 = time.perf_counter()
+                    store.update(loaded)
+                    timings["update"] += time.perf_counter() - t0
+            return timings
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.workers) as pool:
+            results = list(pool.map(worker, range(args.workers)))
+        elapsed = time.perf_counter() - start
+        store.close()
+
+    ops = {
+        "create": args.workers * args.sessions,
+        "get": args.workers * args.sessions * args.turns,
+        "update": args.workers * args.sessions * args.turns,
+    }
+    print(f"workers: {args.workers}, pool: {args.pool_size}, wall: {elapsed:.2f}s")
+    for op, n in ops.items():
+        busy = sum(r[op] for r in results)
+        print(f"  {op:<7} {n:8d} ops  {n / elapsed:10.0f} ops/s  {busy / n * 1e3:7.3f} ms/op")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,54 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException, Request
+import asyncio
+import copy
+import json
+from datetime import datetime
+from typing import TYPE_CHECKING, Annotated, Any
 
+from fastapi import APIRouter, Header, HTTPException, Request, Response, WebSocket
+from fastapi.responses import StreamingResponse
+
+from interview.config import settings
+from interview.engine.block_repair import REPAIR_KINDS
+from interview.engine.data_index import session_index
+from interview.engine.ingest import (
+    BodyTooLargeError,
+    iter_json_array,
+    iter_ndjson,
+    iter_spooled,
+    spool_body,
+)
 from interview.engine.orchestrator import InterviewOrchestrator
+from interview.engine.prefill import analyze_stream
+from interview.engine.rules import compile_rules
 from interview.engine.schema_analyzer import get_missing_fields, is_complete
+from interview.engine.schema_registry import SchemaRegistry
+from interview.export import ExportNotSupportedError, export_ndjson
+from interview.idempotency import IdempotencyCache, IdempotencyKeyReusedError
 from interview.models.api import (
+    FunnelResponse,
+    IngestItemsResponse,
+    RegisterSchemaRequest,
+    RegisterSchemaResponse,
     StartRequest,
     StartResponse,
     StatusResponse,
+    StreamEvent,
     SubmitRequest,
     SubmitResponse,
 )
-from interview.session.store import SessionStore
+from interview.models.schema import InterviewSchema
+from interview.session.store import SchemaInterner, SessionStore
+from interview.websocket import run_session_socket
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable
+    from concurrent.futures import Executor
+
+    from pydantic import BaseModel
+
+    from interview.engine.ingest import ParsedItem
 
 router = APIRouter(prefix="/api/interview")
 
@@ -24,20 +61,291 @@ def _get_store(request: Request) -> SessionStore:
     return request.app.state.store  # type: ignore[no-any-return]
 
 
+def _get_registry(request: Request) -> SchemaRegistry:
+    return request.app.state.registry  # type: ignore[no-any-return]
+
+
+def _body_items(
+    http_request: Request, chunks: AsyncIterable[bytes] | None = None
+) -> AsyncIterator[ParsedItem]:
+    """Parse the request body as it arrives: NDJSON by content type, else a JSON array.
+
+    `chunks` replaces the body stream, e.g. with a spooled copy of it.
+    """
+    content_type = http_request.headers.get("content-type", "")
+    parse = iter_ndjson if "ndjson" in content_type or "jsonl" in content_type else iter_json_array
+    return parse(chunks if chunks is not None else http_request.stream())
+
+
+def _resolve_schema(request: StartRequest, http_request: Request) -> InterviewSchema:
+    """The schema to start with: the registered one for `schema_id`, else the inline one."""
+    if request.schema_id is None:
+        return request.schema_
+    entry = _get_registry(http_request).get(request.schema_id)
+    if entry is None:
+        raise HTTPException(status_code=404, detail="Schema not found")
+    return entry.schema
+
+
+async def _idempotent(
+    http_request: Request,
+    key: str | None,
+    scope: str,
+    request: BaseModel,
+    compute: Callable[[], Awaitable[Any]],
+) -> Any:
+    """Run `compute`, or replay its stored result when the key was seen before."""
+    if key is None:
+        return await compute()
+    cache: IdempotencyCache = http_request.app.state.idempotency
+    fingerprint = json.dumps(request.model_dump(mode="json"), sort_keys=True)
+
+    async def frozen() -> Any:
+        # Session data is merged in place later; store a copy so replays don't change
+        return copy.deepcopy(await compute())
+
+    try:
+        return await cache.run(f"{scope}:{key}", fingerprint, frozen)
+    except IdempotencyKeyReusedError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+
+
+async def _sse(events: AsyncIterator[StreamEvent]) -> AsyncIterator[str]:
+    async for event in events:
+        yield f"event: {event.event}\ndata: {json.dumps(event.data)}\n\n"
+
+
+def _sse_response(events: AsyncIterator[StreamEvent]) -> StreamingResponse:
+    return StreamingResponse(
+        _sse(events),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.post("/schemas", response_model=RegisterSchemaResponse)
+async def register_schema(
+    request: RegisterSchemaRequest, http_request: Request
+) -> RegisterSchemaResponse:
+    entry = _get_registry(http_request).register(request.schema_, name=request.name)
+    return RegisterSchemaResponse(schema_id=entry.schema_id, name=entry.name, version=entry.version)
+
+
+@router.get("/schemas/{schema_id}/rules")
+async def schema_rules(schema_id: str, http_request: Request) -> Response:
+    """The schema's compiled validation and visibility rules, for local checks on the client.
+
+    Served with an ETag; a matching `If-None-Match` gets an empty `304`.
+    Known schemas are registered ones and those of sessions in the store.
+    """
+    schema = _find_schema(schema_id, http_request)
+    if schema is None:
+        raise HTTPException(status_code=404, detail="Schema not found")
+    bundle = compile_rules(schema)
+    headers = {"ETag": bundle.etag, "Cache-Control": "no-cache"}
+    if _etag_matches(http_request.headers.get("if-none-match"), bundle.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(bundle.body, media_type="application/json", headers=headers)
+
+
+def _find_schema(schema_id: str, http_request: Request) -> InterviewSchema | None:
+    registry: SchemaRegistry | None = getattr(http_request.app.state, "registry", None)
+    entry = registry.get(schema_id) if registry is not None else None
+    if entry is not None:
+        return entry.schema
+    interner: SchemaInterner | None = getattr(_get_store(http_request), "interner", None)
+    return interner.get(schema_id) if interner is not None else None
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if if_none_match is None:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or etag in tags
+
+
 @router.post("/start", response_model=StartResponse)
-async def start_interview(request: StartRequest, http_request: Request) -> StartResponse:
+async def start_interview(
+    request: StartRequest,
+    http_request: Request,
+    idempotency_key: Annotated[str | None, Header(alias="Idempotency-Key")] = None,
+) -> StartResponse:
+    schema = _resolve_schema(request, http_request)
+    orchestrator = _get_orchestrator(http_request)
+
+    async def compute() -> StartResponse:
+        # The first step is an LLM call; keep it off the event loop
+        return await asyncio.to_thread(
+            orchestrator.start, schema, request.initial_data, delta=request.delta
+        )
+
+    return await _idempotent(  # type: ignore[no-any-return]
+        http_request, idempotency_key, "start", request, compute
+    )
+
+
+@router.post("/start/stream")
+async def start_interview_stream(request: StartRequest, http_request: Request) -> StreamingResponse:
+    schema = _resolve_schema(request, http_request)
     orchestrator = _get_orchestrator(http_request)
-    return orchestrator.start(request.schema_, request.initial_data)
+    return _sse_response(
+        orchestrator.start_stream(schema, request.initial_data, delta=request.delta)
+    )
 
 
 @router.post("/{session_id}/submit", response_model=SubmitResponse)
-async def submit(session_id: str, request: SubmitRequest, http_request: Request) -> SubmitResponse:
+async def submit(
+    session_id: str,
+    request: SubmitRequest,
+    http_request: Request,
+    idempotency_key: Annotated[str | None, Header(alias="Idempotency-Key")] = None,
+) -> SubmitResponse:
     store = _get_store(http_request)
     session = store.get(session_id)
     if session is None:
         raise HTTPException(status_code=404, detail="Session not found")
     orchestrator = _get_orchestrator(http_request)
-    return orchestrator.submit(session_id, request)
+
+    async def compute() -> SubmitResponse:
+        return await orchestrator.submit_async(session_id, request)
+
+    return await _idempotent(  # type: ignore[no-any-return]
+        http_request, idempotency_key, f"submit:{session_id}", request, compute
+    )
+
+
+@router.post("/{session_id}/submit/stream")
+async def submit_stream(
+    session_id: str,
+    request: SubmitRequest,
+    http_request: Request,
+) -> StreamingResponse:
+    store = _get_store(http_request)
+    if store.get(session_id) is None:
+        raise HTTPException(status_code=404, detail="Session not found")
+    orchestrator = _get_orchestrator(http_request)
+    return _sse_response(orchestrator.submit_stream(session_id, request))
+
+
+@router.post("/{session_id}/items/{binding}", response_model=IngestItemsResponse)
+async def ingest_items(
+    session_id: str,
+    binding: str,
+    http_request: Request,
+    start: int | None = None,
+) -> IngestItemsResponse:
+    """Append many items to one array binding, from NDJSON or a JSON array body.
+
+    The body is parsed and validated as it streams in; send
+    `Content-Type: application/x-ndjson` for one item per line.
+    """
+    store = _get_store(http_request)
+    if store.get(session_id) is None:
+        raise HTTPException(status_code=404, detail="Session not found")
+    orchestrator = _get_orchestrator(http_request)
+    return await orchestrator.ingest_items(
+        session_id, binding, _body_items(http_request), start=start
+    )
+
+
+async def _ndjson(lines: AsyncIterator[dict[str, Any]]) -> AsyncIterator[str]:
+    async for line in lines:
+        yield json.dumps(line) + "\n"
+
+
+@router.post("/prefill")
+async def prefill(schema_id: str, http_request: Request) -> StreamingResponse:
+    """Report what each of many `initial_data` records still misses, without an LLM call.
+
+    The body holds the records (NDJSON or a JSON array) for the registered
+    schema `schema_id`; the response streams one NDJSON line per record,
+    in body order.
+    """
+    entry = _get_registry(http_request).get(schema_id)
+    if entry is None:
+        raise HTTPException(status_code=404, detail="Schema not found")
+    pool: Executor | None = getattr(http_request.app.state, "prefill_pool", None)
+    # Receive the body before responding: once a StreamingResponse starts, its
+    # disconnect listener owns `receive` and the rest of the body never arrives.
+    # It is spooled to a temporary file, not held in memory, and parsed back
+    # a chunk at a time.
+    max_bytes = settings.prefill_max_body_bytes
+    if int(http_request.headers.get("content-length") or 0) > max_bytes:
+        raise HTTPException(status_code=413, detail=f"Body exceeds {max_bytes} bytes")
+    try:
+        spool = await spool_body(http_request.stream(), max_bytes)
+    except BodyTooLargeError as exc:
+        raise HTTPException(status_code=413, detail=str(exc)) from exc
+    items = _body_items(http_request, iter_spooled(spool))
+
+    async def lines() -> AsyncIterator[dict[str, Any]]:
+        async for report in analyze_stream(entry.schema, items, pool):
+            yield report.to_dict()
+
+    return StreamingResponse(_ndjson(lines()), media_type="application/x-ndjson")
+
+
+@router.get("/export")
+async def export_sessions(
+    http_request: Request,
+    schema_id: str | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    cursor: str | None = None,
+    limit: int | None = None,
+) -> StreamingResponse:
+    """Stream completed sessions as NDJSON, one flattened record per line.
+
+    Lines come in completion order; pass the `cursor` of the last line
+    received to resume after it. `since` is inclusive, `until` exclusive.
+    """
+    try:
+        lines = export_ndjson(
+            _get_store(http_request), schema_id, since, until, cursor=cursor, limit=limit
+        )
+    except ExportNotSupportedError as exc:
+        raise HTTPException(status_code=501, detail=str(exc)) from exc
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+    return StreamingResponse(lines, media_type="application/x-ndjson")
+
+
+@router.get("/store/stats")
+async def store_stats(http_request: Request) -> dict[str, int]:
+    """Session store gauges (size, approximate bytes, evictions where tracked)."""
+    stats: Callable[[], dict[str, int]] | None = getattr(_get_store(http_request), "stats", None)
+    return stats() if stats is not None else {}
+
+
+@router.get("/repairs/stats")
+async def repair_stats(http_request: Request) -> dict[str, int]:
+    """How many times each kind of generated-block repair was applied."""
+    counts = _get_orchestrator(http_request).repair_counts
+    return {kind: counts[kind] for kind in REPAIR_KINDS}
+
+
+@router.get("/analytics/funnel", response_model=FunnelResponse)
+async def field_funnel(schema_id: str, http_request: Request) -> FunnelResponse:
+    """How often each field of a schema was asked, answered, invalid or extracted.
+
+    Served from counters the orchestrator keeps per turn; no sessions are read.
+    """
+    report = _get_orchestrator(http_request).funnel.report(schema_id)
+    if report is None:
+        raise HTTPException(status_code=404, detail="No sessions seen for this schema")
+    return report
+
+
+@router.websocket("/{session_id}/ws")
+async def session_socket(websocket: WebSocket, session_id: str, turn: int | None = None) -> None:
+    await run_session_socket(
+        websocket,
+        session_id,
+        orchestrator=websocket.app.state.orchestrator,
+        store=websocket.app.state.store,
+        heartbeat_interval=settings.ws_heartbeat_seconds,
+        resume_turn=turn,
+    )
 
 
 @router.get("/{session_id}/status", response_model=StatusResponse)
@@ -48,6 +356,7 @@ async def get_status(session_id: str, http_request: Request) -> StatusResponse:
         raise HTTPException(status_code=404, detail="Session not found")
     return StatusResponse(
         current_data=session.current_data,
-        is_complete=is_complete(session.schema_, session.current_data),
-        missing_fields=get_missing_fields(session.schema_, session.current_data),
+        is_complete=is_complete(session.schema_, session_index(session)),
+        missing_fields=get_missing_fields(session.schema_, session_index(session)),
+        version=session.version,
     )
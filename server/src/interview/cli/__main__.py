@@ -2,9 +2,12 @@ from __future__ import annotations
 
 import argparse
 import logging
+from datetime import datetime
 from pathlib import Path
 
-from interview.cli.commands import cmd_evaluate, cmd_generate, cmd_optimize
+from interview.cli.commands import cmd_evaluate, cmd_export, cmd_generate, cmd_optimize
+from interview.engine.dspy_modules import MODULE_MODES
+from interview.export_arrow import DEFAULT_BATCH_SIZE
 
 
 def main() -> None:
@@ -36,6 +39,12 @@ def main() -> None:
     opt_parser.add_argument(
         "--examples", type=Path, required=True, help="Path to training dataset JSON"
     )
+    opt_parser.add_argument(
+        "--mode",
+        default="cot",
+        choices=list(MODULE_MODES),
+        help="Module mode: cot (ChainOfThought) or predict (default: cot)",
+    )
     opt_parser.add_argument(
         "--optimizer",
         default="miprov2",
@@ -73,6 +82,58 @@ def main() -> None:
         default=None,
         help="Path to optimized program (omit for baseline)",
     )
+    eval_parser.add_argument(
+        "--mode",
+        default="cot",
+        choices=list(MODULE_MODES),
+        help="Module mode: cot (ChainOfThought) or predict (default: cot)",
+    )
+    eval_parser.add_argument(
+        "--compare-modes",
+        action="store_true",
+        help="Compare all modes on score, latency and output tokens (ignores --program)",
+    )
+
+    # export
+    export_parser = subparsers.add_parser(
+        "export",
+        help="Write completed sessions as NDJSON, Parquet or Arrow with flattened dot-paths",
+    )
+    source = export_parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--db", type=Path, help="SQLite session database (SESSION_DB_PATH)")
+    source.add_argument("--event-log", type=Path, help="SQLite event log (SESSION_EVENT_LOG_PATH)")
+    export_parser.add_argument("--schema-id", default=None, help="Only sessions on this schema")
+    export_parser.add_argument(
+        "--since",
+        type=datetime.fromisoformat,
+        default=None,
+        help="Only sessions completed at or after this ISO time (UTC if no offset)",
+    )
+    export_parser.add_argument(
+        "--until",
+        type=datetime.fromisoformat,
+        default=None,
+        help="Only sessions completed before this ISO time (UTC if no offset)",
+    )
+    export_parser.add_argument(
+        "--cursor", default=None, help="Resume after the line with this cursor"
+    )
+    export_parser.add_argument("--limit", type=int, default=None, help="Max sessions to write")
+    export_parser.add_argument(
+        "--format",
+        choices=["ndjson", "parquet", "arrow"],
+        default="ndjson",
+        help="Output format; parquet and arrow (IPC file) need pyarrow, --schema-id and --output",
+    )
+    export_parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"Sessions per record batch for parquet/arrow (default: {DEFAULT_BATCH_SIZE})",
+    )
+    export_parser.add_argument(
+        "--output", type=Path, default=None, help="Output path (default: stdout for NDJSON)"
+    )
 
     args = parser.parse_args()
 
@@ -96,12 +157,28 @@ def main() -> None:
             max_demos=args.max_demos,
             num_trials=args.num_trials,
             eval_split=args.eval_split,
+            mode=args.mode,
         )
     elif args.command == "evaluate":
         cmd_evaluate(
             module_name=args.module,
             examples_path=args.examples,
             program_path=args.program,
+            mode=args.mode,
+            compare_modes=args.compare_modes,
+        )
+    elif args.command == "export":
+        cmd_export(
+            db_path=args.db,
+            event_log_path=args.event_log,
+            output_path=args.output,
+            schema_id=args.schema_id,
+            since=args.since,
+            until=args.until,
+            cursor=args.cursor,
+            limit=args.limit,
+            file_format=args.format,
+            batch_size=args.batch_size,
         )
 
 
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import json
 import logging
 import random
 import statistics
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 import dspy
 
@@ -17,20 +22,40 @@ from interview.cli.metrics import interview_step_metric, text_extractor_metric
 from interview.cli.programs import get_default_path, load_optimized, save_optimized
 from interview.cli.simulator import generate_training_data
 from interview.config import settings
-from interview.engine.dspy_modules import create_interview_step, create_text_extractor
+from interview.engine.dspy_modules import (
+    MODULE_MODES,
+    ModuleMode,
+    create_interview_step,
+    create_text_extractor,
+)
+from interview.export import export_ndjson
+from interview.export_arrow import DEFAULT_BATCH_SIZE, ArrowFormat, write_arrow
+from interview.session.events import EventSourcedSessionStore
+from interview.session.sqlite import SQLiteSessionStore
 
 logger = logging.getLogger(__name__)
 
 
-def _configure_dspy() -> None:
-    """Configure DSPy LM from application settings."""
+@dataclass(frozen=True)
+class EvalSample:
+    """Score and cost of running a program on one example."""
+
+    score: float
+    latency_s: float
+    output_tokens: int
+
+
+def _configure_dspy(cache: bool = True) -> dspy.LM:
+    """Configure DSPy LM from application settings. Returns the configured LM."""
     settings.validate_api_key()
-    lm = dspy.LM(settings.llm_model)
+    lm = dspy.LM(settings.llm_model, cache=cache)
     dspy.configure(lm=lm, adapter=dspy.JSONAdapter())
+    return lm
 
 
 def _get_module_config(
     module_name: str,
+    mode: str = "cot",
 ) -> tuple[
     dspy.Module,
     Any,
@@ -42,13 +67,13 @@ def _get_module_config(
     """
     if module_name == "interview_step":
         return (
-            create_interview_step(),
+            create_interview_step(mode),
             interview_step_metric,
             load_interview_step_examples,
         )
     if module_name == "text_extractor":
         return (
-            create_text_extractor(),
+            create_text_extractor(mode),
             text_extractor_metric,
             load_text_extractor_examples,
         )
@@ -81,11 +106,12 @@ def cmd_optimize(
     max_demos: int,
     num_trials: int,
     eval_split: float,
+    mode: str = "cot",
 ) -> None:
     """Run a DSPy optimizer on a module."""
     _configure_dspy()
 
-    program, metric_fn, loader_fn = _get_module_config(module_name)
+    program, metric_fn, loader_fn = _get_module_config(module_name, mode)
     examples = loader_fn(examples_path)
 
     if not examples:
@@ -98,7 +124,7 @@ def cmd_optimize(
     train_set = examples[:split_idx]
     eval_set = examples[split_idx:] if split_idx < len(examples) else examples[-1:]
 
-    print(f"Module: {module_name}")
+    print(f"Module: {module_name} ({mode})")
     print(f"Optimizer: {optimizer_name}")
     print(f"Examples: {len(examples)} total ({len(train_set)} train, {len(eval_set)} eval)")
     print(f"Max demos: {max_demos}, Num trials: {num_trials}")
@@ -131,7 +157,7 @@ def cmd_optimize(
 
     # Save
     if output_path is None:
-        output_path = get_default_path(module_name)
+        output_path = get_default_path(module_name, mode)
 
     save_optimized(optimized, output_path)
     print(f"\nOptimized program saved to: {output_path}")
@@ -146,11 +172,17 @@ def cmd_evaluate(
     module_name: str,
     examples_path: Path,
     program_path: Path | None,
+    mode: str = "cot",
+    compare_modes: bool = False,
 ) -> None:
     """Evaluate a saved optimized program on examples."""
+    if compare_modes:
+        _compare_modes(module_name, examples_path)
+        return
+
     _configure_dspy()
 
-    program, metric_fn, loader_fn = _get_module_config(module_name)
+    program, metric_fn, loader_fn = _get_module_config(module_name, mode)
     examples = loader_fn(examples_path)
 
     if not examples:
@@ -163,7 +195,7 @@ def cmd_evaluate(
     else:
         print("Evaluating unoptimized baseline")
 
-    print(f"Module: {module_name}")
+    print(f"Module: {module_name} ({mode})")
     print(f"Examples: {len(examples)}")
     print()
 
@@ -171,6 +203,166 @@ def cmd_evaluate(
     _print_scores(scores)
 
 
+def cmd_export(
+    db_path: Path | None,
+    event_log_path: Path | None,
+    output_path: Path | None,
+    schema_id: str | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    cursor: str | None = None,
+    limit: int | None = None,
+    file_format: Literal["ndjson"] | ArrowFormat = "ndjson",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> None:
+    """Write completed sessions from a session database as NDJSON, Parquet or Arrow IPC."""
+    store: SQLiteSessionStore | EventSourcedSessionStore
+    if event_log_path is not None:
+        store = EventSourcedSessionStore(event_log_path)
+    elif db_path is not None:
+        store = SQLiteSessionStore(db_path)
+    else:
+        print("Pass --db or --event-log", file=sys.stderr)
+        return
+
+    try:
+        if file_format == "ndjson":
+            count, resume = _write_ndjson(
+                store, output_path, schema_id, since, until, cursor, limit
+            )
+        elif schema_id is not None and output_path is not None:
+            result = write_arrow(
+                store,
+                output_path,
+                schema_id,
+                file_format,
+                since,
+                until,
+                cursor=cursor,
+                limit=limit,
+                batch_size=batch_size,
+            )
+            count, resume = result.rows, result.cursor
+            print(f"Wrote {result.batches} record batches to {output_path}", file=sys.stderr)
+        else:
+            print(f"--format {file_format} needs --schema-id and --output", file=sys.stderr)
+            return
+    finally:
+        store.close()
+
+    print(f"Exported {count} sessions", file=sys.stderr)
+    if resume is not None:
+        print(f"Resume with: --cursor {resume}", file=sys.stderr)
+
+
+def _write_ndjson(
+    store: SQLiteSessionStore | EventSourcedSessionStore,
+    output_path: Path | None,
+    schema_id: str | None,
+    since: datetime | None,
+    until: datetime | None,
+    cursor: str | None,
+    limit: int | None,
+) -> tuple[int, str | None]:
+    """Returns the number of lines written and the cursor to resume with."""
+    out = output_path.open("w") if output_path is not None else sys.stdout
+    count = 0
+    last = None
+    try:
+        for line in export_ndjson(store, schema_id, since, until, cursor=cursor, limit=limit):
+            out.write(line)
+            count += 1
+            last = line
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return count, json.loads(last)["cursor"] if last is not None else cursor
+
+
+def _compare_modes(module_name: str, examples_path: Path) -> None:
+    """Evaluate every module mode on the same examples and report score and cost.
+
+    Each mode uses its optimized artifact from the default path when present
+    and runs on the module's configured model, as it would in the server.
+    The LM cache is disabled so latency and token counts reflect real calls.
+    """
+    default_lm = _configure_dspy(cache=False)
+    model = settings.module_model(module_name)
+    lm = default_lm if model == settings.llm_model else dspy.LM(model, cache=False)
+
+    _, _, loader_fn = _get_module_config(module_name)
+    examples = loader_fn(examples_path)
+
+    if not examples:
+        print(f"No examples found for module '{module_name}' in {examples_path}")
+        return
+
+    print(f"Module: {module_name}")
+    print(f"Model: {model}")
+    print(f"Examples: {len(examples)}")
+
+    results: dict[ModuleMode, list[EvalSample]] = {}
+    for mode in MODULE_MODES:
+        program, metric_fn, _ = _get_module_config(module_name, mode)
+        path = get_default_path(module_name, mode)
+        if path.exists():
+            program = load_optimized(program, path)
+            print(f"\n[{mode}] optimized program from: {path}")
+        else:
+            print(f"\n[{mode}] unoptimized baseline")
+        program.set_lm(lm)
+        results[mode] = _measure_examples(program, examples, metric_fn, lm)
+
+    print()
+    print(f"  {'Mode':<10}{'Score':>8}{'Latency (s)':>14}{'Output tokens':>16}")
+    for mode, samples in results.items():
+        print(
+            f"  {mode:<10}"
+            f"{statistics.mean(s.score for s in samples):>8.3f}"
+            f"{statistics.mean(s.latency_s for s in samples):>14.2f}"
+            f"{statistics.mean(s.output_tokens for s in samples):>16.1f}"
+        )
+
+
+def _measure_examples(
+    program: dspy.Module,
+    examples: list[dspy.Example],
+    metric_fn: Any,
+    lm: dspy.LM,
+) -> list[EvalSample]:
+    """Like _evaluate_examples, but also records latency and output tokens per example."""
+    samples: list[EvalSample] = []
+    for i, example in enumerate(examples):
+        history_start = len(lm.history)
+        started = time.perf_counter()
+        try:
+            inputs = {k: example[k] for k in example.inputs()}
+            prediction = program(**inputs)
+            score = float(metric_fn(example, prediction))
+            print(f"  Example {i + 1}: {score:.3f}")
+        except Exception as e:
+            print(f"  Example {i + 1}: ERROR - {e}")
+            score = 0.0
+        latency = time.perf_counter() - started
+        samples.append(
+            EvalSample(
+                score=score,
+                latency_s=latency,
+                output_tokens=_count_output_tokens(lm.history[history_start:]),
+            )
+        )
+    return samples
+
+
+def _count_output_tokens(history: list[dict[str, Any]]) -> int:
+    """Sum completion tokens over DSPy LM history entries."""
+    total = 0
+    for entry in history:
+        usage = entry.get("usage") or {}
+        total += int(usage.get("completion_tokens") or 0)
+    return total
+
+
 def _evaluate_examples(
     program: dspy.Module,
     examples: list[dspy.Example],
@@ -5,9 +5,14 @@ from pathlib import Path
 import dspy
 
 
-def get_default_path(module_name: str) -> Path:
-    """Return default path: server/data/optimized/{module_name}.json"""
-    return Path(__file__).resolve().parents[3] / "data" / "optimized" / f"{module_name}.json"
+def get_default_path(module_name: str, mode: str = "cot") -> Path:
+    """Return default path: server/data/optimized/{module_name}.json
+
+    Non-default modes get their own artifact, e.g. {module_name}.predict.json,
+    since demos and instructions optimized for one mode don't transfer.
+    """
+    stem = module_name if mode == "cot" else f"{module_name}.{mode}"
+    return Path(__file__).resolve().parents[3] / "data" / "optimized" / f"{stem}.json"
 
 
 def save_optimized(program: dspy.Module, path: Path) -> None:
@@ -3,40 +3,126 @@ from __future__ import annotations
 import os
 
 
+def _provider_of(model: str) -> str:
+    """Extract provider from model string (e.g. 'anthropic' from 'anthropic/claude-...')."""
+    return model.split("/")[0] if "/" in model else "openai"
+
+
+def _optional_int(name: str) -> int | None:
+    value = os.environ.get(name)
+    return int(value) if value else None
+
+
+def _optional_float(name: str) -> float | None:
+    value = os.environ.get(name)
+    return float(value) if value else None
+
+
 class Settings:
     def __init__(self) -> None:
         self.llm_model: str = os.environ.get("LLM_MODEL", "anthropic/claude-sonnet-4-5-20250929")
+        # Per-module overrides; both fall back to LLM_MODEL
+        self.interview_step_model: str = os.environ.get("INTERVIEW_STEP_MODEL", self.llm_model)
+        self.text_extractor_model: str = os.environ.get("TEXT_EXTRACTOR_MODEL", self.llm_model)
+        # Optional small model tried first for text extraction (cascade disabled when unset)
+        self.text_extractor_fast_model: str | None = (
+            os.environ.get("TEXT_EXTRACTOR_FAST_MODEL") or None
+        )
+        # Module mode: "cot" (ChainOfThought) or "predict" (no reasoning tokens)
+        self.interview_step_mode: str = os.environ.get("INTERVIEW_STEP_MODE", "cot")
+        self.text_extractor_mode: str = os.environ.get("TEXT_EXTRACTOR_MODE", "cot")
         self.cors_origins: list[str] = os.environ.get(
             "CORS_ORIGINS", "http://localhost:5173"
         ).split(",")
         self.host: str = os.environ.get("HOST", "0.0.0.0")  # noqa: S104
         self.port: int = int(os.environ.get("PORT", "8000"))
+        # Directory of *.json schemas registered at startup (none when unset)
+        self.schema_dir: str | None = os.environ.get("SCHEMA_DIR") or None
+        # SQLite database file for sessions (in-memory store when unset)
+        self.session_db_path: str | None = os.environ.get("SESSION_DB_PATH") or None
+        # SQLite event log; when set, sessions are event-sourced from it
+        self.session_event_log_path: str | None = os.environ.get("SESSION_EVENT_LOG_PATH") or None
+        # Per-worker cache in front of the SQLite store (0 disables)
+        self.session_cache_size: int = int(os.environ.get("SESSION_CACHE_SIZE", "1024"))
+        # Seconds a cached session is served without checking its revision
+        self.session_cache_revalidate_seconds: float = float(
+            os.environ.get("SESSION_CACHE_REVALIDATE_SECONDS", "0")
+        )
+        # Prefix for new session ids, used as a sticky-routing hint
+        self.session_route_prefix: str | None = os.environ.get("SESSION_ROUTE_PREFIX") or None
+        # Session store limits; any of them set switches to the bounded store
+        self.session_max_count: int | None = _optional_int("SESSION_MAX_COUNT")
+        self.session_max_bytes: int | None = _optional_int("SESSION_MAX_BYTES")
+        self.session_idle_ttl_seconds: float | None = _optional_float("SESSION_IDLE_TTL_SECONDS")
+        self.session_sweep_seconds: float = float(os.environ.get("SESSION_SWEEP_SECONDS", "60"))
+        # Responses replayed for retried Idempotency-Key requests
+        self.idempotency_ttl_seconds: float = float(
+            os.environ.get("IDEMPOTENCY_TTL_SECONDS", "600")
+        )
+        self.idempotency_max_entries: int = int(os.environ.get("IDEMPOTENCY_MAX_ENTRIES", "10000"))
+        # Cap on array indexes in submitted bindings (schemas can set lower max_items)
+        self.max_array_items: int = int(os.environ.get("MAX_ARRAY_ITEMS", "1000"))
+        # Processes for batch prefill analysis (one per CPU when unset, 0 uses threads)
+        self.prefill_workers: int | None = _optional_int("PREFILL_WORKERS")
+        # Largest batch prefill body; it is spooled to a temporary file before analysis
+        self.prefill_max_body_bytes: int = int(
+            os.environ.get("PREFILL_MAX_BODY_BYTES", str(256 << 20))
+        )
+        self.ws_heartbeat_seconds: float = float(os.environ.get("WS_HEARTBEAT_SECONDS", "20"))
 
     @property
     def llm_provider(self) -> str:
         """Extract provider from model string (e.g. 'anthropic' from 'anthropic/claude-...')."""
-        return self.llm_model.split("/")[0] if "/" in self.llm_model else "openai"
+        return _provider_of(self.llm_model)
+
+    @property
+    def session_store_bounded(self) -> bool:
+        return any(
+            limit is not None
+            for limit in (
+                self.session_max_count,
+                self.session_max_bytes,
+                self.session_idle_ttl_seconds,
+            )
+        )
+
+    @property
+    def configured_models(self) -> list[str]:
+        """All distinct models in use, default model first."""
+        models = [self.llm_model, self.interview_step_model, self.text_extractor_model]
+        if self.text_extractor_fast_model:
+            models.append(self.text_extractor_fast_model)
+        return list(dict.fromkeys(models))
+
+    def module_model(self, module_name: str) -> str:
+        """The model a DSPy module runs on ("interview_step" or "text_extractor")."""
+        if module_name == "interview_step":
+            return self.interview_step_model
+        if module_name == "text_extractor":
+            return self.text_extractor_model
+        msg = f"Unknown module: {module_name}"
+        raise ValueError(msg)
 
     def validate_api_key(self) -> None:
-        """Validate that the required API key is set for the configured provider."""
-        provider = self.llm_provider
+        """Validate that the required API key is set for every configured provider."""
         key_map: dict[str, str] = {
             "anthropic": "ANTHROPIC_API_KEY",
             "openai": "OPENAI_API_KEY",
         }
-        env_var = key_map.get(provider)
-        if env_var and not os.environ.get(env_var):
-            msg = (
-                f"{env_var} environment variable is required "
-                f"for provider '{provider}'. "
-                f"Set it before starting the server, or change "
-                f"LLM_MODEL to use a different provider.\n"
-                f"Supported: anthropic (default), openai\n"
-                f"Examples:\n"
-                f"  LLM_MODEL=anthropic/claude-sonnet-4-5-20250929\n"
-                f"  LLM_MODEL=openai/gpt-4o"
-            )
-            raise RuntimeError(msg)
+        for provider in dict.fromkeys(_provider_of(m) for m in self.configured_models):
+            env_var = key_map.get(provider)
+            if env_var and not os.environ.get(env_var):
+                msg = (
+                    f"{env_var} environment variable is required "
+                    f"for provider '{provider}'. "
+                    f"Set it before starting the server, or change "
+                    f"LLM_MODEL to use a different provider.\n"
+                    f"Supported: anthropic (default), openai\n"
+                    f"Examples:\n"
+                    f"  LLM_MODEL=anthropic/claude-sonnet-4-5-20250929\n"
+                    f"  LLM_MODEL=openai/gpt-4o"
+                )
+                raise RuntimeError(msg)
 
 
 settings = Settings()
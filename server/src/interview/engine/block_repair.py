@@ -0,0 +1,281 @@
+from __future__ import annotations
+
+import difflib
+from typing import TYPE_CHECKING, Any
+
+from interview.engine.conditions import _resolve_path
+from interview.engine.validator import validate_field
+from interview.models.schema import FieldSchema
+from interview.models.ui_blocks import (
+    ArrayElement,
+    CheckboxElement,
+    FormBlock,
+    InputElement,
+    RadioElement,
+    SelectElement,
+    TextareaElement,
+    TextBlock,
+    UIBlock,
+)
+
+if TYPE_CHECKING:
+    from collections import Counter
+
+# Repair kinds, in the order they are applied to an element
+BINDING_CASE = "binding_case"
+BINDING_NEAREST = "binding_nearest"
+BINDING_DROPPED = "binding_dropped"
+DUPLICATE_DROPPED = "duplicate_dropped"
+COLLECTED_DROPPED = "collected_dropped"
+KIND_FIXED = "kind_fixed"
+OPTIONS_INJECTED = "options_injected"
+EMPTY_FORM_DROPPED = "empty_form_dropped"
+FALLBACK_FORM = "fallback_form"
+TEXT_INSERTED = "text_inserted"
+
+REPAIR_KINDS = (
+    BINDING_CASE,
+    BINDING_NEAREST,
+    BINDING_DROPPED,
+    DUPLICATE_DROPPED,
+    COLLECTED_DROPPED,
+    KIND_FIXED,
+    OPTIONS_INJECTED,
+    EMPTY_FORM_DROPPED,
+    FALLBACK_FORM,
+    TEXT_INSERTED,
+)
+
+# Enums with more options than this render as a select instead of radio buttons
+MAX_RADIO_OPTIONS = 4
+# Fields asked in a fallback form when the LLM's own form was repaired away
+FALLBACK_FIELD_COUNT = 5
+# Minimum difflib ratio for a misspelled binding to be mapped to a schema path
+NEAREST_CUTOFF = 0.8
+
+_ItemElement = InputElement | SelectElement | RadioElement | CheckboxElement | TextareaElement
+_Element = _ItemElement | ArrayElement
+
+
+def repair_blocks(
+    blocks: list[UIBlock],
+    flat_schema: dict[str, FieldSchema],
+    current_data: dict[str, Any],
+    missing: list[str],
+    counts: Counter[str],
+) -> list[UIBlock]:
+    """Fix LLM-generated UI blocks against the schema instead of re-asking.
+
+    Bindings are resolved exactly, case-insensitively, or to the nearest
+    schema path; enum options come from the schema; element kinds are made
+    to match the field type; fields that are already collected and valid
+    are dropped. If nothing askable remains but fields are still missing,
+    a form for the next missing fields is built from the schema, and a
+    TextBlock is prepended when the response doesn't start with one.
+    Each repair increments ``counts[<repair kind>]``.
+    """
+    lookup = _BindingLookup(flat_schema)
+    seen: set[str] = set()
+    repaired: list[UIBlock] = []
+
+    for block in blocks:
+        if not isinstance(block, FormBlock):
+            repaired.append(block)
+            continue
+        elements: list[_Element] = []
+        for element in block.elements:
+            fixed = _repair_element(element, lookup, current_data, seen, counts)
+            if fixed is not None:
+                elements.append(fixed)
+        if elements:
+            repaired.append(FormBlock(elements=elements))
+        else:
+            counts[EMPTY_FORM_DROPPED] += 1
+
+    if missing and not any(isinstance(b, FormBlock) for b in repaired):
+        fallback = [
+            element_for_field(path, flat_schema[path])
+            for path in missing[:FALLBACK_FIELD_COUNT]
+            if path in flat_schema
+        ]
+        if fallback:
+            counts[FALLBACK_FORM] += 1
+            repaired.append(FormBlock(elements=fallback))
+
+    if not repaired or not isinstance(repaired[0], TextBlock):
+        counts[TEXT_INSERTED] += 1
+        repaired.insert(0, TextBlock(value="Let's continue with a few more details."))
+    return repaired
+
+
+def element_for_field(binding: str, field: FieldSchema) -> _Element:
+    """Build the canonical form element for a schema field."""
+    label = field.label or binding.split(".")[-1].replace("_", " ").title()
+    if field.type == "enum":
+        if len(field.options) <= MAX_RADIO_OPTIONS:
+            return RadioElement(label=label, binding=binding, options=list(field.options))
+        return SelectElement(label=label, binding=binding, options=list(field.options))
+    if field.type == "boolean":
+        return CheckboxElement(label=label, binding=binding)
+    if field.type == "text":
+        return TextareaElement(label=label, binding=binding)
+    if field.type in ("integer", "float", "date"):
+        return InputElement(type=field.type, label=label, binding=binding)
+    if field.type == "array" and field.item_schema is not None:
+        items = field.item_schema.fields if field.item_schema.type == "object" else {}
+        return ArrayElement(
+            label=label,
+            binding=binding,
+            item_elements=[
+                _item_element_for_field(name, item_field) for name, item_field in items.items()
+            ],
+        )
+    return InputElement(type="text", label=label, binding=binding)
+
+
+def _item_element_for_field(binding: str, field: FieldSchema) -> _ItemElement:
+    element = element_for_field(binding, field)
+    if isinstance(element, ArrayElement):
+        # Nested arrays aren't renderable inside an array item
+        return InputElement(type="text", label=element.label, binding=binding)
+    return element
+
+
+class _BindingLookup:
+    """Resolve possibly-wrong bindings to schema paths."""
+
+    def __init__(self, fields: dict[str, FieldSchema]) -> None:
+        self.fields = fields
+        self._lower = {path.lower(): path for path in fields}
+        self._paths = list(fields)
+
+    def resolve(self, binding: str, counts: Counter[str]) -> str | None:
+        if binding in self.fields:
+            return binding
+        by_case = self._lower.get(binding.lower())
+        if by_case is not None:
+            counts[BINDING_CASE] += 1
+            return by_case
+        nearest = difflib.get_close_matches(binding, self._paths, n=1, cutoff=NEAREST_CUTOFF)
+        if nearest:
+            counts[BINDING_NEAREST] += 1
+            return nearest[0]
+        # Unique leaf-name match, e.g. "age" for "personal.age"
+        leaf = binding.rsplit(".", 1)[-1].lower()
+        candidates = [p for p in self._paths if p.rsplit(".", 1)[-1].lower() == leaf]
+        if len(candidates) == 1:
+            counts[BINDING_NEAREST] += 1
+            return candidates[0]
+        counts[BINDING_DROPPED] += 1
+        return None
+
+
+def _repair_element(
+    element: _Element,
+    lookup: _BindingLookup,
+    current_data: dict[str, Any],
+    seen: set[str],
+    counts: Counter[str],
+) -> _Element | None:
+    path = lookup.resolve(element.binding, counts)
+    if path is None:
+        return None
+    if path in seen:
+        counts[DUPLICATE_DROPPED] += 1
+        return None
+    seen.add(path)
+
+    field = lookup.fields[path]
+    if _is_collected(current_data, path, field):
+        counts[COLLECTED_DROPPED] += 1
+        return None
+
+    if isinstance(element, ArrayElement):
+        return _repair_array(element, path, field, counts)
+    return _fix_kind_and_options(element, path, field, counts)
+
+
+def _repair_array(
+    element: ArrayElement,
+    path: str,
+    field: FieldSchema,
+    counts: Counter[str],
+) -> _Element:
+    if field.type != "array":
+        counts[KIND_FIXED] += 1
+        return element_for_field(path, field)
+    item_fields = (
+        field.item_schema.fields
+        if field.item_schema is not None and field.item_schema.type == "object"
+        else {}
+    )
+    if not item_fields:
+        return element.model_copy(update={"binding": path})
+
+    lookup = _BindingLookup(item_fields)
+    seen: set[str] = set()
+    items: list[_ItemElement] = []
+    for item in element.item_elements:
+        item_path = lookup.resolve(item.binding, counts)
+        if item_path is None:
+            continue
+        if item_path in seen:
+            counts[DUPLICATE_DROPPED] += 1
+            continue
+        seen.add(item_path)
+        fixed = _fix_kind_and_options(item, item_path, item_fields[item_path], counts)
+        if isinstance(fixed, ArrayElement):
+            fixed = _item_element_for_field(item_path, item_fields[item_path])
+        items.append(fixed)
+    if not items:
+        counts[KIND_FIXED] += 1
+        return element_for_field(path, field)
+    return element.model_copy(update={"binding": path, "item_elements": items})
+
+
+def _fix_kind_and_options(
+    element: _ItemElement,
+    path: str,
+    field: FieldSchema,
+    counts: Counter[str],
+) -> _Element:
+    if not _kind_matches(element, field):
+        counts[KIND_FIXED] += 1
+        fixed = element_for_field(path, field)
+        # Keep the LLM's conversational label when it had one
+        return fixed.model_copy(update={"label": element.label}) if element.label else fixed
+
+    updates: dict[str, Any] = {}
+    if element.binding != path:
+        updates["binding"] = path
+    if isinstance(element, (SelectElement, RadioElement)) and field.options:
+        allowed = {o.value for o in field.options}
+        if not element.options or any(o.value not in allowed for o in element.options):
+            counts[OPTIONS_INJECTED] += 1
+            updates["options"] = list(field.options)
+    return element.model_copy(update=updates) if updates else element
+
+
+def _kind_matches(element: _ItemElement, field: FieldSchema) -> bool:
+    ftype = field.type
+    if ftype == "enum":
+        if isinstance(element, RadioElement):
+            return len(field.options) <= MAX_RADIO_OPTIONS
+        return isinstance(element, SelectElement)
+    if ftype == "boolean":
+        return isinstance(element, CheckboxElement)
+    if ftype == "array":
+        return False
+    if ftype in ("integer", "float", "date"):
+        return isinstance(element, InputElement) and element.type == ftype
+    # string / text / object
+    if isinstance(element, TextareaElement):
+        return True
+    return isinstance(element, InputElement) and element.type in ("text", "email", "phone")
+
+
+def _is_collected(current_data: dict[str, Any], path: str, field: FieldSchema) -> bool:
+    found, value = _resolve_path(current_data, path)
+    if not found or value is None or value == "" or value == []:
+        return False
+    return not validate_field(value, field)
@@ -0,0 +1,299 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from interview.engine.conditions import condition_holds
+from interview.engine.data_index import MISSING
+from interview.engine.merge import path_parts
+from interview.engine.validator import _check_rule, _pattern, validate_field
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence, Sized
+
+    from interview.models.schema import Condition, FieldSchema, InterviewSchema, ValidationRule
+
+try:  # numpy is optional; without it the masks are computed cell by cell
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None  # type: ignore[assignment]
+
+# float64 holds integers exactly up to here; larger ones are re-checked in Python
+_EXACT_INT = 2**53
+
+
+class ColumnarResult:
+    """Error masks from `validate_columns`: `masks[path][i]` is True when record
+    i has an invalid value at `path`, `missing[path][i]` when it lacks a
+    required one.
+
+    Masks are numpy bool arrays, or lists of bools without numpy. Messages
+    are only built on request, for the flagged cells. `has_items[i]` is
+    True when record i has array items, which the masks don't cover.
+    """
+
+    __slots__ = ("columns", "fields", "has_items", "masks", "missing", "size")
+
+    def __init__(
+        self,
+        size: int,
+        fields: dict[str, FieldSchema],
+        columns: dict[str, list[Any]],
+        masks: dict[str, Sequence[bool]],
+        missing: dict[str, Sequence[bool]],
+        has_items: Sequence[bool],
+    ) -> None:
+        self.size = size
+        self.fields = fields
+        self.columns = columns
+        self.masks = masks
+        self.missing = missing
+        self.has_items = has_items
+
+    def invalid_counts(self) -> dict[str, int]:
+        """Number of invalid records per path."""
+        return {path: int(sum(mask)) for path, mask in self.masks.items()}
+
+    def record_errors(self, index: int) -> dict[str, list[str]]:
+        """The messages `get_invalid_fields` gives for record `index`'s flagged paths."""
+        return {
+            path: validate_field(self.columns[path][index], self.fields[path])
+            for path, mask in self.masks.items()
+            if mask[index]
+        }
+
+    def record_missing(self, index: int) -> list[str]:
+        """What `get_missing_fields` gives for record `index`, outside array items."""
+        return [path for path, mask in self.missing.items() if mask[index]]
+
+
+def columns(records: Sequence[Any], paths: list[str]) -> dict[str, list[Any]]:
+    """One column per binding path; `MISSING` where a record has no value.
+
+    Columns are built a path segment at a time and shared prefixes are
+    walked once, so `a.b` and `a.c` both narrow the same `a` column.
+    """
+    cache: dict[tuple[str | int, ...], list[Any]] = {(): list(records)}
+    return {path: _column(path_parts(path), cache) for path in paths}
+
+
+def _column(
+    parts: tuple[str | int, ...], cache: dict[tuple[str | int, ...], list[Any]]
+) -> list[Any]:
+    column = cache.get(parts)
+    if column is None:
+        parent = _column(parts[:-1], cache)
+        key = parts[-1]
+        if isinstance(key, int):
+            column = [v[key] if isinstance(v, list) and key < len(v) else MISSING for v in parent]
+        else:
+            column = [v.get(key, MISSING) if isinstance(v, dict) else MISSING for v in parent]
+        cache[parts] = column
+    return column
+
+
+def validate_columns(schema: InterviewSchema, records: Sequence[Any]) -> ColumnarResult:
+    """Validate many records at once, one schema path at a time.
+
+    Matches `get_invalid_fields` and `get_missing_fields` on every non-item
+    path: a field is checked when its conditions (and its parents') hold and
+    it has a value, and reported missing when they hold and it is required
+    but empty. Array items are not expanded; an array field's own rules are
+    checked, and `has_items` flags the records with items to analyse on
+    their own. With numpy, `min`/`max` and length rules are vectorised
+    comparisons, and `pattern` and `one_of` run once per distinct value.
+    """
+    leaves: list[tuple[str, FieldSchema, list[Condition]]] = []
+    _collect_leaves(schema.fields, "", [], leaves)
+    item_arrays = [
+        path
+        for path, field, _ in leaves
+        if field.type == "array" and field.item_schema and field.item_schema.type == "object"
+    ]
+    leaves = [leaf for leaf in leaves if leaf[1].validation]
+    condition_paths = {c.field for _, _, conds in leaves for c in conds}
+    paths = list(dict.fromkeys([p for p, _, _ in leaves] + item_arrays + sorted(condition_paths)))
+    data = columns(records, paths)
+    size = len(records)
+
+    condition_masks: dict[int, Any] = {}
+    masks: dict[str, Sequence[bool]] = {}
+    missing: dict[str, Sequence[bool]] = {}
+    for path, field, conditions in leaves:
+        active = _all_true(size)
+        for condition in conditions:
+            mask = condition_masks.get(id(condition))
+            if mask is None:
+                mask = _condition_mask(condition, data[condition.field])
+                condition_masks[id(condition)] = mask
+            active = _and(active, mask)
+        masks[path] = _field_mask(field, data[path], active)
+        if any(rule.type == "required" for rule in field.validation):
+            missing[path] = _and(active, _flags(data[path], _is_empty))
+    has_items = _all_false(size)
+    for path in item_arrays:
+        has_items = _or(has_items, _flags(data[path], _has_items))
+    return ColumnarResult(size, {p: f for p, f, _ in leaves}, data, masks, missing, has_items)
+
+
+def _collect_leaves(
+    fields: dict[str, FieldSchema],
+    prefix: str,
+    conditions: list[Condition],
+    out: list[tuple[str, FieldSchema, list[Condition]]],
+) -> None:
+    for name, field in fields.items():
+        path = f"{prefix}.{name}" if prefix else name
+        scoped = conditions + field.conditions
+        if field.type == "object" and field.fields:
+            _collect_leaves(field.fields, path, scoped, out)
+        else:
+            out.append((path, field, scoped))
+
+
+def _is_checked(value: Any) -> bool:
+    return value is not MISSING and value is not None and value != ""
+
+
+def _is_empty(value: Any) -> bool:
+    return value is MISSING or value is None or value == "" or value == []
+
+
+def _has_items(value: Any) -> bool:
+    return isinstance(value, list) and len(value) > 0
+
+
+class _Column:
+    """A column plus the numeric and length views rules share, built on first use."""
+
+    __slots__ = ("_lengths", "_numbers", "values")
+
+    def __init__(self, values: list[Any]) -> None:
+        self.values = values
+        self._numbers: Any = None
+        self._lengths: dict[type[Sized], Any] = {}
+
+    def numbers(self) -> Any:
+        """float64 view; NaN where the value isn't a number."""
+        if self._numbers is None:
+            self._numbers = np.fromiter(
+                (v if isinstance(v, (int, float)) else np.nan for v in self.values),
+                dtype=np.float64,
+                count=len(self.values),
+            )
+        return self._numbers
+
+    def lengths(self, kind: type[Sized]) -> Any:
+        """len() of values of type `kind`; -1 elsewhere."""
+        lengths = self._lengths.get(kind)
+        if lengths is None:
+            lengths = np.fromiter(
+                (len(v) if isinstance(v, kind) else -1 for v in self.values),
+                dtype=np.int64,
+                count=len(self.values),
+            )
+            self._lengths[kind] = lengths
+        return lengths
+
+
+def _field_mask(field: FieldSchema, values: list[Any], active: Any) -> Sequence[bool]:
+    if np is None:
+        return [
+            bool(on) and _is_checked(value) and bool(validate_field(value, field))
+            for value, on in zip(values, active, strict=True)
+        ]
+    column = _Column(values)
+    invalid = np.zeros(len(values), dtype=bool)
+    for rule in field.validation:
+        invalid |= _rule_mask(rule, column)
+    checked = np.fromiter(
+        (v is not MISSING and v is not None and v != "" for v in values),
+        dtype=bool,
+        count=len(values),
+    )
+    return invalid & checked & active  # type: ignore[no-any-return]
+
+
+def _rule_mask(rule: ValidationRule, column: _Column) -> Any:
+    """Cells failing `rule`, before the presence and condition checks."""
+    values = column.values
+    param = rule.param
+    if rule.type == "required":
+        # Absent, None and "" are excluded later; only an empty list is left
+        return np.fromiter((v == [] for v in values), dtype=bool, count=len(values))
+    if rule.type in ("min", "max") and param is not None:
+        numbers = column.numbers()
+        with np.errstate(invalid="ignore"):
+            mask = numbers < param if rule.type == "min" else numbers > param
+            # Integers beyond float64 precision are compared exactly instead
+            inexact = np.flatnonzero(np.abs(numbers) > _EXACT_INT)
+        for i in inexact:
+            mask[i] = _check_rule(values[i], rule) is not None
+        return mask
+    if rule.type in ("min_length", "max_length", "max_items") and param is not None:
+        lengths = column.lengths(list if rule.type == "max_items" else str)
+        if rule.type == "min_length":
+            return (lengths >= 0) & (lengths < param)
+        return lengths > param
+    if rule.type == "pattern" and param is not None:
+        pattern = _pattern(param)
+        return _by_value(values, lambda v: isinstance(v, str) and not pattern.search(v))
+    if rule.type == "one_of":
+        allowed = param or []
+        return _by_value(values, lambda v: v not in allowed)
+    return np.fromiter(
+        (_check_rule(v, rule) is not None for v in values), dtype=bool, count=len(values)
+    )
+
+
+def _condition_mask(condition: Condition, column: list[Any]) -> Any:
+    def holds(value: Any) -> bool:
+        return condition_holds(condition, value is not MISSING, None if value is MISSING else value)
+
+    if np is None:
+        return [holds(value) for value in column]
+    return _by_value(column, holds)
+
+
+def _by_value(column: list[Any], test: Callable[[Any], bool]) -> Any:
+    """`test` over a column, run once per distinct value (per cell if unhashable)."""
+    index: dict[Any, int] = {}
+    codes = np.empty(len(column), dtype=np.int64)
+    unhashable: list[int] = []
+    for i, value in enumerate(column):
+        try:
+            codes[i] = index.setdefault(value, len(index))
+        except TypeError:
+            codes[i] = -1
+            unhashable.append(i)
+    # Equal values (1, 1.0, True) share a code; every rule treats them alike
+    results = np.fromiter((test(v) for v in index), dtype=bool, count=len(index))
+    mask = np.append(results, False)[codes]
+    for i in unhashable:
+        mask[i] = test(column[i])
+    return mask
+
+
+def _flags(column: list[Any], test: Callable[[Any], bool]) -> Any:
+    if np is None:
+        return [test(value) for value in column]
+    return np.fromiter((test(value) for value in column), dtype=bool, count=len(column))
+
+
+def _all_true(size: int) -> Any:
+    return [True] * size if np is None else np.ones(size, dtype=bool)
+
+
+def _all_false(size: int) -> Any:
+    return [False] * size if np is None else np.zeros(size, dtype=bool)
+
+
+def _and(left: Any, right: Any) -> Any:
+    if np is None:
+        return [a and b for a, b in zip(left, right, strict=True)]
+    return left & right
+
+
+def _or(left: Any, right: Any) -> Any:
+    if np is None:
+        return [a or b for a, b in zip(left, right, strict=True)]
+    return left | right
@@ -2,26 +2,44 @@ from __future__ import annotations
 
 from typing import Any
 
+from interview.engine.data_index import DataIndex, StagedIndex
+from interview.engine.merge import path_parts
 from interview.models.schema import Condition, FieldSchema, InterviewSchema
 
+# Nested data, or a flat index over it (see engine.data_index)
+DataView = dict[str, Any] | DataIndex | StagedIndex
+
 
 def _resolve_path(data: dict[str, Any], path: str) -> tuple[bool, Any]:
-    """Walk a dot-notation path through nested dicts/lists.
+    """Walk a binding path ('a.b[0].c') through nested dicts/lists.
 
     Returns (found, value).  `found=False` means the path didn't exist.
     """
-    parts = path.split(".")
     current: Any = data
-    for part in parts:
-        if isinstance(current, dict) and part in current:
-            current = current[part]
-        else:
+    for part in path_parts(path):
+        if isinstance(part, int):
+            if not isinstance(current, list) or part >= len(current):
+                return False, None
+        elif not isinstance(current, dict) or part not in current:
             return False, None
+        current = current[part]
     return True, current
 
 
-def evaluate_condition(condition: Condition, data: dict[str, Any]) -> bool:
-    found, value = _resolve_path(data, condition.field)
+def lookup(data: DataView, path: str) -> tuple[bool, Any]:
+    """(found, value) at `path`: O(1) from an index, a walk over plain data."""
+    if isinstance(data, DataIndex | StagedIndex):
+        return data.lookup(path)
+    return _resolve_path(data, path)
+
+
+def evaluate_condition(condition: Condition, data: DataView) -> bool:
+    found, value = lookup(data, condition.field)
+    return condition_holds(condition, found, value)
+
+
+def condition_holds(condition: Condition, found: bool, value: Any) -> bool:
+    """Whether `condition` passes when its field resolved to (found, value)."""
     op = condition.op
     expected = condition.value
 
@@ -53,14 +71,14 @@ def evaluate_condition(condition: Condition, data: dict[str, Any]) -> bool:
     return False
 
 
-def evaluate_conditions(conditions: list[Condition], data: dict[str, Any]) -> bool:
+def evaluate_conditions(conditions: list[Condition], data: DataView) -> bool:
     """AND logic: all conditions must pass.  Empty list → True."""
     return all(evaluate_condition(c, data) for c in conditions)
 
 
 def _collect_active_fields(
     fields: dict[str, FieldSchema],
-    data: dict[str, Any],
+    data: DataView,
     prefix: str,
     out: dict[str, FieldSchema],
 ) -> None:
@@ -76,14 +94,14 @@ def _collect_active_fields(
             out[path] = field
 
             if field.type == "array" and field.item_schema and field.item_schema.type == "object":
-                found, arr = _resolve_path(data, path)
+                found, arr = lookup(data, path)
                 if found and isinstance(arr, list):
                     for i in range(len(arr)):
                         item_prefix = f"{path}[{i}]"
                         _collect_active_fields(field.item_schema.fields, data, item_prefix, out)
 
 
-def get_active_fields(schema: InterviewSchema, data: dict[str, Any]) -> dict[str, FieldSchema]:
+def get_active_fields(schema: InterviewSchema, data: DataView) -> dict[str, FieldSchema]:
     out: dict[str, FieldSchema] = {}
     _collect_active_fields(schema.fields, data, "", out)
     return out
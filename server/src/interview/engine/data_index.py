@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from interview.models.session import Session
+
+# Marks an absent value; distinct from None, which is a stored value
+MISSING: Any = object()
+
+
+def child_path(prefix: str, key: str | int) -> str:
+    """The binding path of `key` under `prefix`: 'a.b' for keys, 'a[0]' for indexes."""
+    if isinstance(key, int):
+        return f"{prefix}[{key}]"
+    return f"{prefix}.{key}" if prefix else key
+
+
+def flatten_data(value: Any, prefix: str = "", out: dict[str, Any] | None = None) -> dict[str, Any]:
+    """Map every path under `value` to its value, containers included.
+
+    `{"a": {"b": [1]}}` becomes `{"a": {...}, "a.b": [1], "a.b[0]": 1}`.
+    """
+    if out is None:
+        out = {}
+    if isinstance(value, dict):
+        children: Any = value.items()
+    elif isinstance(value, list):
+        children = enumerate(value)
+    else:
+        return out
+    for key, child in children:
+        path = child_path(prefix, key)
+        out[path] = child
+        flatten_data(child, path, out)
+    return out
+
+
+class DataIndex:
+    """Flat `path -> value` view of a nested data dict.
+
+    Built once from the data, then kept in step by `MergeTransaction`
+    (through a `StagedIndex`), so analysis code reads any binding path in
+    O(1) instead of walking the nested structure. Changes made to the data
+    any other way are not seen; `session_index` rebuilds the index when a
+    session's data is replaced by anything but a committed merge.
+    """
+
+    __slots__ = ("data", "values")
+
+    def __init__(self, data: dict[str, Any]) -> None:
+        self.data = data
+        self.values = flatten_data(data)
+
+    def lookup(self, path: str) -> tuple[bool, Any]:
+        """Returns (found, value), like `conditions._resolve_path`."""
+        value = self.values.get(path, MISSING)
+        if value is MISSING:
+            return False, None
+        return True, value
+
+    def assign(self, path: str, old: Any, new: Any) -> None:
+        """Record that the value at `path` changed from `old` to `new`.
+
+        Pass `MISSING` as `old` or `new` for a path that was or becomes
+        absent. Costs the size of the two subtrees.
+        """
+        if old is not MISSING:
+            self.values.pop(path, None)
+            for stale in flatten_data(old, path):
+                self.values.pop(stale, None)
+        if new is not MISSING:
+            self.values[path] = new
+            flatten_data(new, path, self.values)
+
+
+# Marks a path with no staged change in StagedIndex.changes
+_UNSTAGED: Any = object()
+
+
+class StagedIndex:
+    """A `DataIndex` plus changes held aside until `commit`.
+
+    Lookups see the staged changes first, then the base index; the base is
+    untouched until `commit`, so readers of it never see a merge that may
+    still be rolled back.
+    """
+
+    __slots__ = ("base", "changes")
+
+    def __init__(self, base: DataIndex) -> None:
+        self.base = base
+        # path -> staged value, or MISSING for a path staged as absent
+        self.changes: dict[str, Any] = {}
+
+    def lookup(self, path: str) -> tuple[bool, Any]:
+        value = self.changes.get(path, _UNSTAGED)
+        if value is _UNSTAGED:
+            return self.base.lookup(path)
+        if value is MISSING:
+            return False, None
+        return True, value
+
+    def assign(self, path: str, old: Any, new: Any) -> None:
+        """Stage a change of the value at `path`, as `DataIndex.assign` records one."""
+        if old is not MISSING:
+            self.changes[path] = MISSING
+            for stale in flatten_data(old, path):
+                self.changes[stale] = MISSING
+        if new is not MISSING:
+            self.changes[path] = new
+            flatten_data(new, path, self.changes)
+
+    def replace(self, path: str, value: Any) -> None:
+        """Stage a copy of the container at `path`; its children are unchanged."""
+        self.changes[path] = value
+
+    def commit(self, data: dict[str, Any]) -> DataIndex:
+        """Apply the staged changes to the base, which now indexes `data`."""
+        values = self.base.values
+        for path, value in self.changes.items():
+            if value is MISSING:
+                values.pop(path, None)
+            else:
+                values[path] = value
+        self.base.data = data
+        self.changes = {}
+        return self.base
+
+    def discard(self) -> None:
+        self.changes = {}
+
+
+def session_index(session: Session) -> DataIndex:
+    """The session's index, rebuilt if its data was replaced since it was built."""
+    index = session._data_index
+    if not isinstance(index, DataIndex) or index.data is not session.current_data:
+        index = DataIndex(session.current_data)
+        session._data_index = index
+    return index
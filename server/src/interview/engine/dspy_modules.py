@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Literal
 
 import dspy
 from pydantic import BaseModel
@@ -76,9 +76,23 @@ class TextDataExtractor(dspy.Signature):  # type: ignore[misc]
     response: ExtractedData = dspy.OutputField()
 
 
-def create_interview_step() -> dspy.Module:
-    return dspy.ChainOfThought(InterviewStep)
+# "cot" reasons before answering; "predict" answers directly and emits fewer tokens
+ModuleMode = Literal["cot", "predict"]
+MODULE_MODES: tuple[ModuleMode, ...] = ("cot", "predict")
 
 
-def create_text_extractor() -> dspy.Module:
-    return dspy.ChainOfThought(TextDataExtractor)
+def _wrap(signature: type[dspy.Signature], mode: str) -> dspy.Module:
+    if mode == "cot":
+        return dspy.ChainOfThought(signature)
+    if mode == "predict":
+        return dspy.Predict(signature)
+    msg = f"Unknown module mode: {mode}. Must be 'cot' or 'predict'."
+    raise ValueError(msg)
+
+
+def create_interview_step(mode: str = "cot") -> dspy.Module:
+    return _wrap(InterviewStep, mode)
+
+
+def create_text_extractor(mode: str = "cot") -> dspy.Module:
+    return _wrap(TextDataExtractor, mode)
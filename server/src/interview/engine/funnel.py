@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import threading
+from collections import Counter
+from typing import TYPE_CHECKING
+
+from interview.engine.schema_analyzer import compile_schema
+from interview.engine.schema_registry import schema_fingerprint
+from interview.models.api import FieldFunnelCounts, FunnelResponse
+from interview.models.ui_blocks import FormBlock
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from interview.models.session import Session
+    from interview.models.ui_blocks import UIBlock
+
+# Field stages, counted per schema path
+ASKED = "asked"
+ANSWERED = "answered"
+INVALID = "invalid"
+EXTRACTED = "extracted"
+FIELD_STAGES = (ASKED, ANSWERED, INVALID, EXTRACTED)
+
+# Session stages, counted per schema
+STARTED = "started"
+COMPLETED = "completed"
+
+
+class _SchemaFunnel:
+    __slots__ = ("fields", "sessions")
+
+    def __init__(self, paths: Iterable[str]) -> None:
+        # Every schema path is present from the start, so untouched fields report zeros
+        self.fields: dict[str, Counter[str]] = {path: Counter() for path in paths}
+        self.sessions: Counter[str] = Counter()
+
+
+class FieldFunnel:
+    """Running counts of how often each schema field is asked, answered,
+    fails validation, or is filled from a text message, per schema.
+
+    The orchestrator updates it as turns happen, so a report costs
+    O(fields) and never reads sessions. Binding paths are counted against
+    their schema path (`children[2].name` counts for `children`); paths the
+    schema doesn't define are ignored, so memory is bounded by the schemas.
+    Counts are per process and start from zero.
+    """
+
+    def __init__(self) -> None:
+        self._schemas: dict[str, _SchemaFunnel] = {}
+        self._lock = threading.Lock()
+
+    def session_started(self, session: Session) -> None:
+        self._count_session(session, STARTED)
+
+    def session_completed(self, session: Session) -> None:
+        self._count_session(session, COMPLETED)
+
+    def asked(self, session: Session, blocks: Iterable[UIBlock]) -> None:
+        """Count the fields a generated step's forms ask for."""
+        paths = [
+            element.binding
+            for block in blocks
+            if isinstance(block, FormBlock)
+            for element in block.elements
+        ]
+        self.record(session, ASKED, paths)
+
+    def record(self, session: Session, stage: str, paths: Iterable[str]) -> None:
+        """Count `stage` once for each distinct schema field among `paths`."""
+        funnel = self._funnel(session)
+        fields = {_field_path(path) for path in paths}
+        with self._lock:
+            for path in fields:
+                counts = funnel.fields.get(path)
+                if counts is not None:
+                    counts[stage] += 1
+
+    def report(self, schema_id: str) -> FunnelResponse | None:
+        """Counts for one schema, or None if no session on it has been seen."""
+        with self._lock:
+            funnel = self._schemas.get(schema_id)
+            if funnel is None:
+                return None
+            return FunnelResponse(
+                schema_id=schema_id,
+                started=funnel.sessions[STARTED],
+                completed=funnel.sessions[COMPLETED],
+                fields={
+                    path: FieldFunnelCounts(**{stage: counts[stage] for stage in FIELD_STAGES})
+                    for path, counts in funnel.fields.items()
+                },
+            )
+
+    def _count_session(self, session: Session, stage: str) -> None:
+        funnel = self._funnel(session)
+        with self._lock:
+            funnel.sessions[stage] += 1
+
+    def _funnel(self, session: Session) -> _SchemaFunnel:
+        schema_id = session.schema_id or schema_fingerprint(session.schema_)
+        funnel = self._schemas.get(schema_id)
+        if funnel is None:
+            paths = compile_schema(session.schema_).flat
+            with self._lock:
+                funnel = self._schemas.setdefault(schema_id, _SchemaFunnel(paths))
+        return funnel
+
+
+def _field_path(binding: str) -> str:
+    """The schema path a binding writes to: array items count for their array."""
+    return binding.partition("[")[0]
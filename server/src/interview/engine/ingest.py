@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import asyncio
+import codecs
+import json
+import tempfile
+from typing import IO, TYPE_CHECKING, Any, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator
+
+# Largest single item accepted; bounds the parse buffer whatever the body size
+DEFAULT_MAX_ITEM_BYTES = 1 << 20
+# A spooled body stays in memory up to this size, then moves to a temporary file
+SPOOL_MEMORY_BYTES = 1 << 20
+# Read size when a spooled body is parsed back
+SPOOL_READ_BYTES = 64 << 10
+
+
+class BodyTooLargeError(ValueError):
+    """A request body is larger than the configured maximum."""
+
+
+class ParsedItem(NamedTuple):
+    """One item read from a bulk body, or the reason it could not be read.
+
+    `fatal` means the stream can't be resynchronised and reading stopped.
+    """
+
+    value: Any
+    error: str | None = None
+    fatal: bool = False
+
+
+async def iter_ndjson(
+    chunks: AsyncIterable[bytes],
+    max_item_bytes: int = DEFAULT_MAX_ITEM_BYTES,
+) -> AsyncIterator[ParsedItem]:
+    """Parse newline-delimited JSON as it arrives, one item per non-blank line.
+
+    A malformed line is reported and skipped; a line longer than
+    `max_item_bytes` ends the stream.
+    """
+    buffer = b""
+    async for chunk in chunks:
+        buffer += chunk
+        start = 0
+        while (end := buffer.find(b"\n", start)) != -1:
+            line = buffer[start:end]
+            start = end + 1
+            if line.strip():
+                yield _parse_line(line, max_item_bytes)
+        buffer = buffer[start:]
+        if len(buffer) > max_item_bytes:
+            yield ParsedItem(None, _too_large(max_item_bytes), fatal=True)
+            return
+    if buffer.strip():
+        yield _parse_line(buffer, max_item_bytes)
+
+
+def _parse_line(line: bytes, max_item_bytes: int) -> ParsedItem:
+    if len(line) > max_item_bytes:
+        return ParsedItem(None, _too_large(max_item_bytes))
+    try:
+        return ParsedItem(json.loads(line))
+    except ValueError as exc:
+        return ParsedItem(None, f"Invalid JSON: {exc}")
+
+
+async def iter_json_array(
+    chunks: AsyncIterable[bytes],
+    max_item_bytes: int = DEFAULT_MAX_ITEM_BYTES,
+) -> AsyncIterator[ParsedItem]:
+    """Parse a top-level JSON array incrementally, yielding each element.
+
+    Only the current element is buffered, so memory stays bounded by
+    `max_item_bytes` however long the array is. Syntax errors end the
+    stream, since the element boundaries are lost.
+    """
+    decoder = json.JSONDecoder()
+    text = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    # "open": before "["; "value": element or "]" next; "separator": "," or "]" next
+    state = "open"
+    finished = False
+    async for chunk in chunks:
+        try:
+            buffer += text.decode(chunk)
+        except UnicodeDecodeError:
+            yield ParsedItem(None, "Body is not valid UTF-8", fatal=True)
+            return
+        pos = 0
+        while not finished:
+            pos = _skip_whitespace(buffer, pos)
+            if pos == len(buffer):
+                break
+            char = buffer[pos]
+            if state == "open":
+                if char != "[":
+                    yield ParsedItem(None, "Expected a JSON array", fatal=True)
+                    return
+                state = "value"
+                pos += 1
+            elif state == "separator":
+                if char not in ",]":
+                    yield ParsedItem(None, "Expected ',' or ']' between items", fatal=True)
+                    return
+                finished = char == "]"
+                state = "value"
+                pos += 1
+            elif char == "]":
+                finished = True
+                pos += 1
+            else:
+                try:
+                    value, end = decoder.raw_decode(buffer, pos)
+                except ValueError:
+                    break  # incomplete item; wait for more data
+                if end == len(buffer):
+                    break  # a number may continue in the next chunk
+                yield ParsedItem(value)
+                state = "separator"
+                pos = end
+        buffer = buffer[pos:]
+        if finished:
+            return
+        if len(buffer) > max_item_bytes:
+            yield ParsedItem(None, _too_large(max_item_bytes), fatal=True)
+            return
+
+    buffer = buffer.strip()
+    if buffer and state == "value":
+        try:
+            value, end = decoder.raw_decode(buffer)
+        except ValueError as exc:
+            yield ParsedItem(None, f"Invalid JSON: {exc}", fatal=True)
+            return
+        yield ParsedItem(value)
+        buffer = buffer[end:].strip()
+        state = "separator"
+    if not (state == "separator" and buffer == "]"):
+        yield ParsedItem(None, "Unterminated JSON array", fatal=True)
+
+
+async def spool_body(chunks: AsyncIterable[bytes], max_bytes: int) -> IO[bytes]:
+    """Copy a body to a temporary file, kept in memory while it is small.
+
+    For handlers that must receive the whole body before they respond but
+    still parse it a chunk at a time (see `iter_spooled`). Raises
+    BodyTooLargeError once more than `max_bytes` have arrived.
+    """
+    spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MEMORY_BYTES)  # noqa: SIM115
+    size = 0
+    try:
+        async for chunk in chunks:
+            size += len(chunk)
+            if size > max_bytes:
+                msg = f"Body exceeds {max_bytes} bytes"
+                raise BodyTooLargeError(msg)
+            await asyncio.to_thread(spool.write, chunk)
+        await asyncio.to_thread(spool.seek, 0)
+    except BaseException:
+        spool.close()
+        raise
+    return spool
+
+
+async def iter_spooled(spool: IO[bytes]) -> AsyncIterator[bytes]:
+    """Read a spooled body back a chunk at a time, closing it at the end."""
+    try:
+        while chunk := await asyncio.to_thread(spool.read, SPOOL_READ_BYTES):
+            yield chunk
+    finally:
+        spool.close()
+
+
+def _skip_whitespace(text: str, pos: int) -> int:
+    while pos < len(text) and text[pos] in " \t\r\n":
+        pos += 1
+    return pos
+
+
+def _too_large(max_item_bytes: int) -> str:
+    return f"Item exceeds {max_item_bytes} bytes"
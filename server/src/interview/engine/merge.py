@@ -0,0 +1,358 @@
+from __future__ import annotations
+
+import copy
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+from interview.engine.data_index import MISSING, StagedIndex, child_path
+from interview.engine.patch import PatchOp, escape_token
+
+if TYPE_CHECKING:
+    from interview.engine.data_index import DataIndex
+
+# Hard cap on array indexes in bindings; schemas can lower it per field with max_items
+DEFAULT_MAX_ARRAY_ITEMS = 1000
+# Gaps up to this many items are padded in place; larger ones are closed up
+SPARSE_GAP = 8
+
+
+class ArrayIndexError(ValueError):
+    """A binding addresses an array index at or beyond the allowed number of items."""
+
+
+class PathShapeError(ValueError):
+    """A binding addresses an index in an object or a key in a list.
+
+    `path` is the binding as applied (see `MergeTransaction.original_path`).
+    """
+
+    def __init__(self, path: str, location: str, container: Any) -> None:
+        name = f"'{location}'" if location else "The data"
+        kind, wanted = (
+            ("a list", "an object") if isinstance(container, list) else ("an object", "a list")
+        )
+        super().__init__(f"{name} is {kind}, not {wanted}.")
+        self.path = path
+
+
+@lru_cache(maxsize=4096)
+def path_parts(path: str) -> tuple[str | int, ...]:
+    """Cached, immutable form of `parse_path`; binding paths repeat every turn."""
+    parts: list[str | int] = []
+    current = ""
+    i = 0
+    while i < len(path):
+        ch = path[i]
+        if ch == ".":
+            if current:
+                parts.append(current)
+                current = ""
+        elif ch == "[":
+            if current:
+                parts.append(current)
+                current = ""
+            j = path.index("]", i)
+            parts.append(int(path[i + 1 : j]))
+            i = j
+        else:
+            current += ch
+        i += 1
+    if current:
+        parts.append(current)
+    return tuple(parts)
+
+
+def parse_path(path: str) -> list[str | int]:
+    """Parse 'a.b[0].c' into ['a', 'b', 0, 'c']."""
+    return list(path_parts(path))
+
+
+def render_path(parts: tuple[str | int, ...] | list[str | int]) -> str:
+    """Inverse of `parse_path`."""
+    path = ""
+    for part in parts:
+        path = child_path(path, part)
+    return path
+
+
+def compact_indexes(
+    bindings: dict[str, Any],
+    data: dict[str, Any],
+    max_gap: int = SPARSE_GAP,
+) -> tuple[dict[str, Any], dict[str, str]]:
+    """Close up large gaps between array items addressed by `bindings`.
+
+    The indexes a submission uses for each array are collected first, as a
+    sparse set. An index at most `max_gap` past the end of the array keeps
+    its position (the gap is padded); one further out is moved to the next
+    free slot, in index order. So `items[500].name` on a two-item array
+    becomes `items[2].name` and no padding is allocated.
+
+    Returns the rewritten bindings and a map from each moved item's new
+    path to the path the submission used.
+    """
+    paths = {path: list(path_parts(path)) for path in bindings}
+    renamed: dict[str, str] = {}
+    depth = 0
+    while True:
+        # Array indexes at this depth, with the (already compacted) array path
+        wanted: dict[str, set[int]] = {}
+        at_depth: list[tuple[list[str | int], str, int]] = []
+        deeper = False
+        for parts in paths.values():
+            if len(parts) <= depth:
+                continue
+            deeper = True
+            index = parts[depth]
+            if isinstance(index, int):
+                location = render_path(parts[:depth])
+                wanted.setdefault(location, set()).add(index)
+                at_depth.append((parts, location, index))
+        if not deeper:
+            break
+        moves_at: dict[str, dict[int, int]] = {}
+        for location, indexes in wanted.items():
+            moves = _compact(indexes, _length_at(data, location), max_gap)
+            if moves:
+                moves_at[location] = moves
+                original = _original_path(renamed, location)
+                for old, new in moves.items():
+                    renamed[child_path(location, new)] = child_path(original, old)
+        for parts, location, index in at_depth:
+            if location in moves_at:
+                parts[depth] = moves_at[location].get(index, index)
+        depth += 1
+    if not renamed:
+        return bindings, renamed
+    return {render_path(paths[path]): value for path, value in bindings.items()}, renamed
+
+
+def _compact(indexes: set[int], length: int, max_gap: int) -> dict[int, int]:
+    """Moves (old index -> new index) for the indexes beyond `max_gap`."""
+    moves: dict[int, int] = {}
+    for index in sorted(indexes):
+        if index - length <= max_gap:
+            length = max(length, index + 1)
+        else:
+            moves[index] = length
+            length += 1
+    return moves
+
+
+def _length_at(data: dict[str, Any], location: str) -> int:
+    current: Any = data
+    for part in path_parts(location):
+        if isinstance(part, int):
+            if not isinstance(current, list) or part >= len(current):
+                return 0
+        elif not isinstance(current, dict) or part not in current:
+            return 0
+        current = current[part]
+    return len(current) if isinstance(current, list) else 0
+
+
+def _original_path(renamed: dict[str, str], path: str) -> str:
+    # Moved items are renamed at their "[i]"; try the longest such prefix first
+    end = path.rfind("]")
+    while end != -1:
+        original = renamed.get(path[: end + 1])
+        if original is not None:
+            return original + path[end + 1 :]
+        end = path.rfind("]", 0, end)
+    return path
+
+
+class MergeTransaction:
+    """Applies flat bindings to nested data, staged apart from it until `commit`.
+
+    Each binding is written at its path, creating intermediate dicts and
+    lists as needed; a dict value merges key by key into an existing dict
+    (like the former `_deep_merge`), anything else replaces. Writes go to
+    `data`, a copy of the original made path by path: a container is
+    shallow-copied the first time a binding passes through it, so the cost
+    follows the size of the submission (and the width of the containers on
+    its paths), not of the accumulated data. The original is never
+    modified, so code reading it concurrently sees it whole.
+
+    `commit` returns the staged data for the caller to swap in; `rollback`
+    drops it. `changed` holds the paths whose value changed and `ops` the
+    equivalent JSON-patch operations. When an `index` over the original is
+    given, `index` is a `StagedIndex` over it that sees the staged writes,
+    and the original index is brought up to date on commit.
+
+    Array indexes are bounded: `apply` closes up large gaps (see
+    `compact_indexes`) and raises ArrayIndexError for an index at or past
+    `max_items`, before writing anything. A binding through a container of
+    the other kind (an index into a dict, a key into a list) raises
+    PathShapeError, leaving earlier bindings staged for `rollback`. `bindings` holds the bindings as
+    applied, and `original_path` maps a path back to the submitted one.
+    """
+
+    def __init__(
+        self,
+        data: dict[str, Any],
+        index: DataIndex | None = None,
+        max_items: int = DEFAULT_MAX_ARRAY_ITEMS,
+    ) -> None:
+        self.original = data
+        self.data = data
+        self.index = StagedIndex(index) if index is not None else None
+        self.max_items = max_items
+        self.bindings: dict[str, Any] = {}
+        self.renamed: dict[str, str] = {}
+        self.changed: set[str] = set()
+        self.ops: list[PatchOp] = []
+        # Containers created or copied by this transaction, by id; the
+        # objects are held so their ids can't be reused while staged
+        self._owned: dict[int, Any] = {}
+
+    def apply(self, bindings: dict[str, Any]) -> MergeTransaction:
+        for path in bindings:
+            self._check_indexes(path)
+        bindings, renamed = compact_indexes(bindings, self.data)
+        self.bindings.update(bindings)
+        self.renamed.update(renamed)
+        for path, value in bindings.items():
+            self.set(path, value)
+        return self
+
+    @property
+    def view(self) -> StagedIndex | dict[str, Any]:
+        """The staged data for lookups: through the staged index when there is one."""
+        return self.index if self.index is not None else self.data
+
+    def original_path(self, path: str) -> str:
+        """The submitted form of `path`, undoing any renumbering by `apply`."""
+        return _original_path(self.renamed, path)
+
+    def set(self, path: str, value: Any) -> None:
+        """Write one binding as given; indexes are checked but not compacted."""
+        parts = self._check_indexes(path)
+        current: Any = self._root()
+        pointer = ""
+        location = ""
+        for i, part in enumerate(parts[:-1]):
+            empty: Any = {} if isinstance(parts[i + 1], str) else []
+            _check_shape(current, part, path, location)
+            if isinstance(part, int):
+                self._extend(current, part + 1, pointer, location, empty)
+            existing = current[part] if _has(current, part) else None
+            if isinstance(existing, dict | list):
+                self._own(current, part, location)
+            else:
+                self._write(current, part, empty, pointer, location)
+                self._owned[id(empty)] = empty
+            pointer = f"{pointer}/{escape_token(str(part))}"
+            location = child_path(location, part)
+            current = current[part]
+
+        last = parts[-1]
+        _check_shape(current, last, path, location)
+        if isinstance(last, int):
+            self._extend(current, last + 1, pointer, location, None)
+        self._merge(current, last, value, pointer, location)
+
+    def commit(self) -> dict[str, Any]:
+        """The staged data, to replace the original; `index`'s base now follows it."""
+        if self.index is not None:
+            self.index.commit(self.data)
+        self.original = self.data
+        self._owned.clear()
+        return self.data
+
+    def rollback(self) -> None:
+        """Drop every change made by this transaction."""
+        self.data = self.original
+        self._owned.clear()
+        if self.index is not None:
+            self.index.discard()
+        self.bindings.clear()
+        self.renamed.clear()
+        self.changed.clear()
+        self.ops.clear()
+
+    def _check_indexes(self, path: str) -> tuple[str | int, ...]:
+        parts = path_parts(path)
+        for part in parts:
+            if isinstance(part, int) and part >= self.max_items:
+                msg = f"Index {part} in {path!r} is beyond the {self.max_items}-item limit"
+                raise ArrayIndexError(msg)
+        return parts
+
+    def _root(self) -> dict[str, Any]:
+        if id(self.data) not in self._owned:
+            self.data = copy.copy(self.original)
+            self._owned[id(self.data)] = self.data
+        return self.data
+
+    def _own(self, container: Any, key: str | int, location: str) -> Any:
+        """`container[key]`, first copied into the staged data unless already there."""
+        child = container[key]
+        if id(child) not in self._owned:
+            child = copy.copy(child)
+            container[key] = child
+            self._owned[id(child)] = child
+            if self.index is not None:
+                self.index.replace(child_path(location, key), child)
+        return child
+
+    def _merge(
+        self, container: Any, key: str | int, value: Any, pointer: str, location: str
+    ) -> None:
+        existing = container[key] if _has(container, key) else MISSING
+        if isinstance(existing, dict) and isinstance(value, dict):
+            existing = self._own(container, key, location)
+            pointer = f"{pointer}/{escape_token(str(key))}"
+            location = child_path(location, key)
+            for sub_key, sub_value in value.items():
+                self._merge(existing, sub_key, sub_value, pointer, location)
+            return
+        if existing is not MISSING and existing == value and type(existing) is type(value):
+            return
+        self._write(container, key, value, pointer, location)
+
+    def _write(
+        self, container: Any, key: str | int, value: Any, pointer: str, location: str
+    ) -> None:
+        """Set `container[key]`, where `pointer`/`location` address the container."""
+        path = child_path(location, key)
+        previous = container[key] if _has(container, key) else MISSING
+        container[key] = value
+        if self.index is not None:
+            self.index.assign(path, previous, value)
+        # Copy so later in-place merges can't alter operations already handed out
+        self.ops.append(
+            {
+                "op": "add" if previous is MISSING else "replace",
+                "path": f"{pointer}/{escape_token(str(key))}",
+                "value": copy.deepcopy(value),
+            }
+        )
+        self.changed.add(path)
+
+    def _extend(
+        self, items: list[Any], length: int, pointer: str, location: str, fill: Any
+    ) -> None:
+        while len(items) < length:
+            path = child_path(location, len(items))
+            self.ops.append(
+                {"op": "add", "path": f"{pointer}/{len(items)}", "value": copy.deepcopy(fill)}
+            )
+            item = copy.copy(fill)
+            items.append(item)
+            if fill is not None:
+                self._owned[id(item)] = item
+            if self.index is not None:
+                self.index.assign(path, MISSING, item)
+            self.changed.add(path)
+
+
+def _check_shape(container: Any, key: str | int, path: str, location: str) -> None:
+    if not isinstance(container, list if isinstance(key, int) else dict):
+        raise PathShapeError(path, location, container)
+
+
+def _has(container: Any, key: str | int) -> bool:
+    if isinstance(container, list):
+        return isinstance(key, int) and key < len(container)
+    return key in container
@@ -1,100 +1,95 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import json
-from typing import Any
+from collections import Counter
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
 
+from interview.engine.block_repair import repair_blocks
+from interview.engine.data_index import session_index
 from interview.engine.dspy_modules import (
     create_interview_step,
     create_text_extractor,
 )
+from interview.engine.funnel import ANSWERED, EXTRACTED, INVALID, FieldFunnel
+from interview.engine.merge import DEFAULT_MAX_ARRAY_ITEMS, MergeTransaction, PathShapeError
+from interview.engine.patch import PatchOp
 from interview.engine.schema_analyzer import (
-    flatten_schema,
+    compile_schema,
     get_missing_fields,
+    get_open_fields,
     is_complete,
 )
-from interview.engine.validator import validate_data, validate_field
+from interview.engine.streaming import StepStream, TextBlockStreamParser, stream_program
+from interview.engine.validator import (
+    ItemValidator,
+    field_at,
+    item_limit,
+    validate_array_indexes,
+    validate_data,
+    validate_field,
+)
 from interview.models.api import (
+    IngestItemsResponse,
+    ItemErrors,
     StartResponse,
+    StreamEvent,
     SubmitRequest,
     SubmitResponse,
 )
 from interview.models.schema import InterviewSchema
-from interview.models.session import ConversationTurn, Session
-from interview.models.ui_blocks import TextBlock, UIBlock
-from interview.session.store import SessionStore
-
+from interview.models.session import PATCH_LOG_SIZE, ConversationTurn, Session, VersionedPatch
+from interview.models.ui_blocks import FormBlock, TextBlock, UIBlock
+from interview.session.store import (
+    COMPLETED,
+    FORM_SUBMITTED,
+    ITEMS_INGESTED,
+    MESSAGE_EXTRACTED,
+    STEP_GENERATED,
+    SessionEventRecorder,
+    SessionStore,
+)
+from interview.singleflight import SingleFlight
 
-def _deep_merge(base: dict[str, Any], updates: dict[str, Any]) -> dict[str, Any]:
-    """Deep merge updates into base, returning a new dict."""
-    result = dict(base)
-    for key, value in updates.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = _deep_merge(result[key], value)
-        else:
-            result[key] = value
-    return result
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator
 
+    from interview.engine.ingest import ParsedItem
 
-def _expand_bindings(flat: dict[str, Any]) -> dict[str, Any]:
-    """Convert flat dot-notation bindings to nested dict.
 
-    Handles both dot notation (a.b.c) and array indexing (a[0].b).
+ALREADY_COMPLETE_MESSAGE = "All information has already been provided. Thank you!"
+FORM_COMPLETE_MESSAGE = (
+    "Thank you! I have all the information I need. Here's a summary of what we collected."
+)
+MESSAGE_COMPLETE_MESSAGE = "Thank you! I have all the information I need."
+FIX_ERRORS_MESSAGE = "Please fix the errors below and try again."
+NOT_AN_ARRAY = "Not an array field with an item schema."
+
+# Bulk ingestion stops reading once this many items have failed
+MAX_REPORTED_ITEM_ERRORS = 100
+
+
+def _is_acceptable_extraction(
+    extracted: dict[str, Any],
+    requested: list[str],
+    schema: InterviewSchema,
+) -> bool:
+    """Decide whether a fast-model extraction can be used without escalating.
+
+    Every extracted path must be one of the bindings open this turn (active
+    and still empty, optional ones included) and every value must pass
+    validation. An empty extraction is accepted: most
+    messages without data are just that, and escalating them would pay for
+    both models on every one.
     """
-    result: dict[str, Any] = {}
-    for path, value in flat.items():
-        _set_by_path(result, path, value)
-    return result
-
-
-def _set_by_path(obj: dict[str, Any], path: str, value: Any) -> None:
-    """Set a value in a nested dict/list structure using dot-notation path."""
-    parts = _parse_path(path)
-    current: Any = obj
-
-    for i, part in enumerate(parts[:-1]):
-        next_part = parts[i + 1]
-        if isinstance(part, int):
-            while len(current) <= part:
-                current.append({} if isinstance(next_part, str) else [])
-            current = current[part]
-        else:
-            if part not in current:
-                current[part] = [] if isinstance(next_part, int) else {}
-            current = current[part]
-
-    last = parts[-1]
-    if isinstance(last, int):
-        while len(current) <= last:
-            current.append(None)
-        current[last] = value
-    else:
-        current[last] = value
-
-
-def _parse_path(path: str) -> list[str | int]:
-    """Parse 'a.b[0].c' into ['a', 'b', 0, 'c']."""
-    parts: list[str | int] = []
-    current = ""
-    i = 0
-    while i < len(path):
-        ch = path[i]
-        if ch == ".":
-            if current:
-                parts.append(current)
-                current = ""
-        elif ch == "[":
-            if current:
-                parts.append(current)
-                current = ""
-            j = path.index("]", i)
-            parts.append(int(path[i + 1 : j]))
-            i = j
-        else:
-            current += ch
-        i += 1
-    if current:
-        parts.append(current)
-    return parts
+    wanted = set(requested)
+    for path, value in extracted.items():
+        field = field_at(schema, path) if path in wanted else None
+        if field is None or validate_field(value, field):
+            return False
+    return True
 
 
 class InterviewOrchestrator:
@@ -103,134 +98,301 @@ class InterviewOrchestrator:
         store: SessionStore,
         interview_step: Any | None = None,
         text_extractor: Any | None = None,
+        fast_text_extractor: Any | None = None,
+        interview_step_stream: StepStream | None = None,
+        event_log: SessionEventRecorder | None = None,
+        max_array_items: int = DEFAULT_MAX_ARRAY_ITEMS,
     ) -> None:
         self._store = store
+        # Upper bound on array indexes in submitted bindings (see engine.merge)
+        self._max_array_items = max_array_items
+        # Optional append-only record of what each turn did (see session.events)
+        self._event_log = event_log
         self._interview_step = interview_step or create_interview_step()
         self._text_extractor = text_extractor or create_text_extractor()
+        # Optional cheap first stage of the extraction cascade
+        self._fast_text_extractor = fast_text_extractor
+        self._interview_step_stream = interview_step_stream or stream_program(self._interview_step)
+        # Counts of local fixes applied to generated blocks, keyed by repair kind
+        self.repair_counts: Counter[str] = Counter()
+        # Per-schema counts of fields asked, answered, invalid and extracted
+        self.funnel = FieldFunnel()
+        # Per-session turn locks (dropped when no turn holds or awaits them) and
+        # the turn in flight per session, so a duplicate can share its result
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._lock_users: Counter[str] = Counter()
+        self._inflight: SingleFlight[SubmitResponse] = SingleFlight()
 
     def start(
         self,
         schema: InterviewSchema,
         initial_data: dict[str, Any] | None = None,
+        delta: bool = False,
     ) -> StartResponse:
         session = self._store.create(schema, initial_data or {})
+        self.funnel.session_started(session)
 
-        if is_complete(schema, session.current_data):
-            session.is_complete = True
-            self._store.update(session)
-            return StartResponse(
-                session_id=session.id,
-                blocks=[TextBlock(value="All information has already been provided. Thank you!")],
-                is_complete=True,
-                current_data=session.current_data,
-            )
+        if self._check_complete(session):
+            blocks: list[UIBlock] = [TextBlock(value=ALREADY_COMPLETE_MESSAGE)]
+            return self._start_response(session, blocks, delta)
 
         blocks = self._generate_next_step(session)
-        session.conversation_history.append(
-            ConversationTurn(
-                role="assistant",
-                content=json.dumps([b.model_dump() for b in blocks]),
-            )
-        )
-        self._store.update(session)
-
-        return StartResponse(
-            session_id=session.id,
-            blocks=blocks,
-            is_complete=False,
-            current_data=session.current_data,
-        )
+        self._record_step(session, blocks)
+        return self._start_response(session, blocks, delta)
 
     def submit(self, session_id: str, request: SubmitRequest) -> SubmitResponse:
         session = self._store.get(session_id)
         if session is None:
-            return SubmitResponse(
-                blocks=[TextBlock(value="Session not found.")],
-                is_complete=False,
-                current_data={},
-                errors={"_session": ["Session not found."]},
-            )
+            return _session_not_found()
 
-        if request.type == "form":
-            return self._handle_form_submission(session, request.data or {})
-        return self._handle_text_message(session, request.text or "")
-
-    def _handle_form_submission(
-        self,
-        session: Session,
-        submitted_data: dict[str, Any],
-    ) -> SubmitResponse:
-        # Expand flat bindings to nested structure for validation
-        expanded = _expand_bindings(submitted_data)
+        errors = self._apply_submission(session, request)
+        if errors:
+            return self._errors_response(session, request, errors)
 
-        # Merge with current data first to get the full picture for condition evaluation
-        merged_for_validation = _deep_merge(session.current_data, expanded)
-        errors = validate_data(submitted_data, session.schema_, merged_for_validation)
+        if self._check_complete(session):
+            return self._complete_response(session, request)
 
-        if errors:
-            return SubmitResponse(
-                blocks=[TextBlock(value="Please fix the errors below and try again.")],
-                is_complete=False,
-                current_data=session.current_data,
-                errors=errors,
+        blocks = self._generate_next_step(session)
+        self._record_step(session, blocks)
+        return self._submit_response(session, request, blocks, is_complete=False)
+
+    async def submit_async(self, session_id: str, request: SubmitRequest) -> SubmitResponse:
+        """`submit`, serialised per session and run off the event loop.
+
+        A request identical to the turn in flight for the session (a double
+        click, a client retry) waits for that turn and returns its response
+        instead of running again. Other requests for the session queue
+        behind the lock and see the state the previous turn left.
+        """
+        key = _request_key(request)
+        inflight = self._inflight.current(session_id)
+        if inflight is not None and inflight.tag == key:
+            return await inflight.wait()
+
+        async with self._session_lock(session_id):
+            return await self._inflight.run(
+                session_id, key, lambda: asyncio.to_thread(self.submit, session_id, request)
             )
 
-        # Merge valid data
-        session.current_data = _deep_merge(session.current_data, expanded)
+    @contextlib.asynccontextmanager
+    async def _session_lock(self, session_id: str) -> AsyncIterator[None]:
+        lock = self._locks.setdefault(session_id, asyncio.Lock())
+        self._lock_users[session_id] += 1
+        try:
+            async with lock:
+                yield
+        finally:
+            self._lock_users[session_id] -= 1
+            if not self._lock_users[session_id]:
+                del self._lock_users[session_id]
+                del self._locks[session_id]
+
+    async def start_stream(
+        self,
+        schema: InterviewSchema,
+        initial_data: dict[str, Any] | None = None,
+        delta: bool = False,
+    ) -> AsyncIterator[StreamEvent]:
+        """Streaming variant of `start`: text deltas, then forms, then final state."""
+        session = self._store.create(schema, initial_data or {})
+        self.funnel.session_started(session)
 
-        session.conversation_history.append(
-            ConversationTurn(
-                role="user",
-                content=json.dumps(submitted_data),
-            )
-        )
+        blocks: list[UIBlock] = []
+        if self._check_complete(session):
+            blocks.append(TextBlock(value=ALREADY_COMPLETE_MESSAGE))
+            yield _state_event(self._start_response(session, blocks, delta))
+            return
 
-        if is_complete(session.schema_, session.current_data):
-            session.is_complete = True
-            self._store.update(session)
-            blocks: list[UIBlock] = [
-                TextBlock(
-                    value="Thank you! I have all the information I need. "
-                    "Here's a summary of what we collected."
+        async for event in self._stream_next_step(session, blocks):
+            yield event
+        self._record_step(session, blocks)
+        yield _state_event(self._start_response(session, blocks, delta))
+
+    async def submit_stream(
+        self,
+        session_id: str,
+        request: SubmitRequest,
+    ) -> AsyncIterator[StreamEvent]:
+        """Streaming variant of `submit`.
+
+        Validation errors are sent immediately, before any LLM call; text
+        messages still wait for extraction, which must finish before the
+        next step can be planned. Turns are serialised per session, like
+        `submit_async`.
+        """
+        async with self._session_lock(session_id):
+            session = self._store.get(session_id)
+            if session is None:
+                yield _state_event(_session_not_found())
+                return
+
+            errors = await asyncio.to_thread(self._apply_submission, session, request)
+            if errors:
+                yield StreamEvent(event="errors", data={"errors": errors})
+                yield _state_event(self._errors_response(session, request, errors))
+                return
+
+            if self._check_complete(session):
+                yield _state_event(self._complete_response(session, request))
+                return
+
+            blocks: list[UIBlock] = []
+            async for event in self._stream_next_step(session, blocks):
+                yield event
+            self._record_step(session, blocks)
+            yield _state_event(self._submit_response(session, request, blocks, is_complete=False))
+
+    async def ingest_items(
+        self,
+        session_id: str,
+        binding: str,
+        items: AsyncIterable[ParsedItem],
+        start: int | None = None,
+    ) -> IngestItemsResponse:
+        """Validate many items for one array binding and merge them in one transaction.
+
+        `items` is consumed as it arrives (see engine.ingest). Each item is
+        checked against the array's `item_schema` and written at `start`
+        onwards, by default after the existing items. If any item fails,
+        nothing is merged and the errors are returned per item, indexed by
+        position in `items`. No LLM call is made. Runs under the session's
+        turn lock, like `submit_async`.
+        """
+        async with self._session_lock(session_id):
+            session = self._store.get(session_id)
+            if session is None:
+                return IngestItemsResponse(
+                    binding=binding,
+                    accepted=0,
+                    is_complete=False,
+                    version=0,
+                    errors={"_session": ["Session not found."]},
                 )
-            ]
-            return SubmitResponse(
-                blocks=blocks,
-                is_complete=True,
-                current_data=session.current_data,
-            )
 
-        blocks = self._generate_next_step(session)
-        session.conversation_history.append(
-            ConversationTurn(
-                role="assistant",
-                content=json.dumps([b.model_dump() for b in blocks]),
+            field = field_at(session.schema_, binding)
+            if field is None or field.type != "array" or field.item_schema is None:
+                return _ingest_response(session, binding, errors={binding: [NOT_AN_ARRAY]})
+            errors = validate_array_indexes({binding: None}, session.schema_, self._max_array_items)
+            if errors:
+                return _ingest_response(session, binding, errors=errors)
+
+            index = session_index(session)
+            found, existing = index.lookup(binding)
+            length = len(existing) if found and isinstance(existing, list) else 0
+            if start is None:
+                start = length
+            elif not 0 <= start <= length:
+                message = f"start must be between 0 and {length}."
+                return _ingest_response(session, binding, errors={binding: [message]})
+
+            limit, limit_message = item_limit(field, self._max_array_items)
+            validator = ItemValidator(field.item_schema, index)
+            transaction = MergeTransaction(session.current_data, index, self._max_array_items)
+            item_errors: list[ItemErrors] = []
+            count = 0
+            async for parsed in items:
+                position = start + count
+                if parsed.error is not None:
+                    item_errors.append(ItemErrors(index=count, errors={"": [parsed.error]}))
+                elif position >= limit:
+                    message = limit_message or f"At most {limit} items are allowed."
+                    item_errors.append(ItemErrors(index=count, errors={"": [message]}))
+                else:
+                    field_errors = validator.validate(parsed.value)
+                    if field_errors:
+                        item_errors.append(ItemErrors(index=count, errors=field_errors))
+                    elif not item_errors:
+                        try:
+                            transaction.set(f"{binding}[{position}]", parsed.value)
+                        except PathShapeError as error:
+                            transaction.rollback()
+                            return _ingest_response(
+                                session, binding, errors={binding: [str(error)]}
+                            )
+                count += 1
+                # Later items would be out of range too, or unreadable, or not worth reporting
+                if (
+                    parsed.fatal
+                    or position >= limit
+                    or len(item_errors) >= MAX_REPORTED_ITEM_ERRORS
+                ):
+                    break
+
+            if item_errors:
+                transaction.rollback()
+                self.funnel.record(session, INVALID, [binding])
+                return _ingest_response(session, binding, item_errors=item_errors)
+
+            ops = _commit(session, transaction)
+            self.funnel.record(session, ANSWERED, [binding])
+            self._record_event(
+                session, ITEMS_INGESTED, {"binding": binding, "count": count, "ops": ops}
             )
-        )
-        self._store.update(session)
+            if not self._check_complete(session):
+                self._store.update(session)
+            return _ingest_response(session, binding, accepted=count)
 
-        return SubmitResponse(
-            blocks=blocks,
-            is_complete=False,
-            current_data=session.current_data,
-        )
+    def _apply_submission(
+        self,
+        session: Session,
+        request: SubmitRequest,
+    ) -> dict[str, list[str]]:
+        """Validate and merge a submission into the session. Returns form errors."""
+        if request.type == "form":
+            return self._apply_form(session, request.data or {})
+        self._apply_message(session, request.text or "")
+        return {}
 
-    def _handle_text_message(
+    def _apply_form(
         self,
         session: Session,
-        text: str,
-    ) -> SubmitResponse:
-        missing = get_missing_fields(session.schema_, session.current_data)
-        flat_schema = flatten_schema(session.schema_)
-
-        extraction = self._text_extractor(
-            field_schema=json.dumps({k: v.model_dump() for k, v in flat_schema.items()}, indent=2),
-            current_data=json.dumps(session.current_data, indent=2),
-            missing_fields=json.dumps(missing),
-            user_message=text,
+        submitted_data: dict[str, Any],
+    ) -> dict[str, list[str]]:
+        # Out-of-range array indexes are rejected before anything is allocated
+        errors = validate_array_indexes(submitted_data, session.schema_, self._max_array_items)
+        if errors:
+            self.funnel.record(session, INVALID, errors)
+            return errors
+
+        # Stage the merge first to get the full picture for condition evaluation,
+        # then drop it if the submission doesn't validate; the session's data
+        # is only replaced on commit, so readers without the turn lock never
+        # see a submission that is rolled back
+        transaction = MergeTransaction(
+            session.current_data, session_index(session), self._max_array_items
         )
-
-        extracted = extraction.response.extracted
+        try:
+            transaction.apply(submitted_data)
+        except PathShapeError as error:
+            errors = {transaction.original_path(error.path): [str(error)]}
+        else:
+            errors = validate_data(transaction.bindings, session.schema_, transaction.view)
+        if errors:
+            transaction.rollback()
+            self.funnel.record(session, INVALID, errors)
+            return {transaction.original_path(path): e for path, e in errors.items()}
+
+        ops = _commit(session, transaction)
+        self.funnel.record(session, ANSWERED, submitted_data)
+
+        session.conversation_history.append(_turn("user", json.dumps(submitted_data)))
+        self._record_event(session, FORM_SUBMITTED, {"data": submitted_data, "ops": ops})
+        return {}
+
+    def _apply_message(self, session: Session, text: str) -> None:
+        missing = get_missing_fields(session.schema_, session_index(session))
+        compiled = compile_schema(session.schema_)
+        flat_schema = compiled.flat
+
+        inputs = {
+            "field_schema": compiled.field_schema_json,
+            "current_data": json.dumps(session.current_data, indent=2),
+            "missing_fields": json.dumps(missing),
+            "user_message": text,
+        }
+        open_fields = get_open_fields(session.schema_, session_index(session))
+        extracted = self._extract(inputs, open_fields, session.schema_)
+        ops: list[PatchOp] = []
         if extracted:
             # Only merge fields that pass validation — invalid ones will be
             # re-collected via structured form elements in the next step
@@ -240,57 +402,264 @@ class InterviewOrchestrator:
                 if field and not validate_field(value, field):
                     valid_extracted[path] = value
 
-            if valid_extracted:
-                expanded = _expand_bindings(valid_extracted)
-                session.current_data = _deep_merge(session.current_data, expanded)
-
-        session.conversation_history.append(ConversationTurn(role="user", content=text))
+            while valid_extracted:
+                try:
+                    ops = _merge_into_session(session, valid_extracted)
+                    break
+                except PathShapeError as error:
+                    # Stored data of the other shape; the value is asked for again
+                    del valid_extracted[error.path]
+            self.funnel.record(session, ANSWERED, valid_extracted)
+            self.funnel.record(session, EXTRACTED, valid_extracted)
+            self.funnel.record(session, INVALID, extracted.keys() - valid_extracted.keys())
+
+        session.conversation_history.append(_turn("user", text))
         if extracted:
             session.conversation_history.append(
-                ConversationTurn(
-                    role="system",
-                    content=f"Extracted from message: {json.dumps(extracted)}",
-                )
+                _turn("system", f"Extracted from message: {json.dumps(extracted)}")
             )
+        self._record_event(
+            session, MESSAGE_EXTRACTED, {"text": text, "extracted": extracted, "ops": ops}
+        )
 
-        if is_complete(session.schema_, session.current_data):
+    def _extract(
+        self,
+        inputs: dict[str, str],
+        requested: list[str],
+        schema: InterviewSchema,
+    ) -> dict[str, Any]:
+        """Run the extraction cascade: fast model first, full model on rejection."""
+        if self._fast_text_extractor is not None:
+            extracted = dict(self._fast_text_extractor(**inputs).response.extracted or {})
+            if _is_acceptable_extraction(extracted, requested, schema):
+                return extracted
+        return dict(self._text_extractor(**inputs).response.extracted or {})
+
+    def _check_complete(self, session: Session) -> bool:
+        """Mark and persist the session if all data is collected."""
+        if not is_complete(session.schema_, session_index(session)):
+            return False
+        if not session.is_complete:
             session.is_complete = True
-            self._store.update(session)
-            blocks: list[UIBlock] = [
-                TextBlock(value="Thank you! I have all the information I need.")
-            ]
-            return SubmitResponse(
-                blocks=blocks,
-                is_complete=True,
-                current_data=session.current_data,
-            )
+            session.completed_at = datetime.now(UTC)
+            self._record_event(session, COMPLETED, {"at": session.completed_at.isoformat()})
+            self.funnel.session_completed(session)
+        self._store.update(session)
+        return True
 
-        blocks = self._generate_next_step(session)
-        session.conversation_history.append(
-            ConversationTurn(
-                role="assistant",
-                content=json.dumps([b.model_dump() for b in blocks]),
-            )
-        )
+    def _record_step(self, session: Session, blocks: list[UIBlock]) -> None:
+        self.funnel.asked(session, blocks)
+        dumped = [b.model_dump() for b in blocks]
+        session.conversation_history.append(_turn("assistant", json.dumps(dumped)))
+        self._record_event(session, STEP_GENERATED, {"blocks": dumped})
         self._store.update(session)
 
+    def _record_event(self, session: Session, event_type: str, payload: dict[str, Any]) -> None:
+        if self._event_log is not None:
+            self._event_log.record(session.id, event_type, payload)
+
+    def _start_response(
+        self,
+        session: Session,
+        blocks: list[UIBlock],
+        delta: bool,
+    ) -> StartResponse:
+        # In delta mode the client already holds version 0: its own initial_data
+        current_data, patch = _data_payload(session, 0 if delta else None)
+        return StartResponse(
+            session_id=session.id,
+            blocks=blocks,
+            is_complete=session.is_complete,
+            current_data=current_data,
+            version=session.version,
+            patch=patch,
+        )
+
+    def _submit_response(
+        self,
+        session: Session,
+        request: SubmitRequest,
+        blocks: list[UIBlock],
+        is_complete: bool,
+        errors: dict[str, list[str]] | None = None,
+    ) -> SubmitResponse:
+        current_data, patch = _data_payload(session, request.since_version)
         return SubmitResponse(
             blocks=blocks,
-            is_complete=False,
-            current_data=session.current_data,
+            is_complete=is_complete,
+            current_data=current_data,
+            errors=errors or {},
+            version=session.version,
+            patch=patch,
         )
 
-    def _generate_next_step(self, session: Session) -> list[UIBlock]:
-        missing = get_missing_fields(session.schema_, session.current_data)
-        flat_schema = flatten_schema(session.schema_)
+    def _errors_response(
+        self,
+        session: Session,
+        request: SubmitRequest,
+        errors: dict[str, list[str]],
+    ) -> SubmitResponse:
+        blocks: list[UIBlock] = [TextBlock(value=FIX_ERRORS_MESSAGE)]
+        return self._submit_response(session, request, blocks, is_complete=False, errors=errors)
+
+    def _complete_response(self, session: Session, request: SubmitRequest) -> SubmitResponse:
+        message = FORM_COMPLETE_MESSAGE if request.type == "form" else MESSAGE_COMPLETE_MESSAGE
+        blocks: list[UIBlock] = [TextBlock(value=message)]
+        return self._submit_response(session, request, blocks, is_complete=True)
+
+    def _step_inputs(self, session: Session) -> tuple[dict[str, str], list[str]]:
+        missing = get_missing_fields(session.schema_, session_index(session))
+        inputs = {
+            "field_schema": compile_schema(session.schema_).field_schema_json,
+            "current_data": json.dumps(session.current_data, indent=2),
+            "missing_fields": json.dumps(missing),
+            "conversation_history": json.dumps(
+                [t.model_dump() for t in session.conversation_history]
+            ),
+        }
+        return inputs, missing
 
-        schema_for_llm = {k: v.model_dump() for k, v in flat_schema.items()}
+    def _generate_next_step(self, session: Session) -> list[UIBlock]:
+        inputs, missing = self._step_inputs(session)
+        result = self._interview_step(**inputs)
+        return self._repair(session, list(result.response.ui_blocks), missing)
 
-        result = self._interview_step(
-            field_schema=json.dumps(schema_for_llm, indent=2),
-            current_data=json.dumps(session.current_data, indent=2),
-            missing_fields=json.dumps(missing),
-            conversation_history=json.dumps([t.model_dump() for t in session.conversation_history]),
+    async def _stream_next_step(
+        self,
+        session: Session,
+        out: list[UIBlock],
+    ) -> AsyncIterator[StreamEvent]:
+        """Stream the next step, filling `out` with the final repaired blocks.
+
+        Yields "text" events with deltas of the first TextBlock while the LM
+        generates, then a "form" event per FormBlock once the output parses.
+        """
+        inputs, missing = self._step_inputs(session)
+        parser = TextBlockStreamParser()
+        prediction: Any = None
+        async for item in self._interview_step_stream(**inputs):
+            if isinstance(item, str):
+                delta = parser.feed(item)
+                if delta:
+                    yield StreamEvent(event="text", data={"delta": delta})
+            else:
+                prediction = item
+        if prediction is None:
+            msg = "InterviewStep stream ended without a prediction"
+            raise RuntimeError(msg)
+
+        out.extend(self._repair(session, list(prediction.response.ui_blocks), missing))
+        for block in out:
+            if isinstance(block, FormBlock):
+                yield StreamEvent(event="form", data=block.model_dump(mode="json"))
+
+    def _repair(
+        self,
+        session: Session,
+        blocks: list[UIBlock],
+        missing: list[str],
+    ) -> list[UIBlock]:
+        return repair_blocks(
+            blocks,
+            compile_schema(session.schema_).flat,
+            session.current_data,
+            missing,
+            self.repair_counts,
         )
 
-        return list(result.response.ui_blocks)
+
+def _turn(role: str, content: str) -> ConversationTurn:
+    # Both fields are plain strings built here; skip pydantic validation
+    return ConversationTurn.model_construct(role=role, content=content)
+
+
+def _merge_into_session(session: Session, bindings: dict[str, Any]) -> list[PatchOp]:
+    """Merge flat bindings into the session, bumping its version on change.
+
+    Returns the JSON-patch operations applied. On PathShapeError nothing is
+    merged.
+    """
+    transaction = MergeTransaction(session.current_data, session_index(session))
+    try:
+        transaction.apply(bindings)
+    except PathShapeError as error:
+        error.path = transaction.original_path(error.path)
+        transaction.rollback()
+        raise
+    return _commit(session, transaction)
+
+
+def _commit(session: Session, transaction: MergeTransaction) -> list[PatchOp]:
+    """Swap an applied merge in as a new data version. Returns its operations."""
+    ops = transaction.ops
+    if ops:
+        session.current_data = transaction.commit()
+        if transaction.index is not None:
+            session._data_index = transaction.index.base
+        session.version += 1
+        session.patch_log.append(VersionedPatch(version=session.version, ops=ops))
+        del session.patch_log[:-PATCH_LOG_SIZE]
+    return ops
+
+
+def _patch_since(session: Session, since_version: int) -> list[PatchOp] | None:
+    """Operations taking a client from `since_version` to the current version.
+
+    Returns None when the log no longer reaches back that far (or the
+    client is ahead), in which case a full snapshot must be sent.
+    """
+    if since_version == session.version:
+        return []
+    if since_version > session.version:
+        return None
+    entries = [e for e in session.patch_log if e.version > since_version]
+    if not entries or entries[0].version != since_version + 1:
+        return None
+    return [op for entry in entries for op in entry.ops]
+
+
+def _data_payload(
+    session: Session,
+    since_version: int | None,
+) -> tuple[dict[str, Any] | None, list[PatchOp] | None]:
+    """Return (current_data, patch): a patch in delta mode when possible, else a snapshot."""
+    if since_version is not None:
+        patch = _patch_since(session, since_version)
+        if patch is not None:
+            return None, patch
+    return session.current_data, None
+
+
+def _request_key(request: SubmitRequest) -> str:
+    """Identity of a submission, for recognising duplicates."""
+    return json.dumps(request.model_dump(mode="json"), sort_keys=True)
+
+
+def _session_not_found() -> SubmitResponse:
+    return SubmitResponse(
+        blocks=[TextBlock(value="Session not found.")],
+        is_complete=False,
+        current_data={},
+        errors={"_session": ["Session not found."]},
+    )
+
+
+def _ingest_response(
+    session: Session,
+    binding: str,
+    accepted: int = 0,
+    errors: dict[str, list[str]] | None = None,
+    item_errors: list[ItemErrors] | None = None,
+) -> IngestItemsResponse:
+    return IngestItemsResponse(
+        binding=binding,
+        accepted=accepted,
+        is_complete=session.is_complete,
+        version=session.version,
+        errors=errors or {},
+        item_errors=item_errors or [],
+    )
+
+
+def _state_event(response: StartResponse | SubmitResponse) -> StreamEvent:
+    return StreamEvent(event="state", data=response.model_dump(mode="json"))
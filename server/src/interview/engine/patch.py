@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import copy
+from typing import Any
+
+# RFC 6902 subset: {"op": "add" | "replace" | "remove", "path": "/a/b/0", "value": ...}
+PatchOp = dict[str, Any]
+
+
+def diff_data(old: Any, new: Any, path: str = "") -> list[PatchOp]:
+    """Compute JSON-patch operations that turn `old` into `new`.
+
+    Dicts are diffed key by key and lists index by index (appends become
+    "add", truncation becomes "remove" from the end), so a turn that fills
+    one field of a large record produces a single small operation.
+    """
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops: list[PatchOp] = []
+        for key, value in new.items():
+            child = f"{path}/{escape_token(str(key))}"
+            if key not in old:
+                ops.append({"op": "add", "path": child, "value": value})
+            else:
+                ops.extend(diff_data(old[key], value, child))
+        ops.extend(
+            {"op": "remove", "path": f"{path}/{escape_token(str(key))}"}
+            for key in old
+            if key not in new
+        )
+        return ops
+
+    if isinstance(old, list) and isinstance(new, list):
+        ops = []
+        common = min(len(old), len(new))
+        for i in range(common):
+            ops.extend(diff_data(old[i], new[i], f"{path}/{i}"))
+        ops.extend(
+            {"op": "add", "path": f"{path}/{i}", "value": new[i]} for i in range(common, len(new))
+        )
+        ops.extend(
+            {"op": "remove", "path": f"{path}/{i}"} for i in reversed(range(common, len(old)))
+        )
+        return ops
+
+    if old == new and type(old) is type(new):
+        return []
+    return [{"op": "replace", "path": path, "value": new}]
+
+
+def apply_patch(doc: dict[str, Any], ops: list[PatchOp]) -> dict[str, Any]:
+    """Apply operations produced by `diff_data`, returning a new document."""
+    return apply_patch_in_place(copy.deepcopy(doc), ops)
+
+
+def apply_patch_in_place(doc: dict[str, Any], ops: list[PatchOp]) -> dict[str, Any]:
+    """Apply operations to `doc` itself and return it (or its replacement at "").
+
+    Only the operation values are copied, so the cost follows the size of
+    the patch rather than the size of the document.
+    """
+    for op in ops:
+        tokens = [_unescape(t) for t in op["path"].split("/")[1:]]
+        if not tokens:
+            doc = copy.deepcopy(op["value"])
+            continue
+        parent: Any = doc
+        for token in tokens[:-1]:
+            parent = parent[int(token)] if isinstance(parent, list) else parent[token]
+        last = tokens[-1]
+        if isinstance(parent, list):
+            index = int(last)
+            if op["op"] == "remove":
+                del parent[index]
+            elif op["op"] == "add":
+                parent.insert(index, copy.deepcopy(op["value"]))
+            else:
+                parent[index] = copy.deepcopy(op["value"])
+        elif op["op"] == "remove":
+            del parent[last]
+        else:
+            parent[last] = copy.deepcopy(op["value"])
+    return doc
+
+
+def escape_token(token: str) -> str:
+    """Escape a key for use as one JSON-pointer token."""
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import asyncio
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+from interview.engine.columnar import validate_columns
+from interview.engine.data_index import DataIndex
+from interview.engine.schema_analyzer import get_invalid_fields, get_missing_fields
+from interview.models.schema import InterviewSchema
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+    from concurrent.futures import Executor
+
+    from interview.engine.ingest import ParsedItem
+
+# Records per task sent to a worker; large enough to amortise pickling
+DEFAULT_CHUNK_SIZE = 256
+
+NOT_AN_OBJECT = "Record must be a JSON object."
+
+
+@dataclass(frozen=True, slots=True)
+class RecordReport:
+    """What one `initial_data` record still needs before its interview is complete.
+
+    `error` is set instead when the record could not be read at all.
+    """
+
+    index: int
+    missing: list[str]
+    invalid: dict[str, list[str]]
+    error: str | None = None
+
+    @property
+    def is_complete(self) -> bool:
+        return self.error is None and not self.missing and not self.invalid
+
+    def to_dict(self) -> dict[str, Any]:
+        if self.error is not None:
+            return {"index": self.index, "error": self.error}
+        return {
+            "index": self.index,
+            "is_complete": self.is_complete,
+            "missing": self.missing,
+            "invalid": self.invalid,
+        }
+
+
+def analyze_record(schema: InterviewSchema, data: Any, index: int = 0) -> RecordReport:
+    """Missing and invalid fields of one record, as `/start` would see it. No LLM call."""
+    if not isinstance(data, dict):
+        return RecordReport(index, [], {}, NOT_AN_OBJECT)
+    view = DataIndex(data)
+    return RecordReport(index, get_missing_fields(schema, view), get_invalid_fields(schema, view))
+
+
+# (index, record, parse error) as handed to a worker
+_Entry = tuple[int, Any, str | None]
+
+
+@lru_cache(maxsize=16)
+def _load_schema(schema_json: str) -> InterviewSchema:
+    # Each worker parses a schema once, however many chunks it analyses
+    return InterviewSchema.model_validate_json(schema_json)
+
+
+def _analyze_chunk(schema_json: str, entries: list[_Entry]) -> list[RecordReport]:
+    return _analyze_entries(_load_schema(schema_json), entries)
+
+
+def _analyze_entries(schema: InterviewSchema, entries: list[_Entry]) -> list[RecordReport]:
+    """Reports for a chunk of records, validated a column at a time.
+
+    The chunk's records go through `validate_columns` together; only those
+    with array items, which the columns don't expand, are analysed one by
+    one with `analyze_record`.
+    """
+    records = [record for _, record, error in entries if error is None and isinstance(record, dict)]
+    result = validate_columns(schema, records)
+    reports: list[RecordReport] = []
+    row = 0
+    for index, record, error in entries:
+        if error is not None:
+            reports.append(RecordReport(index, [], {}, error))
+        elif not isinstance(record, dict):
+            reports.append(RecordReport(index, [], {}, NOT_AN_OBJECT))
+        else:
+            if result.has_items[row]:
+                reports.append(analyze_record(schema, record, index))
+            else:
+                missing, invalid = result.record_missing(row), result.record_errors(row)
+                reports.append(RecordReport(index, missing, invalid))
+            row += 1
+    return reports
+
+
+def analyze_records(
+    schema: InterviewSchema,
+    records: Iterable[Any],
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[RecordReport]:
+    """Analyse many records, yielding one report per record in input order.
+
+    Records are analysed in chunks on a pool of `workers` processes (one per
+    CPU by default; 0 analyses in this process). At most two chunks per
+    worker are in flight, so memory stays bounded however many records are
+    read from `records`.
+    """
+    entries: Iterable[_Entry] = ((i, r, None) for i, r in enumerate(records))
+    if workers == 0:
+        for chunk in _chunks(entries, chunk_size):
+            yield from _analyze_entries(schema, chunk)
+        return
+    workers = workers or os.cpu_count() or 1
+    schema_json = schema.model_dump_json()
+    with ProcessPoolExecutor(workers) as pool:
+        pending: deque[Future[list[RecordReport]]] = deque()
+        for chunk in _chunks(entries, chunk_size):
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+            pending.append(pool.submit(_analyze_chunk, schema_json, chunk))
+        while pending:
+            yield from pending.popleft().result()
+
+
+def _chunks(entries: Iterable[_Entry], size: int) -> Iterator[list[_Entry]]:
+    chunk: list[_Entry] = []
+    for entry in entries:
+        chunk.append(entry)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+async def analyze_stream(
+    schema: InterviewSchema,
+    items: AsyncIterable[ParsedItem],
+    executor: Executor | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_in_flight: int = 8,
+) -> AsyncIterator[RecordReport]:
+    """`analyze_records` over a parsed request body, for the batch endpoint.
+
+    Chunks run on `executor` (the loop's default thread pool when None) so
+    the event loop only parses and serialises. Items that failed to parse
+    are reported by position; a fatal parse error ends the stream.
+    """
+    loop = asyncio.get_running_loop()
+    schema_json = schema.model_dump_json()
+    pending: deque[asyncio.Future[list[RecordReport]]] = deque()
+    chunk: list[_Entry] = []
+    index = 0
+
+    async def flush(limit: int) -> AsyncIterator[RecordReport]:
+        while len(pending) > limit:
+            for report in await pending.popleft():
+                yield report
+
+    async for item in items:
+        chunk.append((index, item.value, item.error))
+        index += 1
+        if len(chunk) >= chunk_size or item.fatal:
+            pending.append(loop.run_in_executor(executor, _analyze_chunk, schema_json, chunk))
+            chunk = []
+            async for report in flush(max_in_flight - 1):
+                yield report
+        if item.fatal:
+            break
+    if chunk:
+        pending.append(loop.run_in_executor(executor, _analyze_chunk, schema_json, chunk))
+    async for report in flush(0):
+        yield report
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import weakref
+from typing import TYPE_CHECKING, Any
+
+from interview.engine.validator import rule_message
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from interview.models.schema import Condition, FieldSchema, InterviewSchema, ValidationRule
+
+# Bumped when the bundle layout changes, so clients can reject what they can't read
+RULES_FORMAT = 1
+
+# Leading inline flags JavaScript can take as RegExp flags instead
+_INLINE_FLAGS = re.compile(r"^\(\?([a-zA-Z]+)\)")
+# Group syntax JavaScript supports: (?: (?= (?! (?<= (?<! (?<name>
+_JS_GROUP = re.compile(r"\(\?(?![:=!]|<[=!]|<\w+>)")
+
+
+class RuleBundle:
+    """A schema's client rule bundle, serialised once, with its ETag."""
+
+    __slots__ = ("body", "etag")
+
+    def __init__(self, bundle: dict[str, Any]) -> None:
+        self.body = json.dumps(bundle, separators=(",", ":")).encode()
+        self.etag = f'"{hashlib.sha256(self.body).hexdigest()[:32]}"'
+
+
+# Keyed by id(); entries are dropped when the schema object is collected
+_bundles: dict[int, RuleBundle] = {}
+
+
+def compile_rules(schema: InterviewSchema) -> RuleBundle:
+    """Return the cached rule bundle for this schema object, building it on first use."""
+    key = id(schema)
+    bundle = _bundles.get(key)
+    if bundle is None:
+        bundle = RuleBundle(rule_bundle(schema))
+        try:
+            weakref.finalize(schema, _bundles.pop, key, None)
+        except TypeError:
+            return bundle  # not weak-referenceable; skip caching
+        _bundles[key] = bundle
+    return bundle
+
+
+def rule_bundle(schema: InterviewSchema) -> dict[str, Any]:
+    """Validation and visibility rules for a client to apply locally.
+
+    - `fields`: one entry per `flatten_schema` path with its `type`, its
+      `rules` (with the exact server messages) and `when`, indexes into
+      `conditions` that must all hold for the field to be shown, its
+      parents' conditions included. Array fields with an `item_schema`
+      carry `items`, entries keyed by path within an item ("" for scalar
+      items).
+    - `conditions`: each distinct condition once, as [field, op, value].
+    - `dependents`: for each field that conditions read, the fields whose
+      visibility it toggles.
+
+    Patterns are translated to JavaScript RegExp source and flags. A rule
+    that can't be expressed on the client is left out and its field is
+    marked `partial`; the server still checks it on submit.
+    """
+    conditions: list[list[Any]] = []
+    seen: dict[str, int] = {}
+
+    def index(condition: Condition) -> int:
+        entry = [condition.field, condition.op, condition.value]
+        key = json.dumps(entry, sort_keys=True, default=str)
+        if key not in seen:
+            seen[key] = len(conditions)
+            conditions.append(entry)
+        return seen[key]
+
+    fields: dict[str, dict[str, Any]] = {}
+    _collect(schema.fields, "", [], index, fields)
+
+    dependents: dict[str, list[str]] = {}
+    for path, entry in fields.items():
+        for item_path, item in [("", entry), *entry.get("items", {}).items()]:
+            target = f"{path}[].{item_path}" if item_path else path
+            for i in item.get("when", []):
+                dependents.setdefault(conditions[i][0], []).append(target)
+    return {
+        "format": RULES_FORMAT,
+        "fields": fields,
+        "conditions": conditions,
+        "dependents": {field: list(dict.fromkeys(paths)) for field, paths in dependents.items()},
+    }
+
+
+def _collect(
+    fields: dict[str, FieldSchema],
+    prefix: str,
+    when: list[int],
+    index: Callable[[Condition], int],
+    out: dict[str, dict[str, Any]],
+) -> None:
+    for name, field in fields.items():
+        path = f"{prefix}.{name}" if prefix else name
+        scoped = when + [index(c) for c in field.conditions if index(c) not in when]
+        if field.type == "object" and field.fields:
+            _collect(field.fields, path, scoped, index, out)
+            continue
+        entry = _entry(field, scoped)
+        item = field.item_schema
+        if field.type == "array" and item is not None:
+            items: dict[str, dict[str, Any]] = {}
+            if item.type == "object" and item.fields:
+                _collect(item.fields, "", [], index, items)
+            else:
+                items[""] = _entry(item, [])
+            entry["items"] = items
+        out[path] = entry
+
+
+def _entry(field: FieldSchema, when: list[int]) -> dict[str, Any]:
+    entry: dict[str, Any] = {"type": field.type}
+    rules = [_rule(rule) for rule in field.validation]
+    if any(rule is None for rule in rules):
+        entry["partial"] = True
+    if field.validation:
+        entry["rules"] = [rule for rule in rules if rule is not None]
+    if when:
+        entry["when"] = when
+    return entry
+
+
+def _rule(rule: ValidationRule) -> dict[str, Any] | None:
+    compiled: dict[str, Any] = {"type": rule.type}
+    if rule.type == "pattern":
+        translated = js_regex(rule.param) if isinstance(rule.param, str) else None
+        if translated is None:
+            return None
+        compiled["param"], flags = translated
+        if flags:
+            compiled["flags"] = flags
+    elif rule.param is not None:
+        compiled["param"] = rule.param
+    compiled["message"] = rule_message(rule)
+    return compiled
+
+
+def js_regex(pattern: str) -> tuple[str, str] | None:
+    """(source, flags) for a JavaScript RegExp that searches like `re.search`.
+
+    Handles leading `(?ims)` flags, `(?P<name>...)` groups, `(?P=name)`
+    backreferences and the `\\A` / `\\Z` anchors. Returns None for patterns
+    that don't compile or use syntax JavaScript lacks.
+    """
+    try:
+        re.compile(pattern)
+    except re.error:
+        return None
+    flags = ""
+    match = _INLINE_FLAGS.match(pattern)
+    if match:
+        if set(match[1]) - set("ims"):
+            return None
+        flags = "".join(sorted(set(match[1])))
+        pattern = pattern[match.end() :]
+    source = pattern.replace("(?P<", "(?<")
+    source = re.sub(r"\(\?P=(\w+)\)", r"\\k<\1>", source)
+    # An anchor escape is one preceded by an even number of backslashes. The
+    # anchors become lookarounds, which hold at the ends of the whole input
+    # even under the m flag, where ^ and $ would match at every line
+    source = re.sub(r"(?<!\\)((?:\\\\)*)\\A", r"\1(?<![\\s\\S])", source)
+    source = re.sub(r"(?<!\\)((?:\\\\)*)\\Z", r"\1(?![\\s\\S])", source)
+    if _JS_GROUP.search(source):
+        return None
+    return source, flags
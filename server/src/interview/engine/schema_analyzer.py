@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from typing import Any
+import json
+import weakref
 
-from interview.engine.conditions import _resolve_path, evaluate_conditions
+from interview.engine.conditions import DataView, evaluate_conditions, get_active_fields, lookup
 from interview.engine.validator import validate_field
 from interview.models.schema import FieldSchema, InterviewSchema
 
@@ -15,6 +16,37 @@ def flatten_schema(
     return out
 
 
+class CompiledSchema:
+    """Per-schema analysis, computed once and shared by every session using the schema."""
+
+    __slots__ = ("field_schema_json", "flat")
+
+    def __init__(self, schema: InterviewSchema) -> None:
+        self.flat = flatten_schema(schema)
+        # The field_schema input sent to the LLM modules on every turn
+        self.field_schema_json = json.dumps(
+            {k: v.model_dump() for k, v in self.flat.items()}, indent=2
+        )
+
+
+# Keyed by id(); entries are dropped when the schema object is collected
+_compiled: dict[int, CompiledSchema] = {}
+
+
+def compile_schema(schema: InterviewSchema) -> CompiledSchema:
+    """Return the cached analysis for this schema object, computing it on first use."""
+    key = id(schema)
+    compiled = _compiled.get(key)
+    if compiled is None:
+        compiled = CompiledSchema(schema)
+        try:
+            weakref.finalize(schema, _compiled.pop, key, None)
+        except TypeError:
+            return compiled  # not weak-referenceable; skip caching
+        _compiled[key] = compiled
+    return compiled
+
+
 def _flatten_fields(
     fields: dict[str, FieldSchema],
     prefix: str,
@@ -32,16 +64,26 @@ def _is_required(field: FieldSchema) -> bool:
     return any(r.type == "required" for r in field.validation)
 
 
-def get_missing_fields(schema: InterviewSchema, data: dict[str, Any]) -> list[str]:
+def get_missing_fields(schema: InterviewSchema, data: DataView) -> list[str]:
     missing: list[str] = []
     _find_missing(schema.fields, data, data, "", missing)
     return missing
 
 
+def get_open_fields(schema: InterviewSchema, data: DataView) -> list[str]:
+    """Active fields without a value, required or optional: what a turn can ask for."""
+    return [path for path in get_active_fields(schema, data) if _is_empty(data, path)]
+
+
+def _is_empty(data: DataView, path: str) -> bool:
+    found, value = lookup(data, path)
+    return not found or value is None or value == "" or value == []
+
+
 def _find_missing(
     fields: dict[str, FieldSchema],
-    data: dict[str, Any],
-    root_data: dict[str, Any],
+    data: DataView,
+    root_data: DataView,
     prefix: str,
     missing: list[str],
 ) -> None:
@@ -55,13 +97,11 @@ def _find_missing(
             _find_missing(field.fields, data, root_data, path, missing)
             continue
 
-        if _is_required(field):
-            found, value = _resolve_path(root_data, path)
-            if not found or value is None or value == "" or value == []:
-                missing.append(path)
+        if _is_required(field) and _is_empty(root_data, path):
+            missing.append(path)
 
         if field.type == "array" and field.item_schema and field.item_schema.type == "object":
-            found, arr = _resolve_path(root_data, path)
+            found, arr = lookup(root_data, path)
             if found and isinstance(arr, list):
                 for i, _item in enumerate(arr):
                     item_prefix = f"{path}[{i}]"
@@ -74,7 +114,7 @@ def _find_missing(
                     )
 
 
-def get_invalid_fields(schema: InterviewSchema, data: dict[str, Any]) -> dict[str, list[str]]:
+def get_invalid_fields(schema: InterviewSchema, data: DataView) -> dict[str, list[str]]:
     errors: dict[str, list[str]] = {}
     _find_invalid(schema.fields, data, data, "", errors)
     return errors
@@ -82,8 +122,8 @@ def get_invalid_fields(schema: InterviewSchema, data: dict[str, Any]) -> dict[st
 
 def _find_invalid(
     fields: dict[str, FieldSchema],
-    data: dict[str, Any],
-    root_data: dict[str, Any],
+    data: DataView,
+    root_data: DataView,
     prefix: str,
     errors: dict[str, list[str]],
 ) -> None:
@@ -97,7 +137,7 @@ def _find_invalid(
             _find_invalid(field.fields, data, root_data, path, errors)
             continue
 
-        found, value = _resolve_path(root_data, path)
+        found, value = lookup(root_data, path)
         if found and value is not None and value != "":
             field_errors = validate_field(value, field)
             if field_errors:
@@ -121,5 +161,5 @@ def _find_invalid(
                 )
 
 
-def is_complete(schema: InterviewSchema, data: dict[str, Any]) -> bool:
+def is_complete(schema: InterviewSchema, data: DataView) -> bool:
     return not get_missing_fields(schema, data) and not get_invalid_fields(schema, data)
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from typing import TYPE_CHECKING
+
+from interview.engine.schema_analyzer import CompiledSchema, compile_schema
+from interview.models.schema import InterviewSchema
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+def schema_fingerprint(schema: InterviewSchema) -> str:
+    """Content address of a schema: sha256 of its canonical JSON form."""
+    canonical = json.dumps(schema.model_dump(mode="json"), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()[:32]
+
+
+class RegisteredSchema:
+    """A registered schema together with its one-time analysis."""
+
+    __slots__ = ("compiled", "name", "schema", "schema_id", "version")
+
+    def __init__(self, schema_id: str, name: str | None, version: int, schema: InterviewSchema):
+        self.schema_id = schema_id
+        self.name = name
+        self.version = version
+        self.schema = schema
+        self.compiled: CompiledSchema = compile_schema(schema)
+
+
+class SchemaRegistry:
+    """In-process registry of schemas, addressed by content.
+
+    Registering the same schema twice returns the existing entry, so sessions
+    started by ``schema_id`` all share one parsed schema and one analysis.
+    Versions count distinct schemas registered under the same name.
+    """
+
+    def __init__(self) -> None:
+        self._by_id: dict[str, RegisteredSchema] = {}
+        self._versions: dict[str | None, int] = {}
+
+    def register(self, schema: InterviewSchema, name: str | None = None) -> RegisteredSchema:
+        schema_id = schema_fingerprint(schema)
+        existing = self._by_id.get(schema_id)
+        if existing is not None:
+            return existing
+        version = self._versions.get(name, 0) + 1
+        self._versions[name] = version
+        entry = RegisteredSchema(schema_id, name, version, schema)
+        self._by_id[schema_id] = entry
+        return entry
+
+    def get(self, schema_id: str) -> RegisteredSchema | None:
+        return self._by_id.get(schema_id)
+
+    def load_directory(self, directory: Path) -> list[RegisteredSchema]:
+        """Register every ``*.json`` schema in a directory, named by file stem."""
+        entries: list[RegisteredSchema] = []
+        for path in sorted(directory.glob("*.json")):
+            schema = InterviewSchema.model_validate_json(path.read_text())
+            entry = self.register(schema, name=path.stem)
+            logger.info(
+                "Registered schema %s v%d as %s", entry.name, entry.version, entry.schema_id
+            )
+            entries.append(entry)
+        return entries
+
+    def __len__(self) -> int:
+        return len(self._by_id)
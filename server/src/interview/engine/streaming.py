@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from typing import Any
+
+import dspy
+
+# A step stream yields raw LM output text chunks (str) and, last, the final
+# prediction. Tests substitute a fake that replays canned output in chunks.
+StepStream = Callable[..., AsyncIterator[Any]]
+
+_ESCAPES = {'"': '"', "\\": "\\", "/": "/", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t"}
+
+
+def stream_program(program: Any) -> StepStream:
+    """Wrap a DSPy module as a step stream.
+
+    Uses ``dspy.streamify`` where available, so TextBlock text can be shown
+    while the LM is still generating. Older DSPy versions fall back to a
+    single prediction with no text chunks.
+    """
+    streaming: Any = None
+
+    async def run(**inputs: str) -> AsyncIterator[Any]:
+        nonlocal streaming
+        if not hasattr(dspy, "streamify"):
+            yield await asyncio.to_thread(program, **inputs)
+            return
+        if streaming is None:
+            streaming = dspy.streamify(program)
+        async for value in streaming(**inputs):
+            if isinstance(value, dspy.Prediction):
+                yield value
+                continue
+            text = _chunk_text(value)
+            if text:
+                yield text
+
+    return run
+
+
+def _chunk_text(chunk: Any) -> str | None:
+    """Pull the content delta out of a litellm ModelResponseStream chunk."""
+    choices = getattr(chunk, "choices", None)
+    if not choices:
+        return None
+    delta = getattr(choices[0], "delta", None)
+    content = getattr(delta, "content", None)
+    return content if isinstance(content, str) else None
+
+
+class TextBlockStreamParser:
+    """Incrementally extract the first TextBlock's value from streamed JSON.
+
+    The LM emits ``{..., "response": {"ui_blocks": [{"kind": "text",
+    "value": "..."}, ...]}}``. Text is surfaced as soon as its characters
+    arrive, without waiting for the JSON document to complete. Only a
+    "value" key on an object directly inside the "ui_blocks" array counts,
+    so option values nested in form elements are never mistaken for text.
+    """
+
+    def __init__(self) -> None:
+        # Open containers ("{" or "[") and the key each one sits under
+        self._stack: list[str] = []
+        self._stack_keys: list[str | None] = []
+        self._key: str | None = None
+        self._expect_value = False
+        self._in_string = False
+        self._escape: str | None = None
+        self._high_surrogate: int | None = None
+        self._string: list[str] = []
+        self._capturing = False
+        self.done = False
+
+    def feed(self, chunk: str) -> str:
+        """Consume a chunk of LM output; return any newly available text."""
+        out: list[str] = []
+        for ch in chunk:
+            if self.done:
+                break
+            if self._in_string:
+                self._string_char(ch, out)
+            else:
+                self._structural_char(ch)
+        return "".join(out)
+
+    def _structural_char(self, ch: str) -> None:
+        if ch in "{[":
+            self._stack.append(ch)
+            self._stack_keys.append(self._key if self._expect_value else None)
+            self._key = None
+            self._expect_value = False
+        elif ch in "}]":
+            if self._stack:
+                self._stack.pop()
+                self._stack_keys.pop()
+            self._key = None
+            self._expect_value = False
+        elif ch == ":":
+            self._expect_value = True
+        elif ch == ",":
+            self._key = None
+            self._expect_value = False
+        elif ch == '"':
+            self._in_string = True
+            self._string = []
+            self._capturing = self._expect_value and self._at_text_value()
+
+    def _at_text_value(self) -> bool:
+        return (
+            self._key == "value"
+            and len(self._stack) >= 2
+            and self._stack[-1] == "{"
+            and self._stack[-2] == "["
+            and self._stack_keys[-2] == "ui_blocks"
+        )
+
+    def _string_char(self, ch: str, out: list[str]) -> None:
+        if self._escape is not None:
+            self._escape_char(ch, out)
+            return
+        if ch == "\\":
+            self._escape = ""
+            return
+        if ch == '"':
+            self._end_string()
+            return
+        self._emit(ch, out)
+
+    def _escape_char(self, ch: str, out: list[str]) -> None:
+        escape = self._escape or ""
+        if not escape:
+            if ch == "u":
+                self._escape = "u"
+                return
+            self._escape = None
+            self._emit(_ESCAPES.get(ch, ch), out)
+            return
+        escape += ch
+        if len(escape) < 5:
+            self._escape = escape
+            return
+        self._escape = None
+        code = int(escape[1:], 16)
+        if 0xD800 <= code < 0xDC00:
+            self._high_surrogate = code
+            return
+        if 0xDC00 <= code < 0xE000 and self._high_surrogate is not None:
+            code = 0x10000 + ((self._high_surrogate - 0xD800) << 10) + (code - 0xDC00)
+        self._high_surrogate = None
+        self._emit(chr(code), out)
+
+    def _emit(self, text: str, out: list[str]) -> None:
+        self._string.append(text)
+        if self._capturing:
+            out.append(text)
+
+    def _end_string(self) -> None:
+        self._in_string = False
+        if self._capturing:
+            self.done = True
+            return
+        if self._expect_value:
+            self._expect_value = False
+        else:
+            self._key = "".join(self._string)
@@ -1,9 +1,16 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Any
 
-from interview.engine.conditions import _resolve_path, get_active_fields
+from interview.engine.conditions import (
+    DataView,
+    _resolve_path,
+    evaluate_conditions,
+    get_active_fields,
+)
+from interview.engine.merge import path_parts
 from interview.models.schema import FieldSchema, InterviewSchema, ValidationRule
 
 
@@ -17,13 +24,12 @@ def validate_field(value: Any, field: FieldSchema) -> list[str]:
 
 
 def _check_rule(value: Any, rule: ValidationRule) -> str | None:
-    custom = rule.message
     rtype = rule.type
     param = rule.param
 
     if rtype == "required":
         if value is None or value == "" or value == []:
-            return custom or "This field is required."
+            return rule_message(rule)
         return None
 
     # Skip further checks if value is absent (non-required)
@@ -31,34 +37,61 @@ def _check_rule(value: Any, rule: ValidationRule) -> str | None:
         return None
 
     if rtype == "min":
-        if isinstance(value, (int, float)) and value < param:
-            return custom or f"Must be at least {param}."
+        failed = isinstance(value, (int, float)) and value < param
     elif rtype == "max":
-        if isinstance(value, (int, float)) and value > param:
-            return custom or f"Must be at most {param}."
+        failed = isinstance(value, (int, float)) and value > param
     elif rtype == "min_length":
-        if isinstance(value, str) and len(value) < param:
-            return custom or f"Must be at least {param} characters."
+        failed = isinstance(value, str) and len(value) < param
     elif rtype == "max_length":
-        if isinstance(value, str) and len(value) > param:
-            return custom or f"Must be at most {param} characters."
+        failed = isinstance(value, str) and len(value) > param
+    elif rtype == "max_items":
+        failed = isinstance(value, list) and len(value) > param
     elif rtype == "pattern":
-        if isinstance(value, str) and not re.search(param, value):
-            return custom or f"Must match pattern {param}."
+        failed = isinstance(value, str) and not _pattern(param).search(value)
     elif rtype == "one_of":
-        allowed = param or []
-        if value not in allowed:
-            return custom or f"Must be one of: {', '.join(str(a) for a in allowed)}."
-    return None
+        failed = value not in (param or [])
+    else:
+        failed = False
+    return rule_message(rule) if failed else None
+
+
+def rule_message(rule: ValidationRule) -> str:
+    """The error reported when `rule` fails: its custom message or the default."""
+    if rule.message:
+        return rule.message
+    param = rule.param
+    if rule.type == "required":
+        return "This field is required."
+    if rule.type == "min":
+        return f"Must be at least {param}."
+    if rule.type == "max":
+        return f"Must be at most {param}."
+    if rule.type == "min_length":
+        return f"Must be at least {param} characters."
+    if rule.type == "max_length":
+        return f"Must be at most {param} characters."
+    if rule.type == "max_items":
+        return f"Must have at most {param} items."
+    if rule.type == "pattern":
+        return f"Must match pattern {param}."
+    return f"Must be one of: {', '.join(str(a) for a in param or [])}."
+
+
+@lru_cache(maxsize=256)
+def _pattern(param: str) -> re.Pattern[str]:
+    return re.compile(param)
 
 
 def validate_data(
     data: dict[str, Any],
     schema: InterviewSchema,
-    current_data: dict[str, Any],
+    current_data: DataView,
 ) -> dict[str, list[str]]:
     """Validate a flat dict of submitted data (binding-path → value)
-    against the active schema. Returns errors keyed by dot-path."""
+    against the active schema. Returns errors keyed by dot-path.
+
+    `current_data` decides which fields are active; pass the session's
+    DataIndex to evaluate conditions without walking the data."""
     active = get_active_fields(schema, current_data)
     errors: dict[str, list[str]] = {}
 
@@ -73,3 +106,106 @@ def validate_data(
             errors[path] = field_errors
 
     return errors
+
+
+def validate_array_indexes(
+    data: dict[str, Any],
+    schema: InterviewSchema,
+    max_items: int,
+) -> dict[str, list[str]]:
+    """Reject submitted binding paths whose array indexes are out of range.
+
+    An index must be below the array field's `max_items` rule and the
+    global `max_items` cap. Run before merging, so an oversized index never
+    allocates anything. Returns errors keyed by binding path.
+    """
+    errors: dict[str, list[str]] = {}
+    for path in data:
+        if "[" not in path:
+            continue
+        fields = schema.fields
+        field: FieldSchema | None = None
+        for part in path_parts(path):
+            if isinstance(part, str):
+                field = fields.get(part)
+                fields = field.fields if field is not None else {}
+                continue
+            limit, message = item_limit(field, max_items)
+            if part >= limit:
+                errors[path] = [
+                    message or f"Index {part} is out of range; at most {limit} items are allowed."
+                ]
+                break
+            field = field.item_schema if field is not None else None
+            fields = field.fields if field is not None else {}
+    return errors
+
+
+def item_limit(field: FieldSchema | None, cap: int) -> tuple[int, str | None]:
+    """The item limit for an array field and its custom message, if any."""
+    if field is not None:
+        for rule in field.validation:
+            if rule.type == "max_items" and rule.param is not None and rule.param < cap:
+                return rule.param, rule.message
+    return cap, None
+
+
+def field_at(schema: InterviewSchema, path: str) -> FieldSchema | None:
+    """The field a binding path addresses; array indexes step into `item_schema`."""
+    field: FieldSchema | None = None
+    fields = schema.fields
+    for part in path_parts(path):
+        if isinstance(part, int):
+            field = field.item_schema if field is not None else None
+        else:
+            field = fields.get(part)
+        if field is None:
+            return None
+        fields = field.fields
+    return field
+
+
+class ItemValidator:
+    """Validates array items one at a time against the array's `item_schema`.
+
+    Field conditions refer to absolute paths outside the item, so each is
+    evaluated once against `current_data` and reused for every item.
+    Errors are keyed by path relative to the item ("" for the item itself).
+    """
+
+    def __init__(self, item_schema: FieldSchema, current_data: DataView) -> None:
+        self.item_schema = item_schema
+        self._current_data = current_data
+        self._active: dict[int, bool] = {}
+
+    def validate(self, item: Any) -> dict[str, list[str]]:
+        errors: dict[str, list[str]] = {}
+        self._check(item, self.item_schema, "", errors)
+        return errors
+
+    def _check(
+        self, value: Any, field: FieldSchema, path: str, errors: dict[str, list[str]]
+    ) -> None:
+        if field.type == "object" and field.fields:
+            if value is not None and not isinstance(value, dict):
+                errors[path] = ["Must be an object."]
+                return
+            for name, sub in field.fields.items():
+                if self._is_active(sub):
+                    sub_path = f"{path}.{name}" if path else name
+                    self._check((value or {}).get(name), sub, sub_path, errors)
+            return
+
+        field_errors = validate_field(value, field)
+        if field_errors:
+            errors[path] = field_errors
+        if field.type == "array" and field.item_schema and isinstance(value, list):
+            for i, element in enumerate(value):
+                self._check(element, field.item_schema, f"{path}[{i}]", errors)
+
+    def _is_active(self, field: FieldSchema) -> bool:
+        active = self._active.get(id(field))
+        if active is None:
+            active = evaluate_conditions(field.conditions, self._current_data)
+            self._active[id(field)] = active
+        return active
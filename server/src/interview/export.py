@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+
+from interview.engine.conditions import lookup
+from interview.engine.schema_analyzer import compile_schema
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from interview.session.store import CompletedSession, ExportCursor, SessionStore
+
+
+class ExportNotSupportedError(Exception):
+    """The session store can't list completed sessions."""
+
+
+def encode_cursor(completed_at: datetime, session_id: str) -> str:
+    """Opaque resume token for the export position just past this session."""
+    raw = f"{completed_at.isoformat()}|{session_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> ExportCursor:
+    """Inverse of `encode_cursor`; raises ValueError for a malformed token."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+    except (binascii.Error, UnicodeDecodeError) as exc:
+        msg = "Invalid export cursor"
+        raise ValueError(msg) from exc
+    moment, sep, session_id = raw.partition("|")
+    if not sep:
+        msg = "Invalid export cursor"
+        raise ValueError(msg)
+    return _aware(datetime.fromisoformat(moment)), session_id
+
+
+def export_record(session: CompletedSession) -> dict[str, Any]:
+    """One export line: the session's data flattened to the schema's dot-paths.
+
+    Every path of `flatten_schema` is present, null when not collected, so
+    all lines for a schema have the same keys. Array fields keep their list.
+    """
+    flat = compile_schema(session.schema).flat
+    return {
+        "session_id": session.id,
+        "schema_id": session.schema_id,
+        "completed_at": session.completed_at.isoformat(),
+        "cursor": encode_cursor(session.completed_at, session.id),
+        "data": {path: lookup(session.data, path)[1] for path in flat},
+    }
+
+
+def read_completed(
+    store: SessionStore,
+    schema_id: str | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    cursor: str | None = None,
+) -> Iterator[CompletedSession]:
+    """The store's completed sessions in completion order, read lazily.
+
+    Raises ExportNotSupportedError when `store` has no `completed_sessions`
+    (see ExportableSessionStore), and ValueError for a malformed cursor.
+    """
+    completed_sessions = getattr(store, "completed_sessions", None)
+    if completed_sessions is None:
+        msg = f"{type(store).__name__} does not support export"
+        raise ExportNotSupportedError(msg)
+    return completed_sessions(  # type: ignore[no-any-return]
+        schema_id,
+        _aware(since) if since is not None else None,
+        _aware(until) if until is not None else None,
+        decode_cursor(cursor) if cursor is not None else None,
+    )
+
+
+def export_ndjson(
+    store: SessionStore,
+    schema_id: str | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    cursor: str | None = None,
+    limit: int | None = None,
+) -> Iterator[str]:
+    """Completed sessions as NDJSON lines, in completion order, generated lazily.
+
+    Pass the `cursor` of the last line received to resume after it. Errors
+    are raised up front, as for `read_completed`.
+    """
+    return _lines(read_completed(store, schema_id, since, until, cursor), limit)
+
+
+def _lines(sessions: Iterator[CompletedSession], limit: int | None) -> Iterator[str]:
+    for count, session in enumerate(sessions):
+        if limit is not None and count >= limit:
+            return
+        yield json.dumps(export_record(session), default=str) + "\n"
+
+
+def _aware(moment: datetime) -> datetime:
+    """Naive datetimes are taken to be UTC."""
+    return moment.replace(tzinfo=UTC) if moment.tzinfo is None else moment
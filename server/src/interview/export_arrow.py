@@ -0,0 +1,280 @@
+from __future__ import annotations
+
+import json
+from datetime import date, datetime
+from itertools import chain, islice
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple
+
+from interview.engine.columnar import columns
+from interview.engine.data_index import MISSING
+from interview.engine.schema_analyzer import compile_schema
+from interview.export import encode_cursor, read_completed
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator, Sequence
+    from pathlib import Path
+
+    from interview.models.schema import FieldSchema, InterviewSchema
+    from interview.session.store import CompletedSession, SessionStore
+
+try:  # pyarrow is optional; only the Arrow/Parquet export needs it
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - depends on the environment
+    pa = None
+    pq = None
+
+ArrowFormat = Literal["parquet", "arrow"]
+
+# Sessions per record batch (and Parquet row group); bounds export memory
+DEFAULT_BATCH_SIZE = 10_000
+
+_INT64_MIN, _INT64_MAX = -(2**63), 2**63 - 1
+
+
+class ArrowExport(NamedTuple):
+    """What `write_arrow` wrote; `cursor` resumes after the last row."""
+
+    rows: int
+    batches: int
+    cursor: str | None
+
+
+def _require_pyarrow() -> None:
+    if pa is None:
+        msg = "pyarrow is required for Arrow and Parquet export"
+        raise RuntimeError(msg)
+
+
+def arrow_type(field: FieldSchema, nested: bool = False) -> Any:
+    """The Arrow type for a field's values.
+
+    enum → dictionary over its options, integer → int64, date → date32,
+    array → list of its item type, object → struct. Enums inside arrays
+    and objects stay strings, so every batch shares the same dictionaries.
+    Objects without declared fields and arrays without an item schema hold
+    JSON text.
+    """
+    _require_pyarrow()
+    kind = field.type
+    if kind == "integer":
+        return pa.int64()
+    if kind == "float":
+        return pa.float64()
+    if kind == "boolean":
+        return pa.bool_()
+    if kind == "date":
+        return pa.date32()
+    if kind == "enum" and field.options and not nested:
+        return pa.dictionary(pa.int32(), pa.string())
+    if kind == "object" and field.fields:
+        return pa.struct(
+            [pa.field(name, arrow_type(child, nested=True)) for name, child in field.fields.items()]
+        )
+    if kind == "array":
+        item = field.item_schema
+        return pa.list_(arrow_type(item, nested=True) if item is not None else pa.string())
+    return pa.string()
+
+
+def arrow_schema(schema: InterviewSchema) -> Any:
+    """Export columns: session_id, schema_id, completed_at, then one column
+    per `flatten_schema` dot-path."""
+    _require_pyarrow()
+    return pa.schema(
+        [
+            pa.field("session_id", pa.string(), nullable=False),
+            pa.field("schema_id", pa.string(), nullable=False),
+            pa.field("completed_at", pa.timestamp("us", tz="UTC"), nullable=False),
+            *(
+                pa.field(path, arrow_type(field))
+                for path, field in compile_schema(schema).flat.items()
+            ),
+        ]
+    )
+
+
+class ArrowBatcher:
+    """Builds record batches of completed sessions for one schema.
+
+    Values are gathered column by column; a value that doesn't fit its
+    column's type (a string in an integer field, an unparsable date, an
+    unknown enum option) is written as null.
+    """
+
+    __slots__ = ("_columns", "schema")
+
+    def __init__(self, schema: InterviewSchema) -> None:
+        _require_pyarrow()
+        self.schema = arrow_schema(schema)
+        self._columns: list[tuple[str, Any, Callable[[Any], Any], Any]] = []
+        for path, field in compile_schema(schema).flat.items():
+            dictionary = None
+            if field.type == "enum" and field.options:
+                dictionary = pa.array([option.value for option in field.options], pa.string())
+            self._columns.append(
+                (path, self.schema.field(path).type, _converter(field), dictionary)
+            )
+
+    def batch(self, sessions: Sequence[CompletedSession]) -> Any:
+        data = columns([session.data for session in sessions], [c[0] for c in self._columns])
+        arrays = [
+            pa.array([session.id for session in sessions], pa.string()),
+            pa.array([session.schema_id for session in sessions], pa.string()),
+            pa.array([session.completed_at for session in sessions], pa.timestamp("us", tz="UTC")),
+        ]
+        for path, arrow, convert, dictionary in self._columns:
+            values = [None if value is MISSING else convert(value) for value in data[path]]
+            if dictionary is not None:
+                codes = pa.array(values, pa.int32())
+                arrays.append(pa.DictionaryArray.from_arrays(codes, dictionary))
+            else:
+                arrays.append(pa.array(values, arrow))
+        return pa.RecordBatch.from_arrays(arrays, schema=self.schema)
+
+
+def record_batches(
+    schema: InterviewSchema,
+    sessions: Iterable[CompletedSession],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Iterator[Any]:
+    """Record batches of at most `batch_size` sessions, built as `sessions` is read."""
+    batcher = ArrowBatcher(schema)
+    sessions = iter(sessions)
+    while chunk := list(islice(sessions, batch_size)):
+        yield batcher.batch(chunk)
+
+
+def write_arrow(
+    store: SessionStore,
+    path: Path,
+    schema_id: str,
+    file_format: ArrowFormat = "parquet",
+    since: datetime | None = None,
+    until: datetime | None = None,
+    cursor: str | None = None,
+    limit: int | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    schema: InterviewSchema | None = None,
+) -> ArrowExport:
+    """Write one schema's completed sessions to a Parquet or Arrow IPC file.
+
+    Sessions are read lazily and written a record batch (one Parquet row
+    group) at a time, so memory is bounded by `batch_size`. Columns follow
+    `schema`, or the first session's schema when not given. Nothing is
+    written when there are no sessions and no `schema`.
+    """
+    _require_pyarrow()
+    if file_format not in ("parquet", "arrow"):
+        msg = f"Unknown export format: {file_format}"
+        raise ValueError(msg)
+    sessions = read_completed(store, schema_id, since, until, cursor)
+    if limit is not None:
+        sessions = islice(sessions, limit)
+    first = next(sessions, None)
+    if first is None:
+        if schema is None:
+            return ArrowExport(0, 0, cursor)
+        layout = schema
+    else:
+        layout = schema if schema is not None else first.schema
+        sessions = chain([first], sessions)
+
+    rows = batches = 0
+    writer_schema = arrow_schema(layout)
+    # A plain file, not a memory map: a map needs its final size up front,
+    # and the size of a streamed export is only known once it is written
+    with pa.OSFile(str(path), "wb") as sink, _writer(sink, writer_schema, file_format) as writer:
+        for batch in record_batches(layout, sessions, batch_size):
+            writer.write_batch(batch)
+            rows += batch.num_rows
+            batches += 1
+            last_id = batch.column(0)[-1].as_py()
+            cursor = encode_cursor(batch.column(2)[-1].as_py(), last_id)
+    return ArrowExport(rows, batches, cursor)
+
+
+def read_arrow(path: Path, file_format: ArrowFormat = "parquet") -> Any:
+    """Load an exported file as a pyarrow Table.
+
+    Arrow IPC files are memory-mapped, so their columns are read without
+    copying; Parquet is decoded from a memory map.
+    """
+    _require_pyarrow()
+    if file_format == "parquet":
+        return pq.read_table(str(path), memory_map=True)
+    with pa.memory_map(str(path), "r") as source:
+        return pa.ipc.open_file(source).read_all()
+
+
+def _writer(sink: Any, schema: Any, file_format: ArrowFormat) -> Any:
+    if file_format == "parquet":
+        return pq.ParquetWriter(sink, schema)
+    return pa.ipc.new_file(sink, schema)
+
+
+def _converter(field: FieldSchema, nested: bool = False) -> Callable[[Any], Any]:
+    """Coerce a JSON value to what pyarrow expects for the field's type; None if it can't."""
+    kind = field.type
+    if kind == "integer":
+        return _to_int
+    if kind == "float":
+        return _to_float
+    if kind == "boolean":
+        return _to_bool
+    if kind == "date":
+        return _to_date
+    if kind == "enum" and field.options and not nested:
+        codes = {option.value: code for code, option in enumerate(field.options)}
+        return lambda value: codes.get(value) if isinstance(value, str) else None
+    if kind == "object" and field.fields:
+        children = {name: _converter(child, nested=True) for name, child in field.fields.items()}
+
+        def to_struct(value: Any) -> Any:
+            if not isinstance(value, dict):
+                return None
+            return {name: convert(value.get(name)) for name, convert in children.items()}
+
+        return to_struct
+    if kind == "array":
+        item = field.item_schema
+        convert_item = _converter(item, nested=True) if item is not None else _to_text
+        return lambda value: [convert_item(v) for v in value] if isinstance(value, list) else None
+    return _to_text
+
+
+def _to_int(value: Any) -> int | None:
+    if type(value) is float and value.is_integer():
+        value = int(value)
+    if type(value) is int and _INT64_MIN <= value <= _INT64_MAX:
+        return value
+    return None
+
+
+def _to_float(value: Any) -> float | None:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    return None
+
+
+def _to_bool(value: Any) -> bool | None:
+    return value if isinstance(value, bool) else None
+
+
+def _to_date(value: Any) -> date | None:
+    if not isinstance(value, str):
+        return None
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        pass
+    try:
+        return datetime.fromisoformat(value).date()
+    except ValueError:
+        return None
+
+
+def _to_text(value: Any) -> str | None:
+    if value is None or isinstance(value, str):
+        return value
+    return json.dumps(value, default=str)
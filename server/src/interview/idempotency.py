@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+from interview.singleflight import SingleFlight
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+DEFAULT_TTL_SECONDS = 600.0
+DEFAULT_MAX_ENTRIES = 10_000
+
+
+class IdempotencyKeyReusedError(Exception):
+    """The key was already used for a different request."""
+
+
+class IdempotencyCache:
+    """Replays responses for requests retried with the same Idempotency-Key.
+
+    Completed responses are kept for `ttl` seconds, up to `max_entries`
+    (oldest dropped first). A retry that arrives while the original call is
+    still running awaits that call instead of starting another. Failed calls
+    are not stored, so the client can retry them.
+
+    Each entry remembers a fingerprint of the request it answered; reusing
+    a key for a different request raises IdempotencyKeyReusedError.
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._clock = clock
+        # key -> (fingerprint, expires_at, response), oldest first
+        self._done: OrderedDict[str, tuple[str, float, Any]] = OrderedDict()
+        self._inflight: SingleFlight[Any] = SingleFlight()
+        self.replays = 0
+
+    async def run(
+        self,
+        key: str,
+        fingerprint: str,
+        compute: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Return the stored response for `key`, or compute and store it."""
+        self._expire()
+        done = self._done.get(key)
+        if done is not None:
+            _check_fingerprint(done[0], fingerprint)
+            self.replays += 1
+            return done[2]
+        inflight = self._inflight.current(key)
+        if inflight is not None:
+            _check_fingerprint(inflight.tag, fingerprint)
+            self.replays += 1
+            return await inflight.wait()
+
+        response = await self._inflight.run(key, fingerprint, compute)
+        self._done[key] = (fingerprint, self._clock() + self.ttl, response)
+        while len(self._done) > self.max_entries:
+            self._done.popitem(last=False)
+        return response
+
+    def __len__(self) -> int:
+        return len(self._done)
+
+    def _expire(self) -> None:
+        # Uniform TTL: entries expire in insertion order
+        now = self._clock()
+        while self._done:
+            key, (_, expires_at, _) = next(iter(self._done.items()))
+            if expires_at > now:
+                break
+            del self._done[key]
+
+
+def _check_fingerprint(stored: str, fingerprint: str) -> None:
+    if stored != fingerprint:
+        msg = "Idempotency-Key was already used for a different request"
+        raise IdempotencyKeyReusedError(msg)
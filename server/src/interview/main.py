@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import logging
+import multiprocessing
 from collections.abc import AsyncIterator
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import asynccontextmanager
+from pathlib import Path
 
 import dspy
 from fastapi import FastAPI, Request
@@ -14,44 +19,152 @@ from interview.cli.programs import get_default_path, load_optimized
 from interview.config import settings
 from interview.engine.dspy_modules import create_interview_step, create_text_extractor
 from interview.engine.orchestrator import InterviewOrchestrator
-from interview.session.store import InMemorySessionStore
+from interview.engine.schema_registry import SchemaRegistry
+from interview.idempotency import IdempotencyCache
+from interview.session.bounded import BoundedSessionStore
+from interview.session.events import EventSourcedSessionStore
+from interview.session.sqlite import SQLiteSessionStore
+from interview.session.store import InMemorySessionStore, SessionStore, VersionConflictError
+from interview.session.tiered import TieredSessionStore
 
 logger = logging.getLogger(__name__)
 
 
+def _module_lm(model: str, default: dspy.LM, cache: dict[str, dspy.LM]) -> dspy.LM:
+    """Return the LM for a module, sharing instances between modules using the same model."""
+    if model == settings.llm_model:
+        return default
+    if model not in cache:
+        cache[model] = dspy.LM(model)
+    return cache[model]
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     settings.validate_api_key()
     logger.info("Using LLM model: %s (provider: %s)", settings.llm_model, settings.llm_provider)
     lm = dspy.LM(settings.llm_model)
     dspy.configure(lm=lm, adapter=dspy.JSONAdapter())
+    lms: dict[str, dspy.LM] = {}
+
+    interview_step = create_interview_step(settings.interview_step_mode)
+    text_extractor = create_text_extractor(settings.text_extractor_mode)
+    fast_text_extractor = (
+        create_text_extractor(settings.text_extractor_mode)
+        if settings.text_extractor_fast_model is not None
+        else None
+    )
 
-    interview_step = create_interview_step()
-    text_extractor = create_text_extractor()
-
-    interview_step_path = get_default_path("interview_step")
+    interview_step_path = get_default_path("interview_step", settings.interview_step_mode)
     if interview_step_path.exists():
         interview_step = load_optimized(interview_step, interview_step_path)
         logger.info("Loaded optimized InterviewStep from %s", interview_step_path)
 
-    text_extractor_path = get_default_path("text_extractor")
+    text_extractor_path = get_default_path("text_extractor", settings.text_extractor_mode)
     if text_extractor_path.exists():
         text_extractor = load_optimized(text_extractor, text_extractor_path)
         logger.info("Loaded optimized TextDataExtractor from %s", text_extractor_path)
+        if fast_text_extractor is not None:
+            fast_text_extractor = load_optimized(fast_text_extractor, text_extractor_path)
+
+    # Per-module LMs are bound after loading so saved state cannot override them
+    interview_step.set_lm(_module_lm(settings.module_model("interview_step"), lm, lms))
+    text_extractor.set_lm(_module_lm(settings.module_model("text_extractor"), lm, lms))
+    logger.info(
+        "InterviewStep: %s (%s), TextDataExtractor: %s (%s)",
+        settings.interview_step_model,
+        settings.interview_step_mode,
+        settings.text_extractor_model,
+        settings.text_extractor_mode,
+    )
+    if fast_text_extractor is not None and settings.text_extractor_fast_model is not None:
+        fast_text_extractor.set_lm(_module_lm(settings.text_extractor_fast_model, lm, lms))
+        logger.info(
+            "TextDataExtractor cascade enabled with fast model: %s",
+            settings.text_extractor_fast_model,
+        )
 
-    store = InMemorySessionStore()
+    sweeper: asyncio.Task[None] | None = None
+    store: SessionStore
+    database: SQLiteSessionStore | EventSourcedSessionStore | None = None
+    event_log: EventSourcedSessionStore | None = None
+    if settings.session_event_log_path is not None:
+        event_log = EventSourcedSessionStore(settings.session_event_log_path)
+        logger.info("Event-sourced session store at %s", settings.session_event_log_path)
+        store = database = event_log
+    elif settings.session_db_path is not None:
+        database = SQLiteSessionStore(settings.session_db_path)
+        logger.info("SQLite session store at %s", settings.session_db_path)
+        store = database
+        if settings.session_cache_size > 0:
+            store = TieredSessionStore(
+                database,
+                cache_size=settings.session_cache_size,
+                route_prefix=settings.session_route_prefix,
+                revalidate_after=settings.session_cache_revalidate_seconds,
+            )
+    elif settings.session_store_bounded:
+        bounded = BoundedSessionStore(
+            max_sessions=settings.session_max_count,
+            max_bytes=settings.session_max_bytes,
+            idle_ttl=settings.session_idle_ttl_seconds,
+        )
+        if bounded.idle_ttl is not None:
+            sweeper = asyncio.create_task(bounded.run_sweeper(settings.session_sweep_seconds))
+        logger.info(
+            "Bounded session store: max %s sessions, %s bytes, idle TTL %ss",
+            bounded.max_sessions,
+            bounded.max_bytes,
+            bounded.idle_ttl,
+        )
+        store = bounded
+    else:
+        store = InMemorySessionStore()
     app.state.orchestrator = InterviewOrchestrator(
         store=store,
         interview_step=interview_step,
         text_extractor=text_extractor,
+        fast_text_extractor=fast_text_extractor,
+        event_log=event_log,
+        max_array_items=settings.max_array_items,
     )
     app.state.store = store
 
+    registry = SchemaRegistry()
+    if settings.schema_dir is not None:
+        registry.load_directory(Path(settings.schema_dir))
+        logger.info("Schema registry warmed with %d schemas", len(registry))
+    app.state.registry = registry
+
+    # Spawned rather than forked: the loop and the LM clients own threads
+    prefill_pool = (
+        ProcessPoolExecutor(
+            settings.prefill_workers, mp_context=multiprocessing.get_context("spawn")
+        )
+        if settings.prefill_workers != 0
+        else None
+    )
+    app.state.prefill_pool = prefill_pool
+
     yield
 
+    if prefill_pool is not None:
+        prefill_pool.shutdown(cancel_futures=True)
+
+    if sweeper is not None:
+        sweeper.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await sweeper
+    if database is not None:
+        database.close()
+
 
 def create_app() -> FastAPI:
     app = FastAPI(title="Conversational Interview", lifespan=lifespan)
+    app.state.idempotency = IdempotencyCache(
+        ttl=settings.idempotency_ttl_seconds,
+        max_entries=settings.idempotency_max_entries,
+    )
 
     app.add_middleware(
         CORSMiddleware,
@@ -69,6 +182,12 @@ def create_app() -> FastAPI:
             content={"detail": f"Internal server error: {type(exc).__name__}"},
         )
 
+    @app.exception_handler(VersionConflictError)
+    async def version_conflict_handler(
+        _request: Request, exc: VersionConflictError
+    ) -> JSONResponse:
+        return JSONResponse(status_code=409, content={"detail": str(exc)})
+
     app.include_router(router)
     return app
 
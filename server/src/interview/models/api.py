@@ -10,32 +10,110 @@ from interview.models.ui_blocks import UIBlock
 
 class StartRequest(BaseModel):
     schema_: InterviewSchema = Field(default=InterviewSchema(fields={}), alias="schema")
+    # Start from a registered schema instead of sending it inline
+    schema_id: str | None = None
     initial_data: dict[str, Any] = {}
+    # Delta mode: respond with a patch against `initial_data` instead of current_data
+    delta: bool = False
 
     model_config = {"populate_by_name": True}
 
 
+class RegisterSchemaRequest(BaseModel):
+    schema_: InterviewSchema = Field(alias="schema")
+    name: str | None = None
+
+    model_config = {"populate_by_name": True}
+
+
+class RegisterSchemaResponse(BaseModel):
+    schema_id: str
+    name: str | None
+    version: int
+
+
 class StartResponse(BaseModel):
     session_id: str
     blocks: list[UIBlock]
     is_complete: bool
-    current_data: dict[str, Any]
+    # Full snapshot; None when `patch` is returned instead
+    current_data: dict[str, Any] | None
+    version: int = 0
+    patch: list[dict[str, Any]] | None = None
 
 
 class SubmitRequest(BaseModel):
     type: Literal["form", "message"]
     data: dict[str, Any] | None = None
     text: str | None = None
+    # Delta mode: the last session version the client has seen
+    since_version: int | None = None
 
 
 class SubmitResponse(BaseModel):
     blocks: list[UIBlock]
     is_complete: bool
-    current_data: dict[str, Any]
+    # Full snapshot; None when `patch` is returned instead. In delta mode the
+    # server falls back to a snapshot when it can't patch from `since_version`.
+    current_data: dict[str, Any] | None
+    errors: dict[str, list[str]] = {}
+    version: int = 0
+    patch: list[dict[str, Any]] | None = None
+
+
+class ItemErrors(BaseModel):
+    """Validation errors for one item of a bulk ingestion, keyed by path within the item."""
+
+    index: int
+    errors: dict[str, list[str]]
+
+
+class IngestItemsResponse(BaseModel):
+    """Result of a bulk array-item ingestion.
+
+    All items are merged, or none: when any item fails (`item_errors`) or
+    the request itself is rejected (`errors`), `accepted` is 0.
+    """
+
+    binding: str
+    accepted: int
+    is_complete: bool
+    version: int
     errors: dict[str, list[str]] = {}
+    item_errors: list[ItemErrors] = []
+
+
+class StreamEvent(BaseModel):
+    """One Server-Sent Event from a streaming endpoint.
+
+    Events: "errors" (validation errors), "text" (TextBlock delta),
+    "form" (a parsed FormBlock) and "state" (the final Start/SubmitResponse).
+    """
+
+    event: Literal["errors", "text", "form", "state"]
+    data: dict[str, Any]
+
+
+class FieldFunnelCounts(BaseModel):
+    asked: int = 0
+    answered: int = 0
+    # Submissions or extractions of the field that failed validation
+    invalid: int = 0
+    # Answers that came from a free-text message rather than a form
+    extracted: int = 0
+
+
+class FunnelResponse(BaseModel):
+    """Per-field funnel counts for one schema, since the server started."""
+
+    schema_id: str
+    started: int
+    completed: int
+    fields: dict[str, FieldFunnelCounts]
 
 
 class StatusResponse(BaseModel):
     current_data: dict[str, Any]
     is_complete: bool
     missing_fields: list[str]
+    version: int = 0
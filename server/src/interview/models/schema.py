@@ -12,6 +12,7 @@ class ValidationRule(BaseModel):
         "max",
         "min_length",
         "max_length",
+        "max_items",
         "pattern",
         "one_of",
     ]
@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import UTC, datetime
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from interview.models.schema import InterviewSchema
 
@@ -13,12 +13,35 @@ class ConversationTurn(BaseModel):
     content: str
 
 
+# Patches kept per session for delta responses; older clients get a full snapshot
+PATCH_LOG_SIZE = 16
+
+
+class VersionedPatch(BaseModel):
+    """JSON-patch operations that produced `version` from `version - 1`."""
+
+    version: int
+    ops: list[dict[str, Any]]
+
+
 class Session(BaseModel):
     id: str
     schema_: InterviewSchema = Field(alias="schema")
+    # Canonical fingerprint of schema_; set by the store, which shares one
+    # schema object between all sessions with the same fingerprint
+    schema_id: str | None = None
     current_data: dict[str, Any] = {}
     conversation_history: list[ConversationTurn] = []
     is_complete: bool = False
+    # Bumped on every change to current_data; recent patches serve delta responses
+    version: int = 0
+    patch_log: list[VersionedPatch] = []
+    # Storage write counter, bumped by stores that check it on update
+    revision: int = 0
     created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    # When the session first became complete; exports are ordered by it
+    completed_at: datetime | None = None
+    # engine.data_index.DataIndex over current_data; never serialised
+    _data_index: Any = PrivateAttr(default=None)
 
     model_config = {"populate_by_name": True}
@@ -0,0 +1,305 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from interview.engine.data_index import DataIndex
+from interview.models.schema import InterviewSchema
+from interview.models.session import Session
+from interview.session.compact import load_compact_session
+from interview.session.store import (
+    CompletedSession,
+    ExportCursor,
+    SchemaInterner,
+    VersionConflictError,
+    load_session,
+    select_completed,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+# Rough fixed cost of a Session object and its containers, beyond its content
+SESSION_OVERHEAD_BYTES = 2048
+# Rough cost of one DataIndex entry (dict slot and path string), beyond the path
+INDEX_ENTRY_BYTES = 96
+
+EvictionCallback = Callable[[Session], None]
+
+
+def approx_session_bytes(session: Session) -> int:
+    """Approximate memory held by a session, excluding its shared schema."""
+    return _Footprint(session).total
+
+
+def _json_bytes(value: Any) -> int:
+    return len(json.dumps(value, default=str))
+
+
+def _index_bytes(session: Session) -> int:
+    """Memory held by the session's DataIndex, if one was built; values are shared."""
+    index = session._data_index
+    if not isinstance(index, DataIndex):
+        return 0
+    return sum(len(path) + INDEX_ENTRY_BYTES for path in index.values)
+
+
+class _Footprint:
+    """A session's approximate size, kept current from what each update added.
+
+    New turns are measured once. Data changes are estimated from the size of
+    the patches recorded for them (every change to current_data gets one),
+    so the data is only re-serialised once that estimate doubles; until
+    then it errs high, never low. The data's DataIndex, once built, is
+    measured with the data and grown by the same estimates.
+    """
+
+    __slots__ = ("data", "history", "index", "measured_data", "patches", "turns", "version")
+
+    def __init__(self, session: Session) -> None:
+        history = session.conversation_history
+        self.turns = len(history)
+        self.history = sum(len(turn.content) for turn in history)
+        self.version = session.version
+        self.patches = {p.version: _json_bytes(p.ops) for p in session.patch_log}
+        self.data = self.measured_data = _json_bytes(session.current_data)
+        self.index = _index_bytes(session)
+
+    @property
+    def total(self) -> int:
+        patches = sum(self.patches.values())
+        return SESSION_OVERHEAD_BYTES + self.history + patches + self.data + self.index
+
+    def advance(self, session: Session) -> bool:
+        """Account for the turns and patches added since; False if the session went back."""
+        history = session.conversation_history
+        if len(history) < self.turns or session.version < self.version:
+            return False
+        self.history += sum(len(turn.content) for turn in history[self.turns :])
+        self.turns = len(history)
+        patches: dict[int, int] = {}
+        added = 0
+        for patch in session.patch_log:
+            size = self.patches.get(patch.version)
+            if size is None:
+                size = _json_bytes(patch.ops)
+                added += size
+            patches[patch.version] = size
+        # Entries trimmed from the log drop out here
+        self.patches = patches
+        self.version = session.version
+        self.data += added
+        if self.data > 2 * self.measured_data:
+            self.data = self.measured_data = _json_bytes(session.current_data)
+            self.index = _index_bytes(session)
+        elif self.index:
+            self.index += added
+        else:
+            # Built lazily, so possibly only since the last update
+            self.index = _index_bytes(session)
+        return True
+
+
+class _Entry:
+    __slots__ = ("footprint", "last_access", "session", "size")
+
+    def __init__(self, session: Session, footprint: _Footprint, last_access: float) -> None:
+        self.session = session
+        self.footprint = footprint
+        self.size = footprint.total
+        self.last_access = last_access
+
+
+class BoundedSessionStore:
+    """In-memory session store with LRU, size and idle-TTL limits.
+
+    Sessions are kept in access order, so both the least recently used and
+    the longest idle session sit at the front: eviction and TTL expiry pop
+    from there in O(1) per session. Expired sessions are removed lazily on
+    access and by `sweep`, which `run_sweeper` calls periodically.
+
+    `on_evict` receives every evicted or expired session, e.g. to spill it
+    to a persistent store as `dump_session` bytes, which `load` restores.
+    """
+
+    def __init__(
+        self,
+        max_sessions: int | None = None,
+        max_bytes: int | None = None,
+        idle_ttl: float | None = None,
+        on_evict: EvictionCallback | None = None,
+        interner: SchemaInterner | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_sessions = max_sessions
+        self.max_bytes = max_bytes
+        self.idle_ttl = idle_ttl
+        self.on_evict = on_evict
+        self.interner = interner if interner is not None else SchemaInterner()
+        self._clock = clock
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+        self.approx_bytes = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def create(
+        self,
+        schema: InterviewSchema,
+        initial_data: dict[str, Any],
+        session_id: str | None = None,
+    ) -> Session:
+        schema_id, shared = self.interner.intern(schema)
+        session = Session(
+            id=session_id or str(uuid.uuid4()),
+            schema_=shared,
+            schema_id=schema_id,
+            current_data=initial_data,
+        )
+        self._put(session)
+        return session
+
+    def get(self, session_id: str) -> Session | None:
+        evicted: list[Session] = []
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is None:
+                return None
+            now = self._clock()
+            if self.idle_ttl is not None and now - entry.last_access > self.idle_ttl:
+                self._remove(session_id)
+                self.expirations += 1
+                evicted.append(entry.session)
+                session = None
+            else:
+                entry.last_access = now
+                self._entries.move_to_end(session_id)
+                session = entry.session
+        self._notify(evicted)
+        return session
+
+    def get_revision(self, session_id: str) -> int | None:
+        with self._lock:
+            entry = self._entries.get(session_id)
+            return None if entry is None else entry.session.revision
+
+    def update(self, session: Session) -> None:
+        self._put(session, compare_revision=True)
+
+    def load(self, payload: str | bytes, schema: InterviewSchema | None = None) -> Session:
+        """Restore a serialised session, e.g. one read back from a spill tier.
+
+        Takes `dump_session` payloads, which are read without re-validation
+        and need `schema` unless this store still interns it, as well as the
+        JSON form of a Session.
+        """
+        if isinstance(payload, str) or payload[:1] == b"{":
+            session = load_session(payload, self.interner)
+        else:
+            if schema is not None:
+                _, schema = self.interner.intern(schema)
+            session = load_compact_session(payload, self.interner, schema)
+        self._put(session)
+        return session
+
+    def sweep(self) -> int:
+        """Expire idle sessions. Returns how many were removed."""
+        if self.idle_ttl is None:
+            return 0
+        evicted: list[Session] = []
+        with self._lock:
+            deadline = self._clock() - self.idle_ttl
+            while self._entries:
+                session_id, entry = next(iter(self._entries.items()))
+                if entry.last_access > deadline:
+                    break
+                self._remove(session_id)
+                evicted.append(entry.session)
+            self.expirations += len(evicted)
+        self._notify(evicted)
+        return len(evicted)
+
+    async def run_sweeper(self, interval: float) -> None:
+        """Sweep every `interval` seconds until cancelled."""
+        while True:
+            await asyncio.sleep(interval)
+            expired = self.sweep()
+            if expired:
+                logger.info("Expired %d idle sessions", expired)
+
+    def completed_sessions(
+        self,
+        schema_id: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        after: ExportCursor | None = None,
+    ) -> Iterator[CompletedSession]:
+        """Completed sessions still held; reading them doesn't count as access."""
+        with self._lock:
+            sessions = [entry.session for entry in self._entries.values()]
+        return select_completed(sessions, schema_id, since, until, after)
+
+    def stats(self) -> dict[str, int]:
+        """Gauges for monitoring."""
+        return {
+            "sessions": len(self._entries),
+            "approx_bytes": self.approx_bytes,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _put(self, session: Session, compare_revision: bool = False) -> None:
+        evicted: list[Session] = []
+        with self._lock:
+            old = self._entries.get(session.id)
+            if compare_revision:
+                if old is not None and old.session.revision != session.revision:
+                    raise VersionConflictError(session.id)
+                session.revision += 1
+            if old is not None:
+                del self._entries[session.id]
+                self.approx_bytes -= old.size
+            if old is not None and old.footprint.advance(session):
+                footprint = old.footprint
+            else:
+                footprint = _Footprint(session)
+            entry = _Entry(session, footprint, self._clock())
+            self._entries[session.id] = entry
+            self.approx_bytes += entry.size
+            while len(self._entries) > 1 and self._over_limit():
+                session_id, entry = next(iter(self._entries.items()))
+                self._remove(session_id)
+                self.evictions += 1
+                evicted.append(entry.session)
+        self._notify(evicted)
+
+    def _over_limit(self) -> bool:
+        if self.max_sessions is not None and len(self._entries) > self.max_sessions:
+            return True
+        return self.max_bytes is not None and self.approx_bytes > self.max_bytes
+
+    def _remove(self, session_id: str) -> None:
+        entry = self._entries.pop(session_id)
+        self.approx_bytes -= entry.size
+
+    def _notify(self, evicted: list[Session]) -> None:
+        if self.on_evict is None:
+            return
+        for session in evicted:
+            try:
+                self.on_evict(session)
+            except Exception:
+                logger.exception("Eviction callback failed for session %s", session.id)
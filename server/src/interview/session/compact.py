@@ -0,0 +1,170 @@
+"""Pydantic-free session state and its binary codec, for storage.
+
+Used wherever sessions are written out: event-log snapshots
+(`session.events`), the data and patch-log columns of `session.sqlite`,
+and sessions spilled from and restored into `session.bounded`. Stores
+build the API-facing `Session` from it with `model_construct`, without
+re-validation. The orchestrator and the in-memory stores still work on
+pydantic `Session` objects.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from interview.models.schema import InterviewSchema
+from interview.models.session import ConversationTurn, Session, VersionedPatch
+from interview.session.store import SchemaInterner
+
+try:  # msgpack is optional; the JSON fallback is slower and larger
+    import msgpack
+except ImportError:  # pragma: no cover - depends on the environment
+    msgpack = None
+
+# Bumped when the packed layout changes
+FORMAT_VERSION = 1
+
+
+@dataclass(slots=True)
+class CompactTurn:
+    role: str
+    content: str
+
+
+@dataclass(slots=True)
+class CompactSession:
+    """Pydantic-free session state for storage.
+
+    Holds the schema by fingerprint only, so packed sessions stay small and
+    unpacking never re-parses a schema; the store's interner supplies the
+    shared InterviewSchema when converting back to a `Session`.
+    """
+
+    id: str
+    schema_id: str
+    current_data: dict[str, Any]
+    turns: list[CompactTurn] = field(default_factory=list)
+    is_complete: bool = False
+    version: int = 0
+    revision: int = 0
+    # (version, ops) pairs, oldest first
+    patch_log: list[tuple[int, list[dict[str, Any]]]] = field(default_factory=list)
+    # ISO 8601, as in the JSON form of Session
+    created_at: str = ""
+    completed_at: str | None = None
+
+    @classmethod
+    def from_session(cls, session: Session) -> CompactSession:
+        if session.schema_id is None:
+            msg = f"Session {session.id} has no schema_id; create it through a store"
+            raise ValueError(msg)
+        return cls(
+            id=session.id,
+            schema_id=session.schema_id,
+            current_data=session.current_data,
+            turns=[CompactTurn(t.role, t.content) for t in session.conversation_history],
+            is_complete=session.is_complete,
+            version=session.version,
+            revision=session.revision,
+            patch_log=[(p.version, p.ops) for p in session.patch_log],
+            created_at=session.created_at.isoformat(),
+            completed_at=session.completed_at.isoformat() if session.completed_at else None,
+        )
+
+    def to_session(
+        self, interner: SchemaInterner, schema: InterviewSchema | None = None
+    ) -> Session:
+        """Build the API-facing model without re-validating trusted state.
+
+        `schema` is used when given (it must be interned already); otherwise
+        the interner has to hold the schema for `schema_id`.
+        """
+        if schema is None:
+            schema = interner.get(self.schema_id)
+        if schema is None:
+            msg = f"Schema {self.schema_id} is not interned"
+            raise KeyError(msg)
+        return Session.model_construct(
+            id=self.id,
+            schema_=schema,
+            schema_id=self.schema_id,
+            current_data=self.current_data,
+            conversation_history=[
+                ConversationTurn.model_construct(role=t.role, content=t.content) for t in self.turns
+            ],
+            is_complete=self.is_complete,
+            version=self.version,
+            patch_log=[VersionedPatch.model_construct(version=v, ops=o) for v, o in self.patch_log],
+            revision=self.revision,
+            created_at=datetime.fromisoformat(self.created_at),
+            completed_at=datetime.fromisoformat(self.completed_at) if self.completed_at else None,
+        )
+
+
+def encode_value(value: dict[str, Any] | list[Any]) -> bytes:
+    """msgpack (or compact JSON without msgpack) for a JSON object or array."""
+    if msgpack is not None:
+        return msgpack.packb(value, use_bin_type=True)  # type: ignore[no-any-return]
+    return json.dumps(value, separators=(",", ":")).encode()
+
+
+def decode_value(payload: bytes | str) -> Any:
+    """Inverse of `encode_value`; reads either encoding back."""
+    # msgpack maps and arrays never start with "{" or "[", so JSON is recognisable
+    if isinstance(payload, str) or payload[:1] in (b"{", b"["):
+        return json.loads(payload)
+    if msgpack is None:
+        msg = "msgpack is required to read this payload"
+        raise RuntimeError(msg)
+    return msgpack.unpackb(payload, raw=False)
+
+
+def pack(session: CompactSession) -> bytes:
+    """Serialise as a flat array with `encode_value`."""
+    row = [
+        FORMAT_VERSION,
+        session.id,
+        session.schema_id,
+        session.current_data,
+        [[t.role, t.content] for t in session.turns],
+        session.is_complete,
+        session.version,
+        session.revision,
+        [[v, ops] for v, ops in session.patch_log],
+        session.created_at,
+        session.completed_at,
+    ]
+    return encode_value(row)
+
+
+def unpack(payload: bytes) -> CompactSession:
+    row = decode_value(payload)
+    if row[0] != FORMAT_VERSION:
+        msg = f"Unsupported session format {row[0]}"
+        raise ValueError(msg)
+    _, session_id, schema_id, data, turns, complete, version, revision, log, created, done = row
+    return CompactSession(
+        id=session_id,
+        schema_id=schema_id,
+        current_data=data,
+        turns=[CompactTurn(role, content) for role, content in turns],
+        is_complete=complete,
+        version=version,
+        revision=revision,
+        patch_log=[(v, ops) for v, ops in log],
+        created_at=created,
+        completed_at=done,
+    )
+
+
+def dump_session(session: Session) -> bytes:
+    return pack(CompactSession.from_session(session))
+
+
+def load_compact_session(
+    payload: bytes, interner: SchemaInterner, schema: InterviewSchema | None = None
+) -> Session:
+    return unpack(payload).to_session(interner, schema)
@@ -0,0 +1,367 @@
+from __future__ import annotations
+
+import contextlib
+import json
+import sqlite3
+import threading
+import uuid
+from collections import OrderedDict
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from interview.engine.patch import apply_patch_in_place
+from interview.models.schema import InterviewSchema
+from interview.models.session import PATCH_LOG_SIZE, ConversationTurn, Session, VersionedPatch
+from interview.session.compact import dump_session, unpack
+from interview.session.store import (
+    COMPLETED,
+    FORM_SUBMITTED,
+    ITEMS_INGESTED,
+    MESSAGE_EXTRACTED,
+    SESSION_CREATED,
+    STEP_GENERATED,
+    CompletedSession,
+    ExportCursor,
+    SchemaInterner,
+    VersionConflictError,
+    timestamp_key,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+# Events between snapshots; a rebuild replays at most this many
+DEFAULT_SNAPSHOT_INTERVAL = 20
+# Sessions kept in memory; older ones are rebuilt from the log when needed
+DEFAULT_CACHE_SIZE = 1024
+
+_DDL = (
+    """CREATE TABLE IF NOT EXISTS schemas (
+        schema_id TEXT PRIMARY KEY,
+        body TEXT NOT NULL
+    )""",
+    """CREATE TABLE IF NOT EXISTS events (
+        session_id TEXT NOT NULL,
+        seq INTEGER NOT NULL,
+        type TEXT NOT NULL,
+        payload TEXT NOT NULL,
+        at TEXT NOT NULL,
+        PRIMARY KEY (session_id, seq)
+    ) WITHOUT ROWID""",
+    """CREATE TABLE IF NOT EXISTS snapshots (
+        session_id TEXT PRIMARY KEY,
+        seq INTEGER NOT NULL,
+        state BLOB NOT NULL
+    )""",
+    "CREATE INDEX IF NOT EXISTS events_by_type ON events (type, at, session_id)",
+)
+
+_INSERT_SCHEMA = "INSERT OR IGNORE INTO schemas (schema_id, body) VALUES (?, ?)"
+_SELECT_SCHEMA = "SELECT body FROM schemas WHERE schema_id = ?"
+_INSERT_EVENT = "INSERT INTO events (session_id, seq, type, payload, at) VALUES (?, ?, ?, ?, ?)"
+_SELECT_EVENTS = (
+    "SELECT seq, type, payload, at FROM events WHERE session_id = ? AND seq > ? ORDER BY seq"
+)
+_SELECT_LAST_SEQ = "SELECT MAX(seq) FROM events WHERE session_id = ?"
+_UPSERT_SNAPSHOT = (
+    "INSERT INTO snapshots (session_id, seq, state) VALUES (?, ?, ?) "
+    "ON CONFLICT(session_id) DO UPDATE SET seq = excluded.seq, state = excluded.state"
+)
+_SELECT_SNAPSHOT = "SELECT seq, state FROM snapshots WHERE session_id = ?"
+_SELECT_SNAPSHOT_SEQ = "SELECT seq FROM snapshots WHERE session_id = ?"
+# Keyset page of completion events; the schema filter reads the session-created event
+_SELECT_COMPLETED = (
+    "SELECT e.session_id, e.at FROM events e "
+    "WHERE e.type = ? AND (e.at, e.session_id) > (?, ?) AND (? IS NULL OR e.at < ?) "
+    "AND (? IS NULL OR EXISTS (SELECT 1 FROM events c WHERE c.session_id = e.session_id "
+    "AND c.seq = 1 AND json_extract(c.payload, '$.schema_id') = ?)) "
+    "ORDER BY e.at, e.session_id LIMIT ?"
+)
+# Sessions read per query when exporting
+EXPORT_PAGE_SIZE = 500
+
+
+class SessionEvent(NamedTuple):
+    seq: int
+    type: str
+    payload: dict[str, Any]
+    at: datetime
+
+
+def apply_event(session: Session, event_type: str, payload: dict[str, Any]) -> None:
+    """Replay one event onto a session being rebuilt, as the orchestrator applied it."""
+    if event_type == FORM_SUBMITTED:
+        _apply_ops(session, payload["ops"])
+        session.conversation_history.append(
+            ConversationTurn(role="user", content=json.dumps(payload["data"]))
+        )
+    elif event_type == ITEMS_INGESTED:
+        _apply_ops(session, payload["ops"])
+    elif event_type == MESSAGE_EXTRACTED:
+        _apply_ops(session, payload["ops"])
+        session.conversation_history.append(ConversationTurn(role="user", content=payload["text"]))
+        if payload["extracted"]:
+            session.conversation_history.append(
+                ConversationTurn(
+                    role="system",
+                    content=f"Extracted from message: {json.dumps(payload['extracted'])}",
+                )
+            )
+    elif event_type == STEP_GENERATED:
+        session.conversation_history.append(
+            ConversationTurn(role="assistant", content=json.dumps(payload["blocks"]))
+        )
+    elif event_type == COMPLETED:
+        session.is_complete = True
+        if "at" in payload:
+            session.completed_at = datetime.fromisoformat(payload["at"])
+
+
+def _apply_ops(session: Session, ops: list[dict[str, Any]]) -> None:
+    if not ops:
+        return
+    # The session is being rebuilt and owns its data; no copy per event
+    session.current_data = apply_patch_in_place(session.current_data, ops)
+    session.version += 1
+    session.patch_log.append(VersionedPatch(version=session.version, ops=ops))
+    del session.patch_log[:-PATCH_LOG_SIZE]
+
+
+class EventSourcedSessionStore:
+    """Session store whose durable state is an append-only event log.
+
+    The orchestrator records form-submitted, items-ingested, message-extracted,
+    step-generated and completed events as a turn progresses (pass this
+    store as its `event_log`); each is one small insert into a SQLite log.
+    Every `snapshot_interval` events the full session state is snapshotted,
+    so a session is rebuilt from its latest snapshot plus the events after
+    it. The `cache_size` most recently used sessions are also kept in memory
+    and served from there; the log is read for any other session, after a
+    restart, and via `rebuild`/`events`.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        snapshot_interval: int = DEFAULT_SNAPSHOT_INTERVAL,
+        interner: SchemaInterner | None = None,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ) -> None:
+        self.path = str(path)
+        self.snapshot_interval = snapshot_interval
+        self.cache_size = cache_size
+        self.interner = interner if interner is not None else SchemaInterner()
+        self._conn = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        for ddl in _DDL:
+            self._conn.execute(ddl)
+        self._lock = threading.Lock()
+        # Cached sessions in access order; the seq maps cover only these
+        self._sessions: OrderedDict[str, Session] = OrderedDict()
+        # Per session: last event seq and seq of the last snapshot
+        self._seq: dict[str, int] = {}
+        self._snapshot_seq: dict[str, int] = {}
+
+    def create(
+        self,
+        schema: InterviewSchema,
+        initial_data: dict[str, Any],
+        session_id: str | None = None,
+    ) -> Session:
+        schema_id, shared = self.interner.intern(schema)
+        session = Session(
+            id=session_id or str(uuid.uuid4()),
+            schema_=shared,
+            schema_id=schema_id,
+            current_data=initial_data,
+        )
+        with self._lock:
+            self._conn.execute(_INSERT_SCHEMA, (schema_id, shared.model_dump_json()))
+            self._remember(session, 0, 0)
+        self.record(
+            session.id,
+            SESSION_CREATED,
+            {
+                "schema_id": schema_id,
+                "initial_data": initial_data,
+                "at": session.created_at.isoformat(),
+            },
+        )
+        return session
+
+    def get(self, session_id: str) -> Session | None:
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is not None:
+                self._sessions.move_to_end(session_id)
+                return session
+        rebuilt = self._rebuild(session_id)
+        if rebuilt is None:
+            return None
+        with self._lock:
+            # Another caller may have cached it meanwhile; serve one object
+            cached = self._sessions.get(session_id)
+            if cached is not None:
+                return cached
+            self._remember(*rebuilt)
+        return rebuilt[0]
+
+    def get_revision(self, session_id: str) -> int | None:
+        session = self.get(session_id)
+        return None if session is None else session.revision
+
+    def update(self, session: Session) -> None:
+        with self._lock:
+            stored = self._sessions.get(session.id)
+            if stored is not None and stored.revision != session.revision:
+                raise VersionConflictError(session.id)
+            session.revision += 1
+            if stored is None:
+                seq, snapshot_seq = self._last_seq(session.id), self._last_snapshot_seq(session.id)
+            else:
+                seq, snapshot_seq = self._seq[session.id], self._snapshot_seq[session.id]
+            self._remember(session, seq, snapshot_seq)
+        if seq - snapshot_seq >= self.snapshot_interval:
+            self.snapshot(session)
+
+    def record(self, session_id: str, event_type: str, payload: dict[str, Any]) -> None:
+        """Append an event to the session's log."""
+        body = json.dumps(payload)
+        with self._lock:
+            seq = self._next_seq(session_id)
+            self._conn.execute(
+                _INSERT_EVENT, (session_id, seq, event_type, body, timestamp_key(datetime.now(UTC)))
+            )
+
+    def snapshot(self, session: Session) -> None:
+        """Store the session state as of its latest event."""
+        state = dump_session(session)
+        with self._lock:
+            seq = self._seq.get(session.id)
+            if seq is None:
+                seq = self._last_seq(session.id)
+            self._conn.execute(_UPSERT_SNAPSHOT, (session.id, seq, state))
+            if session.id in self._snapshot_seq:
+                self._snapshot_seq[session.id] = seq
+
+    def events(self, session_id: str, after: int = 0) -> Iterator[SessionEvent]:
+        """The session's events after sequence number `after`, for replay and debugging."""
+        with self._lock:
+            rows = self._conn.execute(_SELECT_EVENTS, (session_id, after)).fetchall()
+        for seq, event_type, payload, at in rows:
+            yield SessionEvent(seq, event_type, json.loads(payload), datetime.fromisoformat(at))
+
+    def rebuild(self, session_id: str) -> Session | None:
+        """Reconstruct a session from its latest snapshot and the events after it."""
+        rebuilt = self._rebuild(session_id)
+        return None if rebuilt is None else rebuilt[0]
+
+    def _rebuild(self, session_id: str) -> tuple[Session, int, int] | None:
+        """The rebuilt session with its last event seq and snapshot seq."""
+        with self._lock:
+            row = self._conn.execute(_SELECT_SNAPSHOT, (session_id,)).fetchone()
+        session: Session | None = None
+        after = snapshot_seq = 0
+        if row is not None:
+            after, state = row
+            snapshot_seq = after
+            compact = unpack(state)
+            # Held here: the interner's entries are weak and to_session looks it up
+            schema = self._schema(compact.schema_id)
+            session = compact.to_session(self.interner)
+            session.schema_ = schema
+        for event in self.events(session_id, after):
+            if event.type == SESSION_CREATED:
+                session = Session(
+                    id=session_id,
+                    schema_=self._schema(event.payload["schema_id"]),
+                    schema_id=event.payload["schema_id"],
+                    current_data=event.payload["initial_data"],
+                    created_at=datetime.fromisoformat(event.payload["at"]),
+                )
+            elif session is not None:
+                apply_event(session, event.type, event.payload)
+            after = event.seq
+        return None if session is None else (session, after, snapshot_seq)
+
+    def completed_sessions(
+        self,
+        schema_id: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        after: ExportCursor | None = None,
+        page_size: int = EXPORT_PAGE_SIZE,
+    ) -> Iterator[CompletedSession]:
+        """Completed sessions ordered by their completed event, a page at a time.
+
+        Sessions that aren't cached are rebuilt one by one and not kept, so
+        an export doesn't load the whole log into memory.
+        """
+        key = ("", "") if after is None else (timestamp_key(after[0]), after[1])
+        if since is not None:
+            key = max(key, (timestamp_key(since), ""))
+        end = timestamp_key(until) if until is not None else None
+        while True:
+            params = (COMPLETED, *key, end, end, schema_id, schema_id, page_size)
+            with self._lock:
+                rows = self._conn.execute(_SELECT_COMPLETED, params).fetchall()
+            for session_id, at in rows:
+                with self._lock:
+                    session = self._sessions.get(session_id)
+                if session is None:
+                    session = self.rebuild(session_id)
+                if session is not None and session.schema_id is not None:
+                    yield CompletedSession(
+                        session_id,
+                        session.schema_id,
+                        session.schema_,
+                        datetime.fromisoformat(at),
+                        session.current_data,
+                    )
+            if len(rows) < page_size:
+                return
+            key = (rows[-1][1], rows[-1][0])
+
+    def stats(self) -> dict[str, int]:
+        return {"cached_sessions": len(self._sessions)}
+
+    def close(self) -> None:
+        with contextlib.suppress(sqlite3.Error):
+            self._conn.close()
+
+    def _remember(self, session: Session, seq: int, snapshot_seq: int) -> None:
+        """Cache a session as most recently used, evicting the least. Call under the lock."""
+        self._sessions[session.id] = session
+        self._sessions.move_to_end(session.id)
+        self._seq[session.id] = seq
+        self._snapshot_seq[session.id] = snapshot_seq
+        while len(self._sessions) > self.cache_size:
+            evicted, _ = self._sessions.popitem(last=False)
+            del self._seq[evicted]
+            del self._snapshot_seq[evicted]
+
+    def _next_seq(self, session_id: str) -> int:
+        seq = self._seq.get(session_id)
+        if seq is None:
+            seq = self._last_seq(session_id)
+        if session_id in self._sessions:
+            self._seq[session_id] = seq + 1
+        return seq + 1
+
+    def _last_seq(self, session_id: str) -> int:
+        (last,) = self._conn.execute(_SELECT_LAST_SEQ, (session_id,)).fetchone()
+        return last or 0
+
+    def _last_snapshot_seq(self, session_id: str) -> int:
+        row = self._conn.execute(_SELECT_SNAPSHOT_SEQ, (session_id,)).fetchone()
+        return row[0] if row is not None else 0
+
+    def _schema(self, schema_id: str) -> InterviewSchema:
+        schema = self.interner.get(schema_id)
+        if schema is None:
+            with self._lock:
+                (body,) = self._conn.execute(_SELECT_SCHEMA, (schema_id,)).fetchone()
+            _, schema = self.interner.intern(InterviewSchema.model_validate_json(body))
+        return schema
@@ -0,0 +1,339 @@
+from __future__ import annotations
+
+import contextlib
+import queue
+import sqlite3
+import uuid
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from interview.models.schema import InterviewSchema
+from interview.models.session import Session
+from interview.session.compact import CompactSession, CompactTurn, decode_value, encode_value
+from interview.session.store import (
+    CompletedSession,
+    ExportCursor,
+    SchemaInterner,
+    VersionConflictError,
+    timestamp_key,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+# Connections per store; each request borrows one for the duration of a call
+DEFAULT_POOL_SIZE = 4
+BUSY_TIMEOUT_MS = 5000
+
+_SCHEMA_DDL = (
+    """CREATE TABLE IF NOT EXISTS schemas (
+        schema_id TEXT PRIMARY KEY,
+        body TEXT NOT NULL
+    )""",
+    """CREATE TABLE IF NOT EXISTS sessions (
+        id TEXT PRIMARY KEY,
+        schema_id TEXT NOT NULL REFERENCES schemas(schema_id),
+        current_data BLOB NOT NULL,
+        is_complete INTEGER NOT NULL DEFAULT 0,
+        version INTEGER NOT NULL DEFAULT 0,
+        patch_log BLOB NOT NULL DEFAULT '[]',
+        turn_count INTEGER NOT NULL DEFAULT 0,
+        revision INTEGER NOT NULL DEFAULT 0,
+        created_at TEXT NOT NULL,
+        completed_at TEXT
+    )""",
+    """CREATE TABLE IF NOT EXISTS turns (
+        session_id TEXT NOT NULL REFERENCES sessions(id),
+        seq INTEGER NOT NULL,
+        role TEXT NOT NULL,
+        content TEXT NOT NULL,
+        PRIMARY KEY (session_id, seq)
+    ) WITHOUT ROWID""",
+    "CREATE INDEX IF NOT EXISTS sessions_completed ON sessions (completed_at, id) "
+    "WHERE completed_at IS NOT NULL",
+)
+# Sessions read per query when exporting
+EXPORT_PAGE_SIZE = 500
+
+# Statements are module constants so sqlite3's per-connection statement
+# cache prepares each one once per connection
+_INSERT_SCHEMA = "INSERT OR IGNORE INTO schemas (schema_id, body) VALUES (?, ?)"
+_SELECT_SCHEMA = "SELECT body FROM schemas WHERE schema_id = ?"
+_INSERT_SESSION = (
+    "INSERT INTO sessions (id, schema_id, current_data, created_at) VALUES (?, ?, ?, ?)"
+)
+_INSERT_FULL_SESSION = (
+    "INSERT INTO sessions (id, schema_id, created_at, is_complete, completed_at, turn_count, "
+    "revision, version, patch_log, current_data) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+_SELECT_SESSION = (
+    "SELECT schema_id, current_data, is_complete, version, patch_log, revision, created_at, "
+    "completed_at FROM sessions WHERE id = ?"
+)
+_SELECT_REVISION = "SELECT revision FROM sessions WHERE id = ?"
+_SELECT_TURNS = "SELECT role, content FROM turns WHERE session_id = ? ORDER BY seq"
+_SELECT_WRITE_STATE = "SELECT version, turn_count, revision FROM sessions WHERE id = ?"
+_UPDATE_STATE = (
+    "UPDATE sessions SET is_complete = ?, completed_at = ?, turn_count = ?, revision = ? "
+    "WHERE id = ?"
+)
+_UPDATE_STATE_AND_DATA = (
+    "UPDATE sessions SET is_complete = ?, completed_at = ?, turn_count = ?, revision = ?, "
+    "version = ?, patch_log = ?, current_data = ? WHERE id = ?"
+)
+# Keyset page of completed sessions; optional filters are bound as NULL when unused
+_SELECT_COMPLETED = (
+    "SELECT id, schema_id, completed_at, current_data FROM sessions "
+    "WHERE completed_at IS NOT NULL AND (completed_at, id) > (?, ?) "
+    "AND (? IS NULL OR schema_id = ?) AND (? IS NULL OR completed_at < ?) "
+    "ORDER BY completed_at, id LIMIT ?"
+)
+_INSERT_TURN = "INSERT INTO turns (session_id, seq, role, content) VALUES (?, ?, ?, ?)"
+
+
+class SQLiteSessionStore:
+    """SessionStore backed by a SQLite database in WAL mode.
+
+    Sessions live in one row each (data and state); turns go to an
+    append-only table. `update` writes the turns past the stored count and
+    the small state columns; data and patch log are only encoded and
+    written when `session.version` (bumped on every data change) differs
+    from the stored one, so a turn that changes data still rewrites the
+    whole data column. Data and patch log use the compact codec
+    (`session.compact`, msgpack when installed; JSON columns written by
+    older versions still load) and are read back through `CompactSession`,
+    so loading a session doesn't re-validate it.
+    Schemas are stored once per fingerprint and interned on load.
+
+    Writes are optimistic: `update` raises VersionConflictError unless the
+    stored revision still equals `session.revision`, then bumps both.
+
+    Safe to share between threads and between processes on the same file.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        interner: SchemaInterner | None = None,
+    ) -> None:
+        self.path = str(path)
+        self.interner = interner if interner is not None else SchemaInterner()
+        self._pool: queue.Queue[sqlite3.Connection] = queue.Queue()
+        for _ in range(pool_size):
+            self._pool.put(self._connect())
+        with self._connection() as conn:
+            for ddl in _SCHEMA_DDL:
+                conn.execute(ddl)
+
+    def _connect(self) -> sqlite3.Connection:
+        # isolation_level=None: transactions are explicit (BEGIN IMMEDIATE below)
+        conn = sqlite3.connect(
+            self.path,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=64,
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}")
+        return conn
+
+    @contextlib.contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        conn = self._pool.get()
+        try:
+            yield conn
+        finally:
+            self._pool.put(conn)
+
+    @contextlib.contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        # IMMEDIATE takes the write lock up front, so concurrent writers queue
+        # on busy_timeout instead of failing on a read-to-write upgrade
+        with self._connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def create(
+        self,
+        schema: InterviewSchema,
+        initial_data: dict[str, Any],
+        session_id: str | None = None,
+    ) -> Session:
+        schema_id, shared = self.interner.intern(schema)
+        session = Session(
+            id=session_id or str(uuid.uuid4()),
+            schema_=shared,
+            schema_id=schema_id,
+            current_data=initial_data,
+        )
+        with self._transaction() as conn:
+            conn.execute(_INSERT_SCHEMA, (schema_id, shared.model_dump_json()))
+            conn.execute(
+                _INSERT_SESSION,
+                (
+                    session.id,
+                    schema_id,
+                    encode_value(session.current_data),
+                    session.created_at.isoformat(),
+                ),
+            )
+        return session
+
+    def get(self, session_id: str) -> Session | None:
+        with self._connection() as conn:
+            row = conn.execute(_SELECT_SESSION, (session_id,)).fetchone()
+            if row is None:
+                return None
+            schema_id, data, is_complete, version, patch_log, revision, created_at, completed = row
+            schema = self._schema(conn, schema_id)
+            turns = conn.execute(_SELECT_TURNS, (session_id,)).fetchall()
+        compact = CompactSession(
+            id=session_id,
+            schema_id=schema_id,
+            current_data=decode_value(data),
+            turns=[CompactTurn(role, content) for role, content in turns],
+            is_complete=bool(is_complete),
+            version=version,
+            revision=revision,
+            patch_log=_decode_patch_log(patch_log),
+            created_at=created_at,
+            completed_at=completed,
+        )
+        return compact.to_session(self.interner, schema)
+
+    def get_revision(self, session_id: str) -> int | None:
+        with self._connection() as conn:
+            row = conn.execute(_SELECT_REVISION, (session_id,)).fetchone()
+        return None if row is None else int(row[0])
+
+    def update(self, session: Session) -> None:
+        turns = session.conversation_history
+        revision = session.revision + 1
+        with self._transaction() as conn:
+            row = conn.execute(_SELECT_WRITE_STATE, (session.id,)).fetchone()
+            if row is None:
+                self._insert_full(conn, session, revision)
+            else:
+                stored_version, stored_turns, stored_revision = row
+                if stored_revision != session.revision:
+                    raise VersionConflictError(session.id)
+                state = (*_completion(session), len(turns), revision)
+                if stored_version == session.version:
+                    conn.execute(_UPDATE_STATE, (*state, session.id))
+                else:
+                    conn.execute(
+                        _UPDATE_STATE_AND_DATA,
+                        (*state, *_data_columns(session), session.id),
+                    )
+                conn.executemany(
+                    _INSERT_TURN,
+                    [
+                        (session.id, seq, turns[seq].role, turns[seq].content)
+                        for seq in range(stored_turns, len(turns))
+                    ],
+                )
+        session.revision = revision
+
+    def completed_sessions(
+        self,
+        schema_id: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        after: ExportCursor | None = None,
+        page_size: int = EXPORT_PAGE_SIZE,
+    ) -> Iterator[CompletedSession]:
+        """Completed sessions in (completed_at, id) order, a page at a time.
+
+        Each page is a separate indexed query resuming after the last row of
+        the previous one, so memory holds one page and no read transaction
+        stays open while the caller consumes the rows.
+        """
+        key = ("", "") if after is None else (timestamp_key(after[0]), after[1])
+        if since is not None:
+            key = max(key, (timestamp_key(since), ""))
+        end = timestamp_key(until) if until is not None else None
+        while True:
+            with self._connection() as conn:
+                rows = conn.execute(
+                    _SELECT_COMPLETED, (*key, schema_id, schema_id, end, end, page_size)
+                ).fetchall()
+                schemas = {sid: self._schema(conn, sid) for sid in {row[1] for row in rows}}
+            for session_id, session_schema_id, completed_at, data in rows:
+                yield CompletedSession(
+                    session_id,
+                    session_schema_id,
+                    schemas[session_schema_id],
+                    datetime.fromisoformat(completed_at),
+                    decode_value(data),
+                )
+            if len(rows) < page_size:
+                return
+            key = (rows[-1][2], rows[-1][0])
+
+    def close(self) -> None:
+        while not self._pool.empty():
+            self._pool.get_nowait().close()
+
+    def stats(self) -> dict[str, int]:
+        with self._connection() as conn:
+            (sessions,) = conn.execute("SELECT COUNT(*) FROM sessions").fetchone()
+        return {"sessions": sessions, "schemas": len(self.interner)}
+
+    def _schema(self, conn: sqlite3.Connection, schema_id: str) -> InterviewSchema:
+        schema = self.interner.get(schema_id)
+        if schema is None:
+            (body,) = conn.execute(_SELECT_SCHEMA, (schema_id,)).fetchone()
+            _, schema = self.interner.intern(InterviewSchema.model_validate_json(body))
+        return schema
+
+    def _insert_full(self, conn: sqlite3.Connection, session: Session, revision: int) -> None:
+        """Insert a session that isn't in the database yet (e.g. created elsewhere)."""
+        schema_id, _ = self.interner.intern(session.schema_)
+        conn.execute(_INSERT_SCHEMA, (schema_id, session.schema_.model_dump_json()))
+        conn.execute(
+            _INSERT_FULL_SESSION,
+            (
+                session.id,
+                schema_id,
+                session.created_at.isoformat(),
+                *_completion(session),
+                len(session.conversation_history),
+                revision,
+                *_data_columns(session),
+            ),
+        )
+        conn.executemany(
+            _INSERT_TURN,
+            [
+                (session.id, seq, turn.role, turn.content)
+                for seq, turn in enumerate(session.conversation_history)
+            ],
+        )
+
+
+def _data_columns(session: Session) -> tuple[int, bytes, bytes]:
+    """The version, patch_log and current_data column values."""
+    patch_log = encode_value([[p.version, p.ops] for p in session.patch_log])
+    return session.version, patch_log, encode_value(session.current_data)
+
+
+def _decode_patch_log(payload: bytes | str) -> list[tuple[int, list[dict[str, Any]]]]:
+    # Older rows hold JSON objects ({"version", "ops"}) rather than pairs
+    return [
+        (p["version"], p["ops"]) if isinstance(p, dict) else (p[0], p[1])
+        for p in decode_value(payload)
+    ]
+
+
+def _completion(session: Session) -> tuple[int, str | None]:
+    """The is_complete and completed_at column values."""
+    completed_at = session.completed_at
+    return int(session.is_complete), timestamp_key(completed_at) if completed_at else None
@@ -1,36 +1,227 @@
 from __future__ import annotations
 
 import uuid
-from typing import Any, Protocol
+import weakref
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any, NamedTuple, Protocol
 
+from interview.engine.schema_registry import schema_fingerprint
 from interview.models.schema import InterviewSchema
 from interview.models.session import Session
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
 
 class SessionStore(Protocol):
-    def create(self, schema: InterviewSchema, initial_data: dict[str, Any]) -> Session: ...
+    def create(
+        self,
+        schema: InterviewSchema,
+        initial_data: dict[str, Any],
+        session_id: str | None = None,
+    ) -> Session: ...
 
     def get(self, session_id: str) -> Session | None: ...
 
-    def update(self, session: Session) -> None: ...
+    def update(self, session: Session) -> None:
+        """Persist the session.
 
+        Compare-and-swap on `session.revision`: raises VersionConflictError
+        if the stored revision differs (another writer got there first),
+        otherwise stores the session and increments its revision.
+        """
+        ...
+
+
+class RevisionedSessionStore(SessionStore, Protocol):
+    """A store that can report a session's revision without loading it."""
+
+    def get_revision(self, session_id: str) -> int | None: ...
+
+
+class CompletedSession(NamedTuple):
+    """The collected data of a completed session, as read for export."""
+
+    id: str
+    schema_id: str
+    schema: InterviewSchema
+    completed_at: datetime
+    data: dict[str, Any]
+
+
+# Export position: (completed_at, id) of the last session read
+ExportCursor = tuple[datetime, str]
+
+
+class ExportableSessionStore(SessionStore, Protocol):
+    """A store that can list its completed sessions in completion order."""
+
+    def completed_sessions(
+        self,
+        schema_id: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        after: ExportCursor | None = None,
+    ) -> Iterator[CompletedSession]:
+        """Completed sessions ordered by (completed_at, id), read lazily.
+
+        `since` is inclusive and `until` exclusive; `after` resumes strictly
+        past a previously read position.
+        """
+        ...
+
+
+def timestamp_key(moment: datetime) -> str:
+    """UTC ISO 8601 with fixed-width microseconds, so string order is time order.
+
+    Naive datetimes are taken to be UTC.
+    """
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=UTC)
+    return moment.astimezone(UTC).isoformat(timespec="microseconds")
+
+
+def select_completed(
+    sessions: Iterable[Session],
+    schema_id: str | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    after: ExportCursor | None = None,
+) -> Iterator[CompletedSession]:
+    """`completed_sessions` over sessions held in memory."""
+    selected: list[tuple[datetime, str, str, Session]] = []
+    for session in sessions:
+        completed_at, session_schema_id = session.completed_at, session.schema_id
+        if completed_at is None or session_schema_id is None:
+            continue
+        if schema_id is not None and session_schema_id != schema_id:
+            continue
+        if (since is not None and completed_at < since) or (
+            until is not None and completed_at >= until
+        ):
+            continue
+        if after is not None and (completed_at, session.id) <= after:
+            continue
+        selected.append((completed_at, session.id, session_schema_id, session))
+    selected.sort(key=lambda row: (row[0], row[1]))
+    for completed_at, session_id, session_schema_id, session in selected:
+        yield CompletedSession(
+            session_id, session_schema_id, session.schema_, completed_at, session.current_data
+        )
+
+
+SESSION_CREATED = "session-created"
+FORM_SUBMITTED = "form-submitted"
+ITEMS_INGESTED = "items-ingested"
+MESSAGE_EXTRACTED = "message-extracted"
+STEP_GENERATED = "step-generated"
+COMPLETED = "completed"
+
+
+class SessionEventRecorder(Protocol):
+    def record(self, session_id: str, event_type: str, payload: dict[str, Any]) -> None: ...
+
+
+class VersionConflictError(Exception):
+    """The session was written elsewhere after it was read."""
+
+    def __init__(self, session_id: str) -> None:
+        super().__init__(f"Session {session_id} was modified concurrently")
+        self.session_id = session_id
+
+
+class SchemaInterner:
+    """Deduplicates schemas by canonical fingerprint.
+
+    Equal schemas resolve to one shared object, so N sessions on the same
+    schema hold N references instead of N model trees. Schemas that are
+    already interned (e.g. registered ones) skip fingerprinting. Entries are
+    weak: a schema is released once no session (or registry) holds it.
+    """
 
-class InMemorySessionStore:
     def __init__(self) -> None:
+        self._by_fingerprint: weakref.WeakValueDictionary[str, InterviewSchema] = (
+            weakref.WeakValueDictionary()
+        )
+        # id() of live interned objects; each entry is dropped when its object dies
+        self._fingerprint_of: dict[int, str] = {}
+
+    def intern(self, schema: InterviewSchema) -> tuple[str, InterviewSchema]:
+        """Return the schema's fingerprint and the shared instance for it."""
+        fingerprint = self._fingerprint_of.get(id(schema))
+        if fingerprint is not None:
+            return fingerprint, schema
+        fingerprint = schema_fingerprint(schema)
+        shared = self._by_fingerprint.get(fingerprint)
+        if shared is None:
+            shared = self._by_fingerprint[fingerprint] = schema
+            self._fingerprint_of[id(schema)] = fingerprint
+            weakref.finalize(schema, self._fingerprint_of.pop, id(schema), None)
+        return fingerprint, shared
+
+    def get(self, fingerprint: str) -> InterviewSchema | None:
+        return self._by_fingerprint.get(fingerprint)
+
+    def __len__(self) -> int:
+        return len(self._by_fingerprint)
+
+
+def load_session(payload: str | bytes, interner: SchemaInterner) -> Session:
+    """Deserialise a session, replacing its schema with the interned instance."""
+    session = Session.model_validate_json(payload)
+    session.schema_id, session.schema_ = interner.intern(session.schema_)
+    return session
+
+
+class InMemorySessionStore:
+    def __init__(self, interner: SchemaInterner | None = None) -> None:
         self._sessions: dict[str, Session] = {}
+        self.interner = interner if interner is not None else SchemaInterner()
 
-    def create(self, schema: InterviewSchema, initial_data: dict[str, Any]) -> Session:
-        session_id = str(uuid.uuid4())
+    def create(
+        self,
+        schema: InterviewSchema,
+        initial_data: dict[str, Any],
+        session_id: str | None = None,
+    ) -> Session:
+        schema_id, shared = self.interner.intern(schema)
         session = Session(
-            id=session_id,
-            schema_=schema,
+            id=session_id or str(uuid.uuid4()),
+            schema_=shared,
+            schema_id=schema_id,
             current_data=initial_data,
         )
-        self._sessions[session_id] = session
+        self._sessions[session.id] = session
         return session
 
     def get(self, session_id: str) -> Session | None:
         return self._sessions.get(session_id)
 
+    def get_revision(self, session_id: str) -> int | None:
+        session = self._sessions.get(session_id)
+        return None if session is None else session.revision
+
     def update(self, session: Session) -> None:
+        stored = self._sessions.get(session.id)
+        if stored is not None and stored.revision != session.revision:
+            raise VersionConflictError(session.id)
+        session.revision += 1
         self._sessions[session.id] = session
+
+    def load(self, payload: str | bytes) -> Session:
+        """Restore a serialised session (e.g. from `Session.model_dump_json`)."""
+        session = load_session(payload, self.interner)
+        self._sessions[session.id] = session
+        return session
+
+    def completed_sessions(
+        self,
+        schema_id: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        after: ExportCursor | None = None,
+    ) -> Iterator[CompletedSession]:
+        return select_completed(list(self._sessions.values()), schema_id, since, until, after)
+
+    def stats(self) -> dict[str, int]:
+        return {"sessions": len(self._sessions)}
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+from interview.engine.data_index import session_index
+from interview.models.schema import InterviewSchema
+from interview.models.session import Session
+from interview.session.store import (
+    CompletedSession,
+    ExportCursor,
+    RevisionedSessionStore,
+    VersionConflictError,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from datetime import datetime
+
+DEFAULT_CACHE_SIZE = 1024
+
+# Separates the routing prefix from the rest of a session id ("w1.<uuid>")
+ROUTE_SEPARATOR = "."
+
+
+def route_hint(session_id: str) -> str | None:
+    """The routing prefix of a session id, for sticky load balancing."""
+    prefix, sep, _ = session_id.partition(ROUTE_SEPARATOR)
+    return prefix if sep else None
+
+
+class TieredSessionStore:
+    """Per-worker cache of hot sessions in front of a shared persistent store.
+
+    Reads ask the backend only for the session's revision; when it matches
+    the cached copy the session is served from memory, otherwise it is
+    reloaded. Within `revalidate_after` seconds of the last check or write
+    a cached session is served without asking at all, so a read may be
+    that stale. Writes go straight to the backend, which rejects them with
+    VersionConflictError if another worker wrote first, stale read or not;
+    the cached copy is dropped in that case so the next read reloads it.
+
+    With `route_prefix` set, new session ids start with it (see
+    `route_hint`), so a load balancer can keep a session on the worker
+    whose cache already holds it.
+    """
+
+    def __init__(
+        self,
+        backend: RevisionedSessionStore,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        route_prefix: str | None = None,
+        revalidate_after: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.backend = backend
+        self.cache_size = cache_size
+        self.route_prefix = route_prefix
+        self.revalidate_after = revalidate_after
+        self._clock = clock
+        self._cache: OrderedDict[str, _Cached] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.conflicts = 0
+
+    def create(
+        self,
+        schema: InterviewSchema,
+        initial_data: dict[str, Any],
+        session_id: str | None = None,
+    ) -> Session:
+        if session_id is None and self.route_prefix is not None:
+            session_id = f"{self.route_prefix}{ROUTE_SEPARATOR}{uuid.uuid4()}"
+        session = self.backend.create(schema, initial_data, session_id=session_id)
+        self._remember(session)
+        return session
+
+    def get(self, session_id: str) -> Session | None:
+        with self._lock:
+            cached = self._cache.get(session_id)
+            if cached is not None and self._clock() - cached.checked_at < self.revalidate_after:
+                return self._hit(session_id, cached)
+        revision = self.backend.get_revision(session_id)
+        with self._lock:
+            if revision is None:
+                self._cache.pop(session_id, None)
+                return None
+            cached = self._cache.get(session_id)
+            if cached is not None and cached.session.revision == revision:
+                cached.checked_at = self._clock()
+                return self._hit(session_id, cached)
+            self.misses += 1
+        session = self.backend.get(session_id)
+        if session is not None:
+            self._remember(session)
+        return session
+
+    def get_revision(self, session_id: str) -> int | None:
+        return self.backend.get_revision(session_id)
+
+    def update(self, session: Session) -> None:
+        try:
+            self.backend.update(session)
+        except VersionConflictError:
+            with self._lock:
+                self._cache.pop(session.id, None)
+                self.conflicts += 1
+            raise
+        self._remember(session)
+
+    def completed_sessions(
+        self,
+        schema_id: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        after: ExportCursor | None = None,
+    ) -> Iterator[CompletedSession]:
+        """Read from the backend; exports bypass the cache."""
+        return self.backend.completed_sessions(  # type: ignore[attr-defined,no-any-return]
+            schema_id, since, until, after
+        )
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "cached_sessions": len(self._cache),
+            "cache_hits": self.hits,
+            "cache_misses": self.misses,
+            "conflicts": self.conflicts,
+        }
+
+    def _hit(self, session_id: str, cached: _Cached) -> Session:
+        self._cache.move_to_end(session_id)
+        self.hits += 1
+        return _detached(cached.session)
+
+    def _remember(self, session: Session) -> None:
+        # Built here so the cached copy and every copy handed out share it
+        session_index(session)
+        # Cache a private copy; callers mutate the object they were given
+        session = _detached(session)
+        with self._lock:
+            self._cache[session.id] = _Cached(session, self._clock())
+            self._cache.move_to_end(session.id)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+
+class _Cached:
+    __slots__ = ("checked_at", "session")
+
+    def __init__(self, session: Session, checked_at: float) -> None:
+        self.session = session
+        # When the revision was last known to match the backend's
+        self.checked_at = checked_at
+
+
+def _detached(session: Session) -> Session:
+    """A copy callers can mutate without touching the cached one.
+
+    Only the lists callers append to are copied. current_data (and its
+    DataIndex) is shared: the orchestrator never edits it in place, merges
+    build a new version copy-on-write and swap it in, so the cached copy
+    keeps the old one. Turns and the shared schema are immutable in
+    practice.
+    """
+    return session.model_copy(
+        update={
+            "conversation_history": list(session.conversation_history),
+            "patch_log": list(session.patch_log),
+        }
+    )
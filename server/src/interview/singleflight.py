@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True, slots=True)
+class InFlight(Generic[T]):
+    """A call still running; `tag` identifies the request it serves."""
+
+    tag: str
+    future: asyncio.Future[T]
+
+    async def wait(self) -> T:
+        """The call's result; cancelling the waiter leaves the call running."""
+        return await asyncio.shield(self.future)
+
+
+class SingleFlight(Generic[T]):
+    """Tracks one in-flight call per key so duplicates can share its result.
+
+    Callers look up `current(key)` and, when its tag matches what they
+    would run, `wait()` for it instead of running again; otherwise they
+    `run` their own call, which becomes the current one until it finishes.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[str, InFlight[T]] = {}
+
+    def current(self, key: str) -> InFlight[T] | None:
+        return self._calls.get(key)
+
+    async def run(self, key: str, tag: str, compute: Callable[[], Awaitable[T]]) -> T:
+        """Await `compute`, sharing its outcome with waiters on `key`."""
+        future: asyncio.Future[T] = asyncio.get_running_loop().create_future()
+        future.add_done_callback(_retrieve_exception)
+        self._calls[key] = InFlight(tag, future)
+        try:
+            result = await compute()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        finally:
+            del self._calls[key]
+        future.set_result(result)
+        return result
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+
+def _retrieve_exception(future: asyncio.Future[Any]) -> None:
+    # Nobody may be waiting on a failed call; mark its exception as seen
+    if not future.cancelled():
+        future.exception()
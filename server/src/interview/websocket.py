@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from typing import TYPE_CHECKING, Any
+
+from fastapi import WebSocket, WebSocketDisconnect
+from pydantic import ValidationError
+
+from interview.models.api import SubmitRequest
+
+if TYPE_CHECKING:
+    from interview.engine.orchestrator import InterviewOrchestrator
+    from interview.models.session import Session
+    from interview.session.store import SessionStore
+
+logger = logging.getLogger(__name__)
+
+# Close code for an unknown session (4000-4999 are application-defined)
+SESSION_NOT_FOUND_CODE = 4404
+
+
+def _turn(session: Session) -> int:
+    """Resume cursor: the number of turns recorded in the session."""
+    return len(session.conversation_history)
+
+
+def _last_blocks(session: Session) -> list[Any]:
+    for turn in reversed(session.conversation_history):
+        if turn.role == "assistant":
+            return list(json.loads(turn.content))
+    return []
+
+
+async def run_session_socket(
+    websocket: WebSocket,
+    session_id: str,
+    orchestrator: InterviewOrchestrator,
+    store: SessionStore,
+    heartbeat_interval: float,
+    resume_turn: int | None = None,
+) -> None:
+    """Serve one interview session over a WebSocket.
+
+    Client frames:
+      {"type": "form", "data": {...}} / {"type": "message", "text": "..."}
+      {"type": "ping"}
+
+    Server frames:
+      "ready"    -- on connect; carries the full state unless `resume_turn`
+                    matches the session, in which case the client is current
+      "text"     -- TextBlock delta while the next step is generated
+      "block"    -- a parsed FormBlock
+      "error"    -- validation errors or a malformed frame
+      "step"     -- end of a turn: blocks plus a JSON-patch of the data
+      "complete" -- like "step", for the final turn
+      "ping"/"pong" -- heartbeats; the server pings after `heartbeat_interval`
+                    seconds without client frames
+
+    Turns go through the same orchestrator path as the REST and SSE endpoints.
+    Data is sent as patches against the last version this connection saw,
+    taken from the session's patch log (a whole-document replace at "" when
+    the log no longer reaches back that far).
+    """
+    await websocket.accept()
+    session = store.get(session_id)
+    if session is None:
+        await websocket.close(code=SESSION_NOT_FOUND_CODE, reason="Session not found")
+        return
+
+    ready: dict[str, Any] = {
+        "type": "ready",
+        "turn": _turn(session),
+        "is_complete": session.is_complete,
+    }
+    if resume_turn != _turn(session):
+        ready["data"] = session.current_data
+        ready["blocks"] = _last_blocks(session)
+    await websocket.send_json(ready)
+    last_version = session.version
+
+    try:
+        while True:
+            try:
+                frame = await asyncio.wait_for(websocket.receive_json(), heartbeat_interval)
+            except TimeoutError:
+                await websocket.send_json({"type": "ping"})
+                continue
+            except ValueError:
+                await websocket.send_json({"type": "error", "detail": "Frame must be JSON"})
+                continue
+
+            if not isinstance(frame, dict):
+                await websocket.send_json({"type": "error", "detail": "Frame must be an object"})
+                continue
+            if frame.get("type") == "ping":
+                await websocket.send_json({"type": "pong"})
+                continue
+            if frame.get("type") == "pong":
+                continue
+
+            try:
+                request = SubmitRequest.model_validate(frame)
+            except ValidationError as exc:
+                await websocket.send_json({"type": "error", "detail": str(exc)})
+                continue
+            # The connection tracks the version it last sent, not the client
+            request.since_version = last_version
+
+            last_version = await _run_turn(
+                websocket, session_id, request, orchestrator, store, last_version
+            )
+    except WebSocketDisconnect:
+        logger.debug("WebSocket for session %s disconnected", session_id)
+
+
+async def _run_turn(
+    websocket: WebSocket,
+    session_id: str,
+    request: SubmitRequest,
+    orchestrator: InterviewOrchestrator,
+    store: SessionStore,
+    last_version: int,
+) -> int:
+    """Stream one turn to the client. Returns the data version the client now has."""
+    async for event in orchestrator.submit_stream(session_id, request):
+        if event.event == "text":
+            await websocket.send_json({"type": "text", "delta": event.data["delta"]})
+        elif event.event == "form":
+            await websocket.send_json({"type": "block", "block": event.data})
+        elif event.event == "errors":
+            await websocket.send_json({"type": "error", "errors": event.data["errors"]})
+        elif event.event == "state":
+            state = event.data
+            if state.get("errors"):
+                # Validation errors were already sent; only a lost session is new here
+                if "_session" in state["errors"]:
+                    await websocket.send_json({"type": "error", "errors": state["errors"]})
+                continue
+            session = store.get(session_id)
+            patch = state["patch"]
+            if patch is None:
+                patch = [{"op": "replace", "path": "", "value": state["current_data"]}]
+            await websocket.send_json(
+                {
+                    "type": "complete" if state["is_complete"] else "step",
+                    "turn": _turn(session) if session is not None else 0,
+                    "blocks": state["blocks"],
+                    "patch": patch,
+                }
+            )
+            last_version = state["version"]
+    return last_version
@@ -1,15 +1,24 @@
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import json
+import threading
+from typing import TYPE_CHECKING, Any
 from unittest.mock import MagicMock
 
+import httpx
 from fastapi.testclient import TestClient
 
+from interview.config import settings
+from interview.engine import orchestrator as orchestrator_module
 from interview.engine.dspy_modules import InterviewStepOutput
 from interview.main import create_app
 from interview.models.ui_blocks import FormBlock, InputElement, TextBlock
 from interview.session.store import InMemorySessionStore
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 
 def _mock_interview_step() -> MagicMock:
     mock = MagicMock()
@@ -117,6 +126,53 @@ class TestSubmitEndpoint:
         assert response.status_code == 404
 
 
+class TestConcurrentStatus:
+    async def test_status_never_sees_a_rejected_form(self, monkeypatch):
+        client = _create_test_client()
+        schema = {
+            "fields": {
+                "name": {"type": "string", "validation": [{"type": "required"}]},
+                "age": {"type": "integer", "validation": [{"type": "min", "param": 18}]},
+            }
+        }
+        session_id = client.post("/api/interview/start", json={"schema": schema}).json()[
+            "session_id"
+        ]
+
+        # Hold the turn after the merge is staged and before it is validated
+        validating, release = threading.Event(), threading.Event()
+        validate_data = orchestrator_module.validate_data
+
+        def slow_validate_data(*args: Any) -> dict[str, list[str]]:
+            validating.set()
+            release.wait(5)
+            return validate_data(*args)
+
+        monkeypatch.setattr(orchestrator_module, "validate_data", slow_validate_data)
+
+        transport = httpx.ASGITransport(app=client.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+            async with asyncio.timeout(10):
+                submit = asyncio.create_task(
+                    http.post(
+                        f"/api/interview/{session_id}/submit",
+                        json={"type": "form", "data": {"name": "Ann", "age": 3}},
+                    )
+                )
+                await asyncio.to_thread(validating.wait, 5)
+                polled = [
+                    (await http.get(f"/api/interview/{session_id}/status")).json() for _ in range(5)
+                ]
+                release.set()
+                response = await submit
+
+        assert response.json()["errors"] == {"age": ["Must be at least 18."]}
+        for status in polled:
+            assert status["current_data"] == {}
+            assert status["missing_fields"] == ["name"]
+        assert client.get(f"/api/interview/{session_id}/status").json()["current_data"] == {}
+
+
 class TestStatusEndpoint:
     def test_get_status(self):
         client = _create_test_client()
@@ -136,3 +192,293 @@ class TestStatusEndpoint:
         response = client.get("/api/interview/nonexistent/status")
 
         assert response.status_code == 404
+
+
+def _create_registry_client() -> TestClient:
+    from interview.engine.schema_registry import SchemaRegistry
+
+    client = _create_test_client()
+    client.app.state.registry = SchemaRegistry()  # type: ignore[attr-defined]
+    return client
+
+
+class TestSchemaRegistryEndpoints:
+    def test_register_returns_content_address(self):
+        client = _create_registry_client()
+        first = client.post("/api/interview/schemas", json={"schema": SIMPLE_SCHEMA, "name": "p"})
+        again = client.post("/api/interview/schemas", json={"schema": SIMPLE_SCHEMA, "name": "p"})
+
+        assert first.status_code == 200
+        assert first.json()["version"] == 1
+        assert again.json() == first.json()
+
+    def test_start_by_schema_id(self):
+        client = _create_registry_client()
+        registered = client.post("/api/interview/schemas", json={"schema": SIMPLE_SCHEMA})
+        schema_id = registered.json()["schema_id"]
+
+        response = client.post("/api/interview/start", json={"schema_id": schema_id})
+
+        assert response.status_code == 200
+        session_id = response.json()["session_id"]
+        session = client.app.state.store.get(session_id)  # type: ignore[attr-defined]
+        entry = client.app.state.registry.get(schema_id)  # type: ignore[attr-defined]
+        assert session.schema_ is entry.schema
+
+    def test_start_unknown_schema_id(self):
+        client = _create_registry_client()
+        response = client.post("/api/interview/start", json={"schema_id": "missing"})
+
+        assert response.status_code == 404
+
+
+class TestIdempotencyKey:
+    def test_start_replayed_with_same_key(self):
+        client = _create_test_client()
+        headers = {"Idempotency-Key": "start-1"}
+        first = client.post("/api/interview/start", json={"schema": SIMPLE_SCHEMA}, headers=headers)
+        again = client.post("/api/interview/start", json={"schema": SIMPLE_SCHEMA}, headers=headers)
+
+        assert first.status_code == 200
+        assert again.json()["session_id"] == first.json()["session_id"]
+
+    def test_submit_replay_skips_recompute(self):
+        client = _create_test_client()
+        start = client.post("/api/interview/start", json={"schema": SIMPLE_SCHEMA})
+        session_id = start.json()["session_id"]
+        step = client.app.state.orchestrator._interview_step  # type: ignore[attr-defined]
+        calls_before = step.call_count
+
+        headers = {"Idempotency-Key": "submit-1"}
+        body = {"type": "message", "text": "hello"}
+        first = client.post(f"/api/interview/{session_id}/submit", json=body, headers=headers)
+        again = client.post(f"/api/interview/{session_id}/submit", json=body, headers=headers)
+
+        assert again.json() == first.json()
+        assert step.call_count == calls_before + 1
+
+    async def test_overlapping_start_retry_waits_for_the_first(self):
+        client = _create_test_client()
+        step = client.app.state.orchestrator._interview_step  # type: ignore[attr-defined]
+        blocks = step.return_value
+        generating, release, generated = threading.Event(), threading.Event(), threading.Event()
+
+        def slow_step(**_: Any) -> Any:
+            generating.set()
+            release.wait(5)
+            generated.set()
+            return blocks
+
+        step.side_effect = slow_step
+        headers = {"Idempotency-Key": "start-3"}
+
+        transport = httpx.ASGITransport(app=client.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+            async with asyncio.timeout(10):
+                first = asyncio.create_task(
+                    http.post(
+                        "/api/interview/start", json={"schema": SIMPLE_SCHEMA}, headers=headers
+                    )
+                )
+                await asyncio.to_thread(generating.wait, 5)
+                # The loop is free while the first start generates its step
+                retry = asyncio.create_task(
+                    http.post(
+                        "/api/interview/start", json={"schema": SIMPLE_SCHEMA}, headers=headers
+                    )
+                )
+                status = await http.get("/api/interview/nonexistent/status")
+                answered_while_generating = not generated.is_set()
+                release.set()
+                responses = await asyncio.gather(first, retry)
+
+        assert status.status_code == 404
+        assert answered_while_generating
+        assert responses[0].json() == responses[1].json()
+        assert step.call_count == 1
+
+    def test_key_reused_for_different_body(self):
+        client = _create_test_client()
+        headers = {"Idempotency-Key": "start-2"}
+        client.post("/api/interview/start", json={"schema": SIMPLE_SCHEMA}, headers=headers)
+        other = client.post(
+            "/api/interview/start",
+            json={"schema": SIMPLE_SCHEMA, "initial_data": {"name": "x"}},
+            headers=headers,
+        )
+
+        assert other.status_code == 422
+
+
+ITEMS_SCHEMA = {
+    "fields": {
+        "name": {"type": "string"},
+        "jobs": {
+            "type": "array",
+            "item_schema": {
+                "type": "object",
+                "fields": {"company": {"type": "string", "validation": [{"type": "required"}]}},
+            },
+        },
+    }
+}
+
+
+class TestIngestItemsEndpoint:
+    def _start(self, client: TestClient) -> str:
+        response = client.post("/api/interview/start", json={"schema": ITEMS_SCHEMA})
+        return response.json()["session_id"]  # type: ignore[no-any-return]
+
+    def test_json_array_body(self):
+        client = _create_test_client()
+        session_id = self._start(client)
+
+        response = client.post(
+            f"/api/interview/{session_id}/items/jobs",
+            content=b'[{"company": "A"}, {"company": "B"}]',
+            headers={"Content-Type": "application/json"},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["accepted"] == 2
+        status = client.get(f"/api/interview/{session_id}/status").json()
+        assert status["current_data"]["jobs"] == [{"company": "A"}, {"company": "B"}]
+
+    def test_ndjson_body_with_invalid_item(self):
+        client = _create_test_client()
+        session_id = self._start(client)
+
+        response = client.post(
+            f"/api/interview/{session_id}/items/jobs",
+            content=b'{"company": "A"}\n{}\n',
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+
+        data = response.json()
+        assert data["accepted"] == 0
+        assert data["item_errors"] == [
+            {"index": 1, "errors": {"company": ["This field is required."]}}
+        ]
+
+    def test_unknown_session(self):
+        client = _create_test_client()
+        response = client.post("/api/interview/nope/items/jobs", content=b"[]")
+
+        assert response.status_code == 404
+
+
+class TestPrefillEndpoint:
+    async def test_streams_one_line_per_record(self):
+        client = _create_registry_client()
+        registered = client.post("/api/interview/schemas", json={"schema": SIMPLE_SCHEMA})
+        schema_id = registered.json()["schema_id"]
+        step = client.app.state.orchestrator._interview_step  # type: ignore[attr-defined]
+
+        # A body read from inside the streamed response hangs; fail instead
+        transport = httpx.ASGITransport(app=client.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+            async with asyncio.timeout(10):
+                response = await http.post(
+                    f"/api/interview/prefill?schema_id={schema_id}",
+                    content=b'{"name": "Ann"}\n{}\nnope\n',
+                    headers={"Content-Type": "application/x-ndjson"},
+                )
+
+        assert response.status_code == 200
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [line["index"] for line in lines] == [0, 1, 2]
+        assert lines[0]["is_complete"] is True
+        assert lines[1]["missing"] == ["name"]
+        assert "error" in lines[2]
+        assert step.call_count == 0
+
+    def test_body_over_the_limit(self, monkeypatch):
+        monkeypatch.setattr(settings, "prefill_max_body_bytes", 16)
+        client = _create_registry_client()
+        registered = client.post("/api/interview/schemas", json={"schema": SIMPLE_SCHEMA})
+        url = f"/api/interview/prefill?schema_id={registered.json()['schema_id']}"
+
+        def chunks() -> Iterator[bytes]:
+            yield b'{"name": "Ann"}\n' * 2
+
+        assert client.post(url, content=b"[]" * 10).status_code == 413
+        # Without a Content-Length, the limit applies while the body is read
+        assert client.post(url, content=chunks()).status_code == 413
+
+    def test_unknown_schema(self):
+        client = _create_registry_client()
+        response = client.post("/api/interview/prefill?schema_id=missing", content=b"[]")
+
+        assert response.status_code == 404
+
+
+class TestRepairStatsEndpoint:
+    def test_counts_repairs_by_kind(self):
+        client = _create_test_client()
+        schema = {"fields": {"Name": {"type": "string", "validation": [{"type": "required"}]}}}
+        client.post("/api/interview/start", json={"schema": schema})
+
+        response = client.get("/api/interview/repairs/stats")
+
+        assert response.status_code == 200
+        counts = response.json()
+        assert counts["binding_case"] == 1
+        assert counts["fallback_form"] == 0
+
+
+class TestFunnelEndpoint:
+    def test_reports_field_counts(self):
+        client = _create_registry_client()
+        registered = client.post("/api/interview/schemas", json={"schema": SIMPLE_SCHEMA})
+        schema_id = registered.json()["schema_id"]
+        client.post("/api/interview/start", json={"schema_id": schema_id})
+
+        response = client.get(f"/api/interview/analytics/funnel?schema_id={schema_id}")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert (data["started"], data["completed"]) == (1, 0)
+        assert data["fields"]["name"] == {"asked": 1, "answered": 0, "invalid": 0, "extracted": 0}
+
+    def test_unseen_schema(self):
+        client = _create_test_client()
+        response = client.get("/api/interview/analytics/funnel?schema_id=missing")
+
+        assert response.status_code == 404
+
+
+class TestSchemaRulesEndpoint:
+    def test_serves_bundle_with_etag(self):
+        client = _create_registry_client()
+        registered = client.post("/api/interview/schemas", json={"schema": SIMPLE_SCHEMA})
+        schema_id = registered.json()["schema_id"]
+
+        response = client.get(f"/api/interview/schemas/{schema_id}/rules")
+
+        assert response.status_code == 200
+        assert response.json()["fields"]["name"]["rules"] == [
+            {"type": "required", "message": "This field is required."}
+        ]
+        etag = response.headers["etag"]
+        cached = client.get(
+            f"/api/interview/schemas/{schema_id}/rules", headers={"If-None-Match": etag}
+        )
+        assert cached.status_code == 304
+        assert cached.headers["etag"] == etag
+
+    def test_schema_of_a_session(self):
+        client = _create_test_client()
+        session_id = client.post("/api/interview/start", json={"schema": SIMPLE_SCHEMA}).json()[
+            "session_id"
+        ]
+        schema_id = client.app.state.store.get(session_id).schema_id  # type: ignore[attr-defined]
+
+        response = client.get(f"/api/interview/schemas/{schema_id}/rules")
+
+        assert response.status_code == 200
+
+    def test_unknown_schema(self):
+        client = _create_registry_client()
+        response = client.get("/api/interview/schemas/missing/rules")
+
+        assert response.status_code == 404
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+from collections import Counter
+
+from interview.engine.block_repair import (
+    BINDING_CASE,
+    BINDING_DROPPED,
+    BINDING_NEAREST,
+    COLLECTED_DROPPED,
+    FALLBACK_FORM,
+    KIND_FIXED,
+    OPTIONS_INJECTED,
+    TEXT_INSERTED,
+    repair_blocks,
+)
+from interview.engine.schema_analyzer import flatten_schema
+from interview.models.schema import (
+    FieldSchema,
+    InterviewSchema,
+    SelectOption,
+    ValidationRule,
+)
+from interview.models.ui_blocks import (
+    ArrayElement,
+    CheckboxElement,
+    FormBlock,
+    InputElement,
+    RadioElement,
+    SelectElement,
+    TextBlock,
+)
+
+
+def _options(n: int) -> list[SelectOption]:
+    return [SelectOption(value=f"v{i}", label=f"Option {i}") for i in range(n)]
+
+
+def _schema() -> InterviewSchema:
+    return InterviewSchema(
+        fields={
+            "personal": FieldSchema(
+                type="object",
+                fields={
+                    "first_name": FieldSchema(
+                        type="string", validation=[ValidationRule(type="required")]
+                    ),
+                    "age": FieldSchema(type="integer"),
+                    "country": FieldSchema(type="enum", options=_options(10)),
+                    "gender": FieldSchema(type="enum", options=_options(3)),
+                    "newsletter": FieldSchema(type="boolean"),
+                },
+            ),
+            "children": FieldSchema(
+                type="array",
+                item_schema=FieldSchema(
+                    type="object",
+                    fields={"name": FieldSchema(type="string")},
+                ),
+            ),
+        }
+    )
+
+
+def _repair(elements: list, current_data: dict | None = None, missing: list[str] | None = None):
+    counts: Counter[str] = Counter()
+    blocks = repair_blocks(
+        [TextBlock(value="Hi"), FormBlock(elements=elements)],
+        flatten_schema(_schema()),
+        current_data or {},
+        missing if missing is not None else [],
+        counts,
+    )
+    return blocks, counts
+
+
+def _elements(blocks: list) -> list:
+    return [el for b in blocks if isinstance(b, FormBlock) for el in b.elements]
+
+
+class TestBindingRepair:
+    def test_exact_binding_untouched(self):
+        el = InputElement(label="First", binding="personal.first_name")
+        blocks, counts = _repair([el])
+        assert _elements(blocks) == [el]
+        assert not counts
+
+    def test_case_insensitive_binding(self):
+        blocks, counts = _repair([InputElement(label="First", binding="Personal.First_Name")])
+        assert _elements(blocks)[0].binding == "personal.first_name"
+        assert counts[BINDING_CASE] == 1
+
+    def test_misspelled_binding_maps_to_nearest(self):
+        blocks, counts = _repair([InputElement(label="First", binding="personal.firstname")])
+        assert _elements(blocks)[0].binding == "personal.first_name"
+        assert counts[BINDING_NEAREST] == 1
+
+    def test_leaf_name_binding_maps_to_unique_path(self):
+        blocks, _counts = _repair([InputElement(type="integer", label="Age", binding="age")])
+        assert _elements(blocks)[0].binding == "personal.age"
+
+    def test_unknown_binding_dropped(self):
+        blocks, counts = _repair(
+            [
+                InputElement(label="First", binding="personal.first_name"),
+                InputElement(label="Shoe size", binding="shoe_size"),
+            ]
+        )
+        assert [el.binding for el in _elements(blocks)] == ["personal.first_name"]
+        assert counts[BINDING_DROPPED] == 1
+
+
+class TestKindAndOptionRepair:
+    def test_radio_for_large_enum_becomes_select(self):
+        blocks, counts = _repair(
+            [RadioElement(label="Country", binding="personal.country", options=_options(10))]
+        )
+        el = _elements(blocks)[0]
+        assert isinstance(el, SelectElement)
+        assert el.label == "Country"
+        assert counts[KIND_FIXED] == 1
+
+    def test_missing_options_injected(self):
+        blocks, counts = _repair(
+            [RadioElement(label="Gender", binding="personal.gender", options=[])]
+        )
+        assert [o.value for o in _elements(blocks)[0].options] == ["v0", "v1", "v2"]
+        assert counts[OPTIONS_INJECTED] == 1
+
+    def test_input_for_enum_becomes_choice(self):
+        blocks, _counts = _repair([InputElement(label="Gender", binding="personal.gender")])
+        assert isinstance(_elements(blocks)[0], RadioElement)
+
+    def test_wrong_input_type_fixed(self):
+        blocks, counts = _repair([InputElement(type="text", label="Age", binding="personal.age")])
+        assert _elements(blocks)[0].type == "integer"
+        assert counts[KIND_FIXED] == 1
+
+    def test_text_input_for_boolean_becomes_checkbox(self):
+        blocks, _counts = _repair([InputElement(label="News", binding="personal.newsletter")])
+        assert isinstance(_elements(blocks)[0], CheckboxElement)
+
+    def test_array_item_bindings_repaired(self):
+        blocks, counts = _repair(
+            [
+                ArrayElement(
+                    label="Children",
+                    binding="children",
+                    item_elements=[InputElement(label="Name", binding="Name")],
+                )
+            ]
+        )
+        assert _elements(blocks)[0].item_elements[0].binding == "name"
+        assert counts[BINDING_CASE] == 1
+
+
+class TestCollectedAndFallback:
+    def test_collected_valid_field_dropped(self):
+        blocks, counts = _repair(
+            [
+                InputElement(label="First", binding="personal.first_name"),
+                InputElement(type="integer", label="Age", binding="personal.age"),
+            ],
+            current_data={"personal": {"first_name": "Ana"}},
+        )
+        assert [el.binding for el in _elements(blocks)] == ["personal.age"]
+        assert counts[COLLECTED_DROPPED] == 1
+
+    def test_fallback_form_when_nothing_left(self):
+        blocks, counts = _repair(
+            [InputElement(label="First", binding="personal.first_name")],
+            current_data={"personal": {"first_name": "Ana"}},
+            missing=["personal.age"],
+        )
+        assert [el.binding for el in _elements(blocks)] == ["personal.age"]
+        assert counts[FALLBACK_FORM] == 1
+
+    def test_text_block_prepended(self):
+        counts: Counter[str] = Counter()
+        blocks = repair_blocks(
+            [FormBlock(elements=[InputElement(label="First", binding="personal.first_name")])],
+            flatten_schema(_schema()),
+            {},
+            [],
+            counts,
+        )
+        assert isinstance(blocks[0], TextBlock)
+        assert counts[TEXT_INSERTED] == 1
@@ -16,3 +16,11 @@ class TestGetDefaultPath:
         assert p1 != p2
         assert p1.stem == "interview_step"
         assert p2.stem == "text_extractor"
+
+    def test_cot_mode_keeps_legacy_path(self) -> None:
+        assert get_default_path("interview_step", "cot") == get_default_path("interview_step")
+
+    def test_predict_mode_gets_separate_artifact(self) -> None:
+        path = get_default_path("text_extractor", "predict")
+        assert path.name == "text_extractor.predict.json"
+        assert path != get_default_path("text_extractor")
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import random
+from typing import Any
+
+import pytest
+
+from interview.engine import columnar
+from interview.engine.columnar import validate_columns
+from interview.engine.schema_analyzer import get_invalid_fields, get_missing_fields
+from interview.models.schema import Condition, FieldSchema, InterviewSchema, ValidationRule
+
+SCHEMA = InterviewSchema(
+    fields={
+        "name": FieldSchema(
+            type="string",
+            validation=[
+                ValidationRule(type="required"),
+                ValidationRule(type="min_length", param=2),
+                ValidationRule(type="max_length", param=5),
+            ],
+        ),
+        "email": FieldSchema(
+            type="string", validation=[ValidationRule(type="pattern", param=r"^[^@]+@[^@]+$")]
+        ),
+        "age": FieldSchema(
+            type="integer",
+            validation=[ValidationRule(type="min", param=18), ValidationRule(type="max", param=99)],
+        ),
+        "score": FieldSchema(type="float", validation=[ValidationRule(type="min", param=0)]),
+        "tags": FieldSchema(
+            type="array",
+            validation=[ValidationRule(type="required"), ValidationRule(type="max_items", param=2)],
+        ),
+        "job": FieldSchema(
+            type="object",
+            conditions=[Condition(field="employed", op="eq", value=True)],
+            fields={
+                "title": FieldSchema(
+                    type="enum", validation=[ValidationRule(type="one_of", param=["dev", "ops"])]
+                ),
+                "years": FieldSchema(
+                    type="integer",
+                    validation=[ValidationRule(type="min", param=0)],
+                    conditions=[Condition(field="age", op="gte", value=21)],
+                ),
+            },
+        ),
+    }
+)
+
+VALUES: dict[str, list[Any]] = {
+    "name": ["Al", "A", "Alexander", "", None, 7, []],
+    "email": ["a@b", "nope", "", ["a@b"], 2**60],
+    "age": [30, 17, 100, 18.5, True, 2**60, -(2**60)],
+    "score": [1, -1, 0.0, "x", None, -(2**60) - 1],
+    "tags": [[], ["a"], ["a", "b", "c"], "abc", {"a": 1}],
+    "employed": [True, False, None, 1],
+    "job.title": ["dev", "cto", 1, ["dev"], None],
+    "job.years": [0, -1, 3.5, "x"],
+}
+
+
+def _records(count: int, seed: int = 7) -> list[Any]:
+    rng = random.Random(seed)  # noqa: S311
+    records: list[Any] = []
+    for _ in range(count):
+        record: dict[str, Any] = {}
+        for path, values in VALUES.items():
+            if rng.random() < 0.8:
+                value = rng.choice(values)
+                if path.startswith("job."):
+                    record.setdefault("job", {})[path[4:]] = value
+                else:
+                    record[path] = value
+        records.append(record)
+    return [*records, "not a record"]
+
+
+@pytest.fixture(params=["numpy", "python"])
+def engine(request, monkeypatch):
+    if request.param == "python":
+        monkeypatch.setattr(columnar, "np", None)
+    elif columnar.np is None:
+        pytest.skip("numpy is not installed")
+
+
+@pytest.mark.usefixtures("engine")
+class TestValidateColumns:
+    def test_matches_per_record_validation(self):
+        records = _records(2000)
+        result = validate_columns(SCHEMA, records)
+        assert result.size == len(records)
+        for i, record in enumerate(records[:-1]):
+            assert result.record_errors(i) == get_invalid_fields(SCHEMA, record), record
+        assert result.record_errors(len(records) - 1) == {}
+
+    def test_matches_per_record_missing_fields(self):
+        records = _records(2000)[:-1]
+        result = validate_columns(SCHEMA, records)
+        for i, record in enumerate(records):
+            assert result.record_missing(i) == get_missing_fields(SCHEMA, record), record
+
+    def test_invalid_counts(self):
+        records = [{"age": 10}, {"age": 20}, {"age": 5, "name": "A"}]
+        counts = validate_columns(SCHEMA, records).invalid_counts()
+        assert counts["age"] == 2
+        assert counts["name"] == 1
+        assert counts["email"] == 0
+
+    def test_inactive_branch_is_not_checked(self):
+        records = [{"employed": False, "job": {"title": "cto"}}, {"employed": True, "job": {}}]
+        result = validate_columns(SCHEMA, records)
+        assert list(result.masks["job.title"]) == [False, False]
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import json
+from datetime import UTC, datetime
+
+from interview.models.schema import FieldSchema, InterviewSchema
+from interview.models.session import ConversationTurn, VersionedPatch
+from interview.session.compact import (
+    FORMAT_VERSION,
+    CompactSession,
+    dump_session,
+    load_compact_session,
+    unpack,
+)
+from interview.session.store import InMemorySessionStore
+
+
+def _store_with_session() -> tuple[InMemorySessionStore, str]:
+    store = InMemorySessionStore()
+    schema = InterviewSchema(fields={"name": FieldSchema(type="string", label="Name")})
+    session = store.create(schema, {"name": "Ana"})
+    session.conversation_history.append(ConversationTurn(role="user", content="I'm Ana"))
+    session.patch_log.append(
+        VersionedPatch(version=1, ops=[{"op": "add", "path": "/name", "value": "Ana"}])
+    )
+    session.version = 1
+    store.update(session)
+    return store, session.id
+
+
+class TestCompactSession:
+    def test_roundtrip_preserves_session(self):
+        store, session_id = _store_with_session()
+        session = store.get(session_id)
+        assert session is not None
+
+        restored = load_compact_session(dump_session(session), store.interner)
+
+        assert restored.model_dump() == session.model_dump()
+        assert restored.schema_ is session.schema_
+
+    def test_roundtrip_completed_at(self):
+        store, session_id = _store_with_session()
+        session = store.get(session_id)
+        assert session is not None
+        session.completed_at = datetime(2026, 1, 2, 3, 4, 5, tzinfo=UTC)
+
+        restored = load_compact_session(dump_session(session), store.interner)
+
+        assert restored.completed_at == session.completed_at
+
+    def test_payload_omits_schema(self):
+        store, session_id = _store_with_session()
+        session = store.get(session_id)
+        assert session is not None
+
+        assert b"Name" not in dump_session(session)
+
+    def test_reads_json_encoding(self):
+        row = [FORMAT_VERSION, "s1", "abc", {"a": 1}, [["user", "hi"]], False, 2, 3, [], "", None]
+        compact = unpack(json.dumps(row).encode())
+
+        assert compact == CompactSession(
+            id="s1",
+            schema_id="abc",
+            current_data={"a": 1},
+            turns=compact.turns,
+            version=2,
+            revision=3,
+        )
+        assert compact.turns[0].content == "hi"
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import random
+from typing import Any
+
+from interview.engine.conditions import _resolve_path
+from interview.engine.data_index import DataIndex, flatten_data
+from interview.engine.merge import MergeTransaction, PathShapeError
+
+
+def _assert_agrees(index: DataIndex) -> None:
+    """The index matches a fresh flattening, and every path resolves the same way."""
+    assert index.values == flatten_data(index.data)
+    for path, value in index.values.items():
+        assert _resolve_path(index.data, path) == (True, value)
+        assert index.lookup(path) == (True, value)
+
+
+def _random_bindings(rng: random.Random) -> dict[str, Any]:
+    bindings: dict[str, Any] = {}
+    for _ in range(rng.randint(1, 4)):
+        path = rng.choice(["name", "user", "user.name", "user.age", "tags", "address.city"])
+        if rng.random() < 0.4:
+            path = f"children[{rng.randint(0, 3)}].{rng.choice(['name', 'age'])}"
+        value = rng.choice(
+            [None, "", "x", 1, 2.5, True, ["a", "b"], {"city": "Oslo"}, {"name": "Kim", "age": 3}]
+        )
+        bindings[path] = value
+    return bindings
+
+
+class TestFlattenData:
+    def test_includes_containers_and_leaves(self):
+        data = {"a": {"b": [1, {"c": None}]}}
+        assert flatten_data(data) == {
+            "a": {"b": [1, {"c": None}]},
+            "a.b": [1, {"c": None}],
+            "a.b[0]": 1,
+            "a.b[1]": {"c": None},
+            "a.b[1].c": None,
+        }
+
+
+class TestDataIndex:
+    def test_lookup(self):
+        index = DataIndex({"user": {"name": "Ann", "pets": [{"kind": "cat"}]}, "x": None})
+        assert index.lookup("user.pets[0].kind") == (True, "cat")
+        assert index.lookup("x") == (True, None)
+        assert index.lookup("user.age") == (False, None)
+
+    def test_merge_keeps_index_in_step(self):
+        data = {"user": {"name": "Ann"}}
+        index = DataIndex(data)
+        MergeTransaction(data, index).apply(
+            {"user": {"name": "Bo", "age": 4}, "pets[1]": "dog"}
+        ).commit()
+        assert index.lookup("user.age") == (True, 4)
+        assert index.lookup("pets[0]") == (True, None)
+        assert index.lookup("pets[1]") == (True, "dog")
+        _assert_agrees(index)
+
+    def test_replaced_subtree_is_dropped(self):
+        data: dict[str, Any] = {"address": {"city": "Oslo", "zip": "0150"}}
+        index = DataIndex(data)
+        MergeTransaction(data, index).apply({"address": "unknown"}).commit()
+        assert index.lookup("address.city") == (False, None)
+        _assert_agrees(index)
+
+    def test_staged_writes_are_seen_only_through_the_staged_index(self):
+        data = {"user": {"name": "Ann"}}
+        index = DataIndex(data)
+        before = dict(index.values)
+        transaction = MergeTransaction(data, index).apply({"user.name": "Bo", "pets[0]": "cat"})
+        assert transaction.view.lookup("user.name") == (True, "Bo")
+        assert transaction.view.lookup("pets[0]") == (True, "cat")
+        assert index.values == before
+        assert index.data is data
+
+    def test_rollback_restores_index(self):
+        data = {"user": {"name": "Ann"}, "children": [{"name": "Cy"}]}
+        index = DataIndex(data)
+        before = dict(index.values)
+        transaction = MergeTransaction(data, index).apply(
+            {"user.name": "Bo", "children[2].age": 1, "email": "a@b.c"}
+        )
+        transaction.rollback()
+        assert index.values == before
+        _assert_agrees(index)
+
+    def test_conformance_over_random_merges(self):
+        rng = random.Random(42)  # noqa: S311
+        data: dict[str, Any] = {}
+        index = DataIndex(data)
+        for _ in range(500):
+            transaction = MergeTransaction(data, index)
+            try:
+                transaction.apply(_random_bindings(rng))
+            except PathShapeError:
+                # A binding through a container of the other kind; undo the rest
+                transaction.rollback()
+            else:
+                if rng.random() < 0.3:
+                    transaction.rollback()
+                else:
+                    data = transaction.commit()
+            _assert_agrees(index)
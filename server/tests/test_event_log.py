@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+from unittest.mock import MagicMock
+
+from interview.engine.dspy_modules import InterviewStepOutput
+from interview.engine.orchestrator import InterviewOrchestrator
+from interview.models.api import SubmitRequest
+from interview.models.schema import FieldSchema, InterviewSchema, ValidationRule
+from interview.models.ui_blocks import FormBlock, InputElement, TextBlock
+from interview.session.events import EventSourcedSessionStore
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _schema() -> InterviewSchema:
+    required = [ValidationRule(type="required")]
+    return InterviewSchema(
+        fields={
+            "name": FieldSchema(type="string", label="Name", validation=required),
+            "age": FieldSchema(type="integer", label="Age", validation=required),
+        }
+    )
+
+
+def _orchestrator(store: EventSourcedSessionStore) -> InterviewOrchestrator:
+    step = MagicMock()
+    step.return_value.response = InterviewStepOutput(
+        ui_blocks=[
+            TextBlock(value="Hi"),
+            FormBlock(elements=[InputElement(type="integer", label="Age", binding="age")]),
+        ]
+    )
+    extractor = MagicMock()
+    extractor.return_value.response.extracted = {"name": "Ana"}
+    extractor.return_value.response.unresolved = None
+    return InterviewOrchestrator(
+        store=store, interview_step=step, text_extractor=extractor, event_log=store
+    )
+
+
+def _run_interview(store: EventSourcedSessionStore) -> str:
+    orch = _orchestrator(store)
+    session_id = orch.start(_schema()).session_id
+    orch.submit(session_id, SubmitRequest(type="message", text="I'm Ana"))
+    orch.submit(session_id, SubmitRequest(type="form", data={"name": "Ana", "age": 30}))
+    return session_id
+
+
+def _state(store: EventSourcedSessionStore, session_id: str) -> dict[str, Any]:
+    session = store.get(session_id)
+    assert session is not None
+    return session.model_dump(exclude={"schema_", "revision"})
+
+
+class TestEventSourcedSessionStore:
+    def test_events_recorded_in_order(self, tmp_path: Path):
+        store = EventSourcedSessionStore(tmp_path / "events.db")
+        session_id = _run_interview(store)
+
+        assert [e.type for e in store.events(session_id)] == [
+            "session-created",
+            "step-generated",
+            "message-extracted",
+            "step-generated",
+            "form-submitted",
+            "completed",
+        ]
+
+    def test_rebuild_after_restart_matches_live_session(self, tmp_path: Path):
+        path = tmp_path / "events.db"
+        live = EventSourcedSessionStore(path)
+        session_id = _run_interview(live)
+        expected = _state(live, session_id)
+        live.close()
+
+        restarted = EventSourcedSessionStore(path)
+
+        assert _state(restarted, session_id) == expected
+        assert expected["current_data"] == {"name": "Ana", "age": 30}
+        assert expected["is_complete"] is True
+
+    def test_rebuild_from_snapshot_plus_tail(self, tmp_path: Path):
+        path = tmp_path / "events.db"
+        live = EventSourcedSessionStore(path, snapshot_interval=3)
+        session_id = _run_interview(live)
+        expected = _state(live, session_id)
+
+        rebuilt = EventSourcedSessionStore(path).rebuild(session_id)
+
+        assert rebuilt is not None
+        assert rebuilt.model_dump(exclude={"schema_", "revision"}) == expected
+
+    def test_cache_is_bounded_and_misses_rebuild(self, tmp_path: Path):
+        store = EventSourcedSessionStore(tmp_path / "events.db", cache_size=1)
+        first = _run_interview(store)
+        expected = _state(store, first)
+        second = _run_interview(store)
+
+        assert store.stats() == {"cached_sessions": 1}
+        assert _state(store, first) == expected
+        assert store.get(second) is not None
+        assert store.stats() == {"cached_sessions": 1}
+
+    def test_unknown_session(self, tmp_path: Path):
+        store = EventSourcedSessionStore(tmp_path / "events.db")
+        assert store.get("missing") is None
+
+    def test_completed_sessions_after_restart(self, tmp_path: Path):
+        path = tmp_path / "events.db"
+        store = EventSourcedSessionStore(path)
+        session_ids = {_run_interview(store), _run_interview(store)}
+        store.create(_schema(), {})
+        completed_at = {sid: _state(store, sid)["completed_at"] for sid in session_ids}
+        schema_id = store.get(next(iter(session_ids))).schema_id  # type: ignore[union-attr]
+        store.close()
+
+        restarted = EventSourcedSessionStore(path)
+        completed = list(restarted.completed_sessions(page_size=1))
+
+        assert {c.id for c in completed} == session_ids
+        assert all(c.data == {"name": "Ana", "age": 30} for c in completed)
+        first = completed[0]
+        assert [
+            c.id for c in restarted.completed_sessions(after=(first.completed_at, first.id))
+        ] == [completed[1].id]
+        assert len(list(restarted.completed_sessions(schema_id=schema_id))) == 2
+        assert list(restarted.completed_sessions(schema_id="other")) == []
+        assert _state(restarted, first.id)["completed_at"] == completed_at[first.id]
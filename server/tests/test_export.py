@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import json
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+
+from interview.engine.schema_registry import schema_fingerprint
+from interview.export import (
+    ExportNotSupportedError,
+    decode_cursor,
+    encode_cursor,
+    export_ndjson,
+)
+from interview.models.schema import FieldSchema, InterviewSchema
+from interview.session.sqlite import SQLiteSessionStore
+from interview.session.store import InMemorySessionStore
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from interview.session.store import ExportableSessionStore
+
+T0 = datetime(2026, 3, 1, 12, 0, tzinfo=UTC)
+
+
+def _schema(extra: str | None = None) -> InterviewSchema:
+    fields = {
+        "name": FieldSchema(type="string"),
+        "address": FieldSchema(
+            type="object",
+            fields={"city": FieldSchema(type="string"), "zip": FieldSchema(type="string")},
+        ),
+        "tags": FieldSchema(type="array"),
+    }
+    if extra is not None:
+        fields[extra] = FieldSchema(type="string")
+    return InterviewSchema(fields=fields)
+
+
+def _complete(
+    store: ExportableSessionStore, schema: InterviewSchema, name: str, minute: int
+) -> str:
+    session = store.create(schema, {"name": name, "address": {"city": "Oslo"}, "tags": ["a"]})
+    session.is_complete = True
+    session.completed_at = T0 + timedelta(minutes=minute)
+    store.update(session)
+    return session.id
+
+
+def _fill(store: ExportableSessionStore) -> str:
+    """Four completed sessions on two schemas and one in progress; returns the first schema id."""
+    schema = _schema()
+    for name, minute in (("Cy", 3), ("Ana", 1), ("Bo", 2)):
+        _complete(store, schema, name, minute)
+    _complete(store, _schema(extra="email"), "Di", 4)
+    store.create(schema, {"name": "Ed"})
+    return schema_fingerprint(schema)
+
+
+def _export(store: ExportableSessionStore, **filters: object) -> list[dict]:
+    return [json.loads(line) for line in export_ndjson(store, **filters)]  # type: ignore[arg-type]
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path: Path) -> ExportableSessionStore:
+    if request.param == "memory":
+        return InMemorySessionStore()
+    return SQLiteSessionStore(tmp_path / "sessions.db")
+
+
+class TestExport:
+    def test_lines_in_completion_order_with_flat_paths(self, store):
+        _fill(store)
+        lines = _export(store)
+        assert [line["data"]["name"] for line in lines] == ["Ana", "Bo", "Cy", "Di"]
+        assert lines[0]["data"] == {
+            "name": "Ana",
+            "address.city": "Oslo",
+            "address.zip": None,
+            "tags": ["a"],
+        }
+        assert "email" in lines[3]["data"]
+        assert datetime.fromisoformat(lines[0]["completed_at"]) == T0 + timedelta(minutes=1)
+
+    def test_filters(self, store):
+        schema_id = _fill(store)
+        names = [line["data"]["name"] for line in _export(store, schema_id=schema_id)]
+        assert names == ["Ana", "Bo", "Cy"]
+        since, until = T0 + timedelta(minutes=2), T0 + timedelta(minutes=4)
+        names = [line["data"]["name"] for line in _export(store, since=since, until=until)]
+        assert names == ["Bo", "Cy"]
+        naive = _export(store, since=since.replace(tzinfo=None))
+        assert [line["data"]["name"] for line in naive] == ["Bo", "Cy", "Di"]
+
+    def test_cursor_resumes_after_last_line(self, store):
+        _fill(store)
+        first = _export(store, limit=2)
+        rest = _export(store, cursor=first[-1]["cursor"])
+        assert [line["data"]["name"] for line in first + rest] == ["Ana", "Bo", "Cy", "Di"]
+
+    def test_late_completion_is_picked_up_by_cursor(self, store):
+        schema = _schema()
+        _complete(store, schema, "Ana", 1)
+        cursor = _export(store)[-1]["cursor"]
+        _complete(store, schema, "Bo", 2)
+        assert [line["data"]["name"] for line in _export(store, cursor=cursor)] == ["Bo"]
+
+    def test_unsupported_store(self):
+        with pytest.raises(ExportNotSupportedError):
+            export_ndjson(object())  # type: ignore[arg-type]
+
+    def test_bad_cursor(self, store):
+        with pytest.raises(ValueError, match="cursor"):
+            export_ndjson(store, cursor="not-a-cursor")
+
+
+class TestCursor:
+    def test_roundtrip(self):
+        moment = T0 + timedelta(microseconds=5)
+        assert decode_cursor(encode_cursor(moment, "w1.abc|d")) == (moment, "w1.abc|d")
+
+
+class TestSQLiteExport:
+    def test_pages_through_results(self, tmp_path: Path):
+        store = SQLiteSessionStore(tmp_path / "sessions.db")
+        schema = _schema()
+        ids = [_complete(store, schema, f"n{i}", i) for i in range(7)]
+        assert [c.id for c in store.completed_sessions(page_size=3)] == ids
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+from datetime import UTC, date, datetime, timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+
+from interview.engine.schema_registry import schema_fingerprint
+from interview.export import decode_cursor
+from interview.models.schema import FieldSchema, InterviewSchema, SelectOption
+from interview.session.sqlite import SQLiteSessionStore
+from interview.session.store import CompletedSession
+
+pa = pytest.importorskip("pyarrow")
+
+from interview.export_arrow import (  # noqa: E402
+    ArrowBatcher,
+    arrow_schema,
+    read_arrow,
+    record_batches,
+    write_arrow,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+T0 = datetime(2026, 3, 1, 12, 0, tzinfo=UTC)
+
+SCHEMA = InterviewSchema(
+    fields={
+        "name": FieldSchema(type="string"),
+        "age": FieldSchema(type="integer"),
+        "score": FieldSchema(type="float"),
+        "active": FieldSchema(type="boolean"),
+        "born": FieldSchema(type="date"),
+        "plan": FieldSchema(
+            type="enum",
+            options=[
+                SelectOption(value="free", label="Free"),
+                SelectOption(value="pro", label="Pro"),
+            ],
+        ),
+        "address": FieldSchema(type="object", fields={"city": FieldSchema(type="string")}),
+        "pets": FieldSchema(
+            type="array",
+            item_schema=FieldSchema(
+                type="object",
+                fields={"name": FieldSchema(type="string"), "age": FieldSchema(type="integer")},
+            ),
+        ),
+        "tags": FieldSchema(type="array"),
+        "extra": FieldSchema(type="object"),
+    }
+)
+
+DATA = {
+    "name": "Ana",
+    "age": 30,
+    "score": 1,
+    "active": True,
+    "born": "1990-05-17",
+    "plan": "pro",
+    "address": {"city": "Oslo"},
+    "pets": [{"name": "Rex", "age": 3}, {"name": "Tom"}],
+    "tags": ["a", 2],
+    "extra": {"k": 1},
+}
+
+
+def _completed(data: dict, minute: int = 0, session_id: str = "s1") -> CompletedSession:
+    return CompletedSession(session_id, "schema", SCHEMA, T0 + timedelta(minutes=minute), data)
+
+
+class TestArrowSchema:
+    def test_type_mapping(self):
+        schema = arrow_schema(SCHEMA)
+        assert schema.names[:3] == ["session_id", "schema_id", "completed_at"]
+        assert schema.field("age").type == pa.int64()
+        assert schema.field("born").type == pa.date32()
+        assert schema.field("plan").type == pa.dictionary(pa.int32(), pa.string())
+        assert schema.field("address.city").type == pa.string()
+        assert schema.field("pets").type == pa.list_(
+            pa.struct([pa.field("name", pa.string()), pa.field("age", pa.int64())])
+        )
+        assert schema.field("tags").type == pa.list_(pa.string())
+        assert schema.field("extra").type == pa.string()
+
+
+class TestArrowBatcher:
+    def test_values(self):
+        row = ArrowBatcher(SCHEMA).batch([_completed(DATA)]).to_pylist()[0]
+        assert row["completed_at"] == T0
+        assert row["age"] == 30
+        assert row["score"] == 1.0
+        assert row["born"] == date(1990, 5, 17)
+        assert row["plan"] == "pro"
+        assert row["pets"] == [{"name": "Rex", "age": 3}, {"name": "Tom", "age": None}]
+        assert row["tags"] == ["a", "2"]
+        assert row["extra"] == '{"k": 1}'
+
+    def test_missing_and_mistyped_values_are_null(self):
+        data = {"age": "30", "score": True, "born": "soon", "plan": "gold", "pets": "Rex"}
+        row = ArrowBatcher(SCHEMA).batch([_completed(data)]).to_pylist()[0]
+        assert row["name"] is None
+        assert row["address.city"] is None
+        for path in data:
+            assert row[path] is None, path
+
+    def test_enum_dictionary_is_the_options(self):
+        batch = ArrowBatcher(SCHEMA).batch([_completed({"plan": "free"})])
+        assert batch.column("plan").dictionary.to_pylist() == ["free", "pro"]
+
+    def test_batches_are_bounded(self):
+        sessions = [_completed(DATA, minute=i, session_id=f"s{i}") for i in range(5)]
+        batches = list(record_batches(SCHEMA, iter(sessions), batch_size=2))
+        assert [b.num_rows for b in batches] == [2, 2, 1]
+
+
+class TestWriteArrow:
+    @pytest.fixture
+    def store(self, tmp_path: Path) -> SQLiteSessionStore:
+        store = SQLiteSessionStore(tmp_path / "sessions.db")
+        for minute in range(5):
+            session = store.create(SCHEMA, {**DATA, "age": minute})
+            session.is_complete = True
+            session.completed_at = T0 + timedelta(minutes=minute)
+            store.update(session)
+        store.create(SCHEMA, {"name": "Ed"})
+        return store
+
+    @pytest.mark.parametrize("file_format", ["parquet", "arrow"])
+    def test_roundtrip(self, store, tmp_path: Path, file_format):
+        path = tmp_path / f"export.{file_format}"
+        result = write_arrow(
+            store, path, schema_fingerprint(SCHEMA), file_format=file_format, batch_size=2
+        )
+        assert (result.rows, result.batches) == (5, 3)
+        table = read_arrow(path, file_format)
+        assert table.schema.equals(arrow_schema(SCHEMA))
+        assert table.column("age").to_pylist() == [0, 1, 2, 3, 4]
+        assert decode_cursor(result.cursor)[0] == T0 + timedelta(minutes=4)
+
+    def test_resumes_from_cursor(self, store, tmp_path: Path):
+        schema_id = schema_fingerprint(SCHEMA)
+        first = write_arrow(store, tmp_path / "a.parquet", schema_id, limit=3)
+        rest = write_arrow(store, tmp_path / "b.parquet", schema_id, cursor=first.cursor)
+        assert rest.rows == 2
+        assert read_arrow(tmp_path / "b.parquet").column("age").to_pylist() == [3, 4]
+
+    def test_no_sessions(self, store, tmp_path: Path):
+        path = tmp_path / "none.arrow"
+        assert write_arrow(store, path, "unknown", file_format="arrow").rows == 0
+        assert not path.exists()
+        write_arrow(store, path, "unknown", file_format="arrow", schema=SCHEMA)
+        assert read_arrow(path, "arrow").num_rows == 0
+
+    def test_unknown_format(self, store, tmp_path: Path):
+        with pytest.raises(ValueError, match="Unknown export format"):
+            write_arrow(store, tmp_path / "x.csv", "schema", file_format="csv")  # type: ignore[arg-type]
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+from interview.engine.dspy_modules import InterviewStepOutput
+from interview.engine.funnel import ANSWERED, FieldFunnel
+from interview.engine.orchestrator import InterviewOrchestrator
+from interview.models.api import SubmitRequest
+from interview.models.schema import FieldSchema, InterviewSchema, ValidationRule
+from interview.models.ui_blocks import ArrayElement, FormBlock, InputElement, TextBlock
+from interview.session.store import InMemorySessionStore
+
+
+def _schema() -> InterviewSchema:
+    required = [ValidationRule(type="required")]
+    return InterviewSchema(
+        fields={
+            "name": FieldSchema(type="string", validation=required),
+            "age": FieldSchema(
+                type="integer", validation=[*required, ValidationRule(type="min", param=0)]
+            ),
+            "pets": FieldSchema(
+                type="array",
+                item_schema=FieldSchema(type="object", fields={"name": FieldSchema(type="string")}),
+            ),
+        }
+    )
+
+
+def _orchestrator(extracted: dict | None = None) -> InterviewOrchestrator:
+    step = MagicMock()
+    step.return_value.response = InterviewStepOutput(
+        ui_blocks=[
+            TextBlock(value="Hi"),
+            FormBlock(
+                elements=[
+                    InputElement(type="integer", label="Age", binding="age"),
+                    ArrayElement(
+                        label="Pets",
+                        binding="pets",
+                        item_elements=[InputElement(label="Name", binding="name")],
+                    ),
+                ]
+            ),
+        ]
+    )
+    extractor = MagicMock()
+    extractor.return_value.response.extracted = extracted or {}
+    extractor.return_value.response.unresolved = None
+    return InterviewOrchestrator(
+        store=InMemorySessionStore(), interview_step=step, text_extractor=extractor
+    )
+
+
+def _counts(orch: InterviewOrchestrator, schema_id: str) -> dict[str, dict[str, int]]:
+    report = orch.funnel.report(schema_id)
+    assert report is not None
+    return {path: counts.model_dump() for path, counts in report.fields.items()}
+
+
+class TestFieldFunnel:
+    def test_counts_a_full_interview(self):
+        orch = _orchestrator(extracted={"name": "Ana", "age": -1})
+        session_id = orch.start(_schema()).session_id
+        schema_id = orch._store.get(session_id).schema_id
+        orch.submit(session_id, SubmitRequest(type="message", text="I'm Ana, -1 years old"))
+        orch.submit(session_id, SubmitRequest(type="form", data={"age": 30}))
+        orch.submit(
+            session_id,
+            SubmitRequest(type="form", data={"name": "Ana", "age": 30, "pets[0].name": "Rex"}),
+        )
+
+        report = orch.funnel.report(schema_id)
+        assert (report.started, report.completed) == (1, 1)
+        assert _counts(orch, schema_id) == {
+            "name": {"asked": 0, "answered": 2, "invalid": 1, "extracted": 1},
+            "age": {"asked": 2, "answered": 1, "invalid": 1, "extracted": 0},
+            "pets": {"asked": 2, "answered": 1, "invalid": 0, "extracted": 0},
+        }
+
+    def test_unknown_paths_are_ignored(self):
+        orch = _orchestrator()
+        session = orch._store.create(_schema(), {})
+        orch.funnel.record(session, ANSWERED, ["nope", "pets[3].name", "pets[4].name"])
+        assert _counts(orch, session.schema_id)["pets"]["answered"] == 1
+        assert "nope" not in _counts(orch, session.schema_id)
+
+    def test_unseen_schema(self):
+        assert FieldFunnel().report("missing") is None
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from interview.idempotency import IdempotencyCache, IdempotencyKeyReusedError
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestIdempotencyCache:
+    async def test_replays_completed_response(self):
+        cache = IdempotencyCache()
+        calls = 0
+
+        async def compute() -> int:
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert await cache.run("k", "req", compute) == 1
+        assert await cache.run("k", "req", compute) == 1
+        assert calls == 1
+        assert cache.replays == 1
+
+    async def test_retry_waits_for_in_flight_call(self):
+        cache = IdempotencyCache()
+        release = asyncio.Event()
+        calls = 0
+
+        async def compute() -> str:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return "done"
+
+        first = asyncio.create_task(cache.run("k", "req", compute))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(cache.run("k", "req", compute))
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(first, second) == ["done", "done"]
+        assert calls == 1
+
+    async def test_failures_are_not_stored(self):
+        cache = IdempotencyCache()
+        attempts = 0
+
+        async def compute() -> str:
+            nonlocal attempts
+            attempts += 1
+            if attempts == 1:
+                raise RuntimeError("LLM down")
+            return "ok"
+
+        with pytest.raises(RuntimeError):
+            await cache.run("k", "req", compute)
+        assert await cache.run("k", "req", compute) == "ok"
+
+    async def test_key_reuse_with_different_request(self):
+        cache = IdempotencyCache()
+
+        async def compute() -> str:
+            return "ok"
+
+        await cache.run("k", "req-a", compute)
+        with pytest.raises(IdempotencyKeyReusedError):
+            await cache.run("k", "req-b", compute)
+
+    async def test_ttl_and_size_bounds(self):
+        clock = FakeClock()
+        cache = IdempotencyCache(ttl=10, max_entries=2, clock=clock)
+
+        async def compute() -> str:
+            return "ok"
+
+        for key in ("a", "b", "c"):
+            await cache.run(key, "req", compute)
+        assert len(cache) == 2
+
+        clock.now = 11
+        await cache.run("d", "req", compute)
+        assert len(cache) == 1
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from interview.engine import ingest
+from interview.engine.ingest import (
+    BodyTooLargeError,
+    ParsedItem,
+    iter_json_array,
+    iter_ndjson,
+    iter_spooled,
+    spool_body,
+)
+from interview.engine.orchestrator import InterviewOrchestrator
+from interview.engine.validator import ItemValidator
+from interview.models.schema import Condition, FieldSchema, InterviewSchema, ValidationRule
+from interview.session.store import InMemorySessionStore
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+
+async def _chunks(body: bytes, size: int) -> AsyncIterator[bytes]:
+    for i in range(0, len(body), size):
+        yield body[i : i + size]
+
+
+async def _collect(items: AsyncIterator[ParsedItem]) -> list[ParsedItem]:
+    return [item async for item in items]
+
+
+ITEMS: list[Any] = [{"n": i, "s": "é" * i, "x": [1.5, -2e3]} for i in range(20)] + [7, "s", None]
+
+
+class TestParsers:
+    async def test_json_array_across_chunk_boundaries(self):
+        body = json.dumps(ITEMS).encode()
+        for size in (1, 3, 64, len(body)):
+            parsed = await _collect(iter_json_array(_chunks(body, size)))
+            assert [p.value for p in parsed] == ITEMS
+            assert all(p.error is None for p in parsed)
+
+    async def test_ndjson_across_chunk_boundaries(self):
+        body = b"\n".join(json.dumps(item).encode() for item in ITEMS) + b"\n\n"
+        for size in (1, 5, len(body)):
+            parsed = await _collect(iter_ndjson(_chunks(body, size)))
+            assert [p.value for p in parsed] == ITEMS
+
+    async def test_bad_ndjson_line_is_skipped(self):
+        parsed = await _collect(iter_ndjson(_chunks(b'{"a": 1}\nnope\n3', 4)))
+        assert [p.value for p in parsed] == [{"a": 1}, None, 3]
+        assert parsed[1].error is not None
+        assert not parsed[1].fatal
+
+    async def test_unterminated_array_is_fatal(self):
+        parsed = await _collect(iter_json_array(_chunks(b"[1, 2", 2)))
+        assert [p.value for p in parsed[:2]] == [1, 2]
+        assert parsed[2].fatal
+
+    async def test_not_an_array(self):
+        parsed = await _collect(iter_json_array(_chunks(b'{"a": 1}', 100)))
+        assert len(parsed) == 1
+        assert parsed[0].fatal
+
+    async def test_oversized_item_stops_reading(self):
+        body = b'["' + b"x" * 200 + b'", 1]'
+        parsed = await _collect(iter_json_array(_chunks(body, 16), max_item_bytes=64))
+        assert len(parsed) == 1
+        assert parsed[0].fatal
+
+
+class TestSpooledBody:
+    async def test_round_trip_past_the_memory_threshold(self, monkeypatch):
+        monkeypatch.setattr(ingest, "SPOOL_MEMORY_BYTES", 100)
+        body = b"\n".join(json.dumps(item).encode() for item in ITEMS)
+        spool = await spool_body(_chunks(body, 7), max_bytes=len(body))
+        parsed = await _collect(iter_ndjson(iter_spooled(spool)))
+        assert [p.value for p in parsed] == ITEMS
+        assert spool.closed
+
+    async def test_body_over_the_limit(self):
+        with pytest.raises(BodyTooLargeError):
+            await spool_body(_chunks(b"x" * 100, 10), max_bytes=99)
+
+
+def _job_schema() -> FieldSchema:
+    return FieldSchema(
+        type="object",
+        fields={
+            "company": FieldSchema(type="string", validation=[ValidationRule(type="required")]),
+            "years": FieldSchema(type="integer", validation=[ValidationRule(type="min", param=0)]),
+            "reason": FieldSchema(
+                type="string",
+                validation=[ValidationRule(type="required")],
+                conditions=[Condition(field="ask_reason", op="eq", value=True)],
+            ),
+        },
+    )
+
+
+class TestItemValidator:
+    def test_errors_relative_to_item(self):
+        validator = ItemValidator(_job_schema(), {})
+        assert validator.validate({"company": "Acme", "years": 2}) == {}
+        assert set(validator.validate({"years": -1})) == {"company", "years"}
+        assert validator.validate("Acme") == {"": ["Must be an object."]}
+
+    def test_conditions_use_session_data(self):
+        validator = ItemValidator(_job_schema(), {"ask_reason": True})
+        assert set(validator.validate({"company": "Acme"})) == {"reason"}
+
+
+def _orchestrator(max_items: int | None = None) -> tuple[InterviewOrchestrator, str]:
+    rules = [] if max_items is None else [ValidationRule(type="max_items", param=max_items)]
+    schema = InterviewSchema(
+        fields={
+            "jobs": FieldSchema(type="array", validation=rules, item_schema=_job_schema()),
+            "name": FieldSchema(type="string"),
+        }
+    )
+    store = InMemorySessionStore()
+    step = MagicMock()
+    orch = InterviewOrchestrator(store=store, interview_step=step, text_extractor=MagicMock())
+    session = store.create(schema, {"jobs": [{"company": "First"}]})
+    return orch, session.id
+
+
+async def _items(*values: Any) -> AsyncIterator[ParsedItem]:
+    for value in values:
+        yield ParsedItem(value)
+
+
+class TestIngestItems:
+    async def test_appends_in_one_version(self):
+        orch, session_id = _orchestrator()
+        response = await orch.ingest_items(
+            session_id, "jobs", _items({"company": "A"}, {"company": "B", "years": 3})
+        )
+        assert response.accepted == 2
+        assert response.errors == {}
+        assert response.item_errors == []
+        assert response.version == 1
+        session = orch._store.get(session_id)
+        assert session is not None
+        assert [j["company"] for j in session.current_data["jobs"]] == ["First", "A", "B"]
+
+    async def test_any_invalid_item_rejects_all(self):
+        orch, session_id = _orchestrator()
+        response = await orch.ingest_items(
+            session_id, "jobs", _items({"company": "A"}, {"years": 1}, {"company": "C"}, 5)
+        )
+        assert response.accepted == 0
+        assert [e.index for e in response.item_errors] == [1, 3]
+        assert "company" in response.item_errors[0].errors
+        session = orch._store.get(session_id)
+        assert session is not None
+        assert session.current_data == {"jobs": [{"company": "First"}]}
+        assert session.version == 0
+
+    async def test_items_beyond_max_items(self):
+        orch, session_id = _orchestrator(max_items=2)
+        response = await orch.ingest_items(
+            session_id, "jobs", _items({"company": "A"}, {"company": "B"}, {"company": "C"})
+        )
+        assert response.accepted == 0
+        assert [e.index for e in response.item_errors] == [1]
+
+    async def test_start_overwrites_from_index(self):
+        orch, session_id = _orchestrator()
+        response = await orch.ingest_items(session_id, "jobs", _items({"company": "Zero"}), start=0)
+        assert response.accepted == 1
+        session = orch._store.get(session_id)
+        assert session is not None
+        assert session.current_data["jobs"] == [{"company": "Zero"}]
+
+    async def test_rejects_non_array_binding_and_bad_start(self):
+        orch, session_id = _orchestrator()
+        response = await orch.ingest_items(session_id, "name", _items("x"))
+        assert "name" in response.errors
+        response = await orch.ingest_items(session_id, "jobs", _items({"company": "A"}), start=5)
+        assert "jobs" in response.errors
+
+    async def test_unknown_session(self):
+        orch, _ = _orchestrator()
+        response = await orch.ingest_items("nope", "jobs", _items({"company": "A"}))
+        assert "_session" in response.errors
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import copy
+
+import pytest
+
+from interview.engine.merge import (
+    ArrayIndexError,
+    MergeTransaction,
+    PathShapeError,
+    compact_indexes,
+    parse_path,
+)
+from interview.engine.patch import apply_patch
+
+
+def _merge(data: dict, bindings: dict) -> MergeTransaction:
+    return MergeTransaction(data).apply(bindings)
+
+
+class TestParsePath:
+    def test_simple(self):
+        assert parse_path("name") == ["name"]
+
+    def test_nested(self):
+        assert parse_path("user.name") == ["user", "name"]
+
+    def test_with_array(self):
+        assert parse_path("children[0].name") == ["children", 0, "name"]
+
+    def test_nested_with_array(self):
+        assert parse_path("a.b[2].c.d") == ["a", "b", 2, "c", "d"]
+
+    def test_returns_fresh_list(self):
+        parse_path("a.b").append("c")
+        assert parse_path("a.b") == ["a", "b"]
+
+
+class TestMergeTransaction:
+    def test_expands_dotted_bindings(self):
+        transaction = _merge({}, {"user.name": "John", "user.age": 25})
+        assert transaction.data == {"user": {"name": "John", "age": 25}}
+
+    def test_expands_array_bindings(self):
+        transaction = _merge({}, {"children[0].name": "Alice", "children[0].age": 5})
+        assert transaction.data == {"children": [{"name": "Alice", "age": 5}]}
+
+    def test_dict_values_merge_into_existing(self):
+        transaction = _merge({"a": 1, "b": {"c": 2}}, {"b": {"d": 3}, "e": 4})
+        assert transaction.data == {"a": 1, "b": {"c": 2, "d": 3}, "e": 4}
+
+    def test_scalar_overwrites(self):
+        transaction = _merge({"a": {"b": 1}}, {"a.b": 2})
+        assert transaction.data == {"a": {"b": 2}}
+
+    def test_array_binding_keeps_other_items(self):
+        data = {"children": [{"name": "Alice"}, {"name": "Bob"}]}
+        transaction = _merge(data, {"children[1].age": 7})
+        assert transaction.data == {"children": [{"name": "Alice"}, {"name": "Bob", "age": 7}]}
+        assert transaction.data["children"][0] is data["children"][0]
+
+    def test_original_is_not_modified(self):
+        before = {"user": {"name": "John"}, "children": [{"name": "Alice"}], "n": 1}
+        data = copy.deepcopy(before)
+        transaction = _merge(
+            data,
+            {"user.name": "Jane", "children[3].name": "Dee", "children[0].age": 4, "x.y": 1},
+        )
+        assert data == before
+        assert transaction.commit() is transaction.data
+        assert data == before
+
+    def test_changed_paths(self):
+        data = {"user": {"name": "John", "age": 25}}
+        transaction = _merge(data, {"user.name": "John", "user.age": 26, "email": "j@x.io"})
+        assert transaction.changed == {"user.age", "email"}
+
+    def test_ops_reproduce_merge(self):
+        data = {"user": {"name": "John"}, "children": [{"name": "Alice"}]}
+        transaction = _merge(data, {"user.age": 30, "children[2].name": "Cleo"})
+        assert apply_patch(data, transaction.ops) == transaction.data
+
+    def test_unchanged_values_produce_no_ops(self):
+        transaction = _merge({"a": 1, "b": {"c": True}}, {"a": 1, "b.c": True})
+        assert transaction.ops == []
+        assert transaction.changed == set()
+
+    def test_type_change_counts_as_change(self):
+        transaction = _merge({"a": 1}, {"a": True})
+        assert transaction.changed == {"a"}
+
+    def test_ops_do_not_alias_data(self):
+        transaction = _merge({}, {"tags": ["a"]})
+        transaction.data["tags"].append("b")
+        assert transaction.ops == [{"op": "add", "path": "/tags", "value": ["a"]}]
+
+    def test_rollback_drops_staged_data(self):
+        data = {"user": {"name": "John"}, "children": [{"name": "Alice"}], "n": 1}
+        transaction = _merge(
+            data,
+            {"user.name": "Jane", "user.age": 3, "children[3].name": "Dee", "n": None, "x.y": 1},
+        )
+        transaction.rollback()
+        assert transaction.data is data
+        assert transaction.ops == []
+        assert transaction.changed == set()
+
+    def test_index_into_an_object_raises(self):
+        transaction = MergeTransaction({"items": {"a": 1}})
+        with pytest.raises(PathShapeError, match="'items' is an object, not a list") as caught:
+            transaction.apply({"items[0].name": "x"})
+        assert caught.value.path == "items[0].name"
+
+    def test_key_into_a_list_raises(self):
+        transaction = MergeTransaction({"items": [{"a": 1}]})
+        with pytest.raises(PathShapeError, match="'items' is a list, not an object"):
+            transaction.apply({"name": "x", "items.a": 2})
+        transaction.rollback()
+        assert transaction.data == {"items": [{"a": 1}]}
+        assert transaction.ops == []
+
+
+class TestArrayBounds:
+    def test_small_gap_is_padded(self):
+        transaction = _merge({"items": ["a"]}, {"items[3]": "d"})
+        assert transaction.data == {"items": ["a", None, None, "d"]}
+        assert transaction.renamed == {}
+
+    def test_large_gap_is_closed_up(self):
+        data: dict = {"items": [{"name": "a"}, {"name": "b"}]}
+        transaction = _merge(data, {"items[500].name": "x", "items[700].name": "y"})
+        assert transaction.data == {
+            "items": [{"name": "a"}, {"name": "b"}, {"name": "x"}, {"name": "y"}]
+        }
+        assert transaction.bindings == {"items[2].name": "x", "items[3].name": "y"}
+        assert transaction.original_path("items[3].name") == "items[700].name"
+        assert transaction.original_path("items[1].name") == "items[1].name"
+
+    def test_nested_gaps(self):
+        bindings, renamed = compact_indexes({"a[500].b[900]": 1, "a[500].c": 2}, {})
+        assert bindings == {"a[0].b[0]": 1, "a[0].c": 2}
+        assert renamed == {"a[0]": "a[500]", "a[0].b[0]": "a[500].b[900]"}
+
+    def test_index_at_cap_raises_before_writing(self):
+        data: dict = {"items": []}
+        transaction = MergeTransaction(data, max_items=10)
+        with pytest.raises(ArrayIndexError):
+            transaction.apply({"name": "x", "items[3]": 1, "other[10]": 2})
+        assert data == {"items": []}
+
+    def test_rollback_forgets_renames(self):
+        data: dict = {}
+        transaction = _merge(data, {"items[100]": 1})
+        transaction.rollback()
+        assert transaction.data == {}
+        assert transaction.renamed == {}
@@ -1,76 +1,17 @@
 from __future__ import annotations
 
+import asyncio
+import time
 from typing import Any
 from unittest.mock import MagicMock
 
+import pytest
+
 from interview.engine.dspy_modules import InterviewStepOutput
-from interview.engine.orchestrator import (
-    InterviewOrchestrator,
-    _deep_merge,
-    _expand_bindings,
-    _parse_path,
-)
+from interview.engine.orchestrator import InterviewOrchestrator
 from interview.models.schema import FieldSchema, InterviewSchema, ValidationRule
 from interview.models.ui_blocks import FormBlock, InputElement, TextBlock
-from interview.session.store import InMemorySessionStore
-
-# --- Utility function tests ---
-
-
-def test_parse_path_simple():
-    assert _parse_path("name") == ["name"]
-
-
-def test_parse_path_nested():
-    assert _parse_path("user.name") == ["user", "name"]
-
-
-def test_parse_path_with_array():
-    assert _parse_path("children[0].name") == ["children", 0, "name"]
-
-
-def test_parse_path_deep():
-    assert _parse_path("a.b[2].c.d") == ["a", "b", 2, "c", "d"]
-
-
-def test_deep_merge_basic():
-    base = {"a": 1, "b": {"c": 2}}
-    updates = {"b": {"d": 3}, "e": 4}
-    result = _deep_merge(base, updates)
-    assert result == {"a": 1, "b": {"c": 2, "d": 3}, "e": 4}
-
-
-def test_deep_merge_overwrite():
-    base = {"a": {"b": 1}}
-    updates = {"a": {"b": 2}}
-    result = _deep_merge(base, updates)
-    assert result == {"a": {"b": 2}}
-
-
-def test_deep_merge_no_mutate():
-    base = {"a": {"b": 1}}
-    updates = {"a": {"c": 2}}
-    _deep_merge(base, updates)
-    assert base == {"a": {"b": 1}}
-
-
-def test_expand_bindings_simple():
-    flat = {"user.name": "John", "user.age": 25}
-    result = _expand_bindings(flat)
-    assert result == {"user": {"name": "John", "age": 25}}
-
-
-def test_expand_bindings_with_array():
-    flat = {"children[0].name": "Alice", "children[0].age": 5}
-    result = _expand_bindings(flat)
-    assert result == {"children": [{"name": "Alice", "age": 5}]}
-
-
-def test_expand_bindings_nested():
-    flat = {"a.b.c": 1}
-    result = _expand_bindings(flat)
-    assert result == {"a": {"b": {"c": 1}}}
-
+from interview.session.store import InMemorySessionStore, VersionConflictError
 
 # --- Orchestrator class tests ---
 
@@ -247,6 +188,63 @@ class TestOrchestratorFormSubmission:
         assert not response.is_complete
         assert "age" in response.errors
 
+    def test_submit_form_rejects_out_of_range_index(self):
+        store = InMemorySessionStore()
+        schema = InterviewSchema(
+            fields={
+                "pets": FieldSchema(
+                    type="array",
+                    validation=[ValidationRule(type="max_items", param=3)],
+                    item_schema=FieldSchema(type="string"),
+                ),
+            }
+        )
+        orch = InterviewOrchestrator(
+            store=store,
+            interview_step=_mock_interview_step(),
+            text_extractor=_mock_text_extractor(),
+        )
+        start_resp = orch.start(schema)
+
+        from interview.models.api import SubmitRequest
+
+        submit_req = SubmitRequest(type="form", data={"pets[5000000]": "cat"})
+        response = orch.submit(start_resp.session_id, submit_req)
+
+        assert "pets[5000000]" in response.errors
+        session = store.get(start_resp.session_id)
+        assert session is not None
+        assert session.current_data == {}
+
+    def test_submit_form_rejects_path_of_the_wrong_shape(self):
+        store = InMemorySessionStore()
+        schema = InterviewSchema(
+            fields={
+                "pets": FieldSchema(
+                    type="array",
+                    item_schema=FieldSchema(
+                        type="object", fields={"name": FieldSchema(type="string")}
+                    ),
+                ),
+            }
+        )
+        orch = InterviewOrchestrator(
+            store=store,
+            interview_step=_mock_interview_step(),
+            text_extractor=_mock_text_extractor(),
+        )
+        start_resp = orch.start(schema, initial_data={"pets": {"name": "Rex"}})
+
+        from interview.models.api import SubmitRequest
+
+        submit_req = SubmitRequest(type="form", data={"pets[0].name": "Tom"})
+        response = orch.submit(start_resp.session_id, submit_req)
+
+        assert response.errors == {"pets[0].name": ["'pets' is an object, not a list."]}
+        session = store.get(start_resp.session_id)
+        assert session is not None
+        assert session.current_data == {"pets": {"name": "Rex"}}
+
     def test_submit_to_nonexistent_session(self):
         store = InMemorySessionStore()
         orch = InterviewOrchestrator(
@@ -323,3 +321,281 @@ class TestOrchestratorTextMessage:
         assert response.current_data == {"name": "Alice"}
         # Should still have blocks for remaining fields
         assert len(response.blocks) > 0
+
+
+class TestOrchestratorExtractionCascade:
+    def test_fast_extraction_accepted_skips_full_model(self):
+        store = InMemorySessionStore()
+        fast = _mock_text_extractor(extracted={"name": "John"})
+        full = _mock_text_extractor(extracted={"name": "Johnny"})
+        orch = InterviewOrchestrator(
+            store=store,
+            interview_step=_mock_interview_step(),
+            text_extractor=full,
+            fast_text_extractor=fast,
+        )
+        start_resp = orch.start(_simple_schema())
+
+        from interview.models.api import SubmitRequest
+
+        response = orch.submit(
+            start_resp.session_id, SubmitRequest(type="message", text="I'm John")
+        )
+
+        assert response.current_data == {"name": "John"}
+        fast.assert_called_once()
+        full.assert_not_called()
+
+    def test_invalid_fast_extraction_escalates(self):
+        store = InMemorySessionStore()
+        schema = InterviewSchema(
+            fields={
+                "age": FieldSchema(
+                    type="integer",
+                    validation=[
+                        ValidationRule(type="required"),
+                        ValidationRule(type="min", param=18),
+                    ],
+                ),
+            }
+        )
+        fast = _mock_text_extractor(extracted={"age": 3})
+        full = _mock_text_extractor(extracted={"age": 30})
+        orch = InterviewOrchestrator(
+            store=store,
+            interview_step=_mock_interview_step(),
+            text_extractor=full,
+            fast_text_extractor=fast,
+        )
+        start_resp = orch.start(schema)
+
+        from interview.models.api import SubmitRequest
+
+        response = orch.submit(
+            start_resp.session_id, SubmitRequest(type="message", text="I'm thirty")
+        )
+
+        assert response.current_data == {"age": 30}
+        full.assert_called_once()
+
+    def test_unknown_binding_escalates(self):
+        store = InMemorySessionStore()
+        fast = _mock_text_extractor(extracted={"nickname": "JJ"})
+        full = _mock_text_extractor(extracted={"name": "John"})
+        orch = InterviewOrchestrator(
+            store=store,
+            interview_step=_mock_interview_step(),
+            text_extractor=full,
+            fast_text_extractor=fast,
+        )
+        start_resp = orch.start(_simple_schema())
+
+        from interview.models.api import SubmitRequest
+
+        response = orch.submit(
+            start_resp.session_id, SubmitRequest(type="message", text="I'm John, JJ")
+        )
+
+        assert response.current_data == {"name": "John"}
+        full.assert_called_once()
+
+    def test_binding_not_requested_escalates(self):
+        store = InMemorySessionStore()
+        fast = _mock_text_extractor(extracted={"name": "Jon"})
+        full = _mock_text_extractor(extracted={"age": 30})
+        orch = InterviewOrchestrator(
+            store=store,
+            interview_step=_mock_interview_step(),
+            text_extractor=full,
+            fast_text_extractor=fast,
+        )
+        start_resp = orch.start(_simple_schema(), initial_data={"name": "John"})
+
+        from interview.models.api import SubmitRequest
+
+        response = orch.submit(start_resp.session_id, SubmitRequest(type="message", text="I'm 30"))
+
+        assert response.current_data == {"name": "John", "age": 30}
+        full.assert_called_once()
+
+    def test_optional_binding_accepted(self):
+        store = InMemorySessionStore()
+        schema = _simple_schema()
+        schema.fields["nickname"] = FieldSchema(type="string", label="Nickname")
+        fast = _mock_text_extractor(extracted={"nickname": "JJ"})
+        full = _mock_text_extractor(extracted={})
+        orch = InterviewOrchestrator(
+            store=store,
+            interview_step=_mock_interview_step(),
+            text_extractor=full,
+            fast_text_extractor=fast,
+        )
+        start_resp = orch.start(schema)
+
+        from interview.models.api import SubmitRequest
+
+        response = orch.submit(
+            start_resp.session_id, SubmitRequest(type="message", text="Call me JJ")
+        )
+
+        assert response.current_data == {"nickname": "JJ"}
+        full.assert_not_called()
+
+    def test_empty_fast_extraction_accepted(self):
+        store = InMemorySessionStore()
+        fast = _mock_text_extractor(extracted={})
+        full = _mock_text_extractor(extracted={})
+        orch = InterviewOrchestrator(
+            store=store,
+            interview_step=_mock_interview_step(),
+            text_extractor=full,
+            fast_text_extractor=fast,
+        )
+        start_resp = orch.start(_simple_schema())
+
+        from interview.models.api import SubmitRequest
+
+        orch.submit(start_resp.session_id, SubmitRequest(type="message", text="hello"))
+
+        fast.assert_called_once()
+        full.assert_not_called()
+
+
+class TestOrchestratorDeltaResponses:
+    def _orchestrator(self) -> InterviewOrchestrator:
+        return InterviewOrchestrator(
+            store=InMemorySessionStore(),
+            interview_step=_mock_interview_step(),
+            text_extractor=_mock_text_extractor(extracted={"name": "John"}),
+        )
+
+    def test_full_snapshot_by_default(self):
+        orch = self._orchestrator()
+        start_resp = orch.start(_simple_schema())
+
+        from interview.models.api import SubmitRequest
+
+        response = orch.submit(start_resp.session_id, SubmitRequest(type="message", text="John"))
+
+        assert response.current_data == {"name": "John"}
+        assert response.patch is None
+        assert response.version == 1
+
+    def test_start_delta_mode_omits_data(self):
+        orch = self._orchestrator()
+        start_resp = orch.start(_simple_schema(), initial_data={"name": "John"}, delta=True)
+
+        assert start_resp.current_data is None
+        assert start_resp.patch == []
+        assert start_resp.version == 0
+
+    def test_submit_returns_patch_since_version(self):
+        orch = self._orchestrator()
+        start_resp = orch.start(_simple_schema())
+
+        from interview.models.api import SubmitRequest
+
+        response = orch.submit(
+            start_resp.session_id,
+            SubmitRequest(type="message", text="I'm John", since_version=0),
+        )
+
+        assert response.current_data is None
+        assert response.patch == [{"op": "add", "path": "/name", "value": "John"}]
+        assert response.version == 1
+
+    def test_patch_spans_multiple_versions(self):
+        orch = self._orchestrator()
+        start_resp = orch.start(_simple_schema())
+
+        from interview.models.api import SubmitRequest
+
+        orch.submit(start_resp.session_id, SubmitRequest(type="message", text="I'm John"))
+        response = orch.submit(
+            start_resp.session_id,
+            SubmitRequest(type="form", data={"name": "Jane", "age": 30}, since_version=0),
+        )
+
+        assert response.version == 2
+        assert response.patch == [
+            {"op": "add", "path": "/name", "value": "John"},
+            {"op": "replace", "path": "/name", "value": "Jane"},
+            {"op": "add", "path": "/age", "value": 30},
+        ]
+
+    def test_version_mismatch_falls_back_to_snapshot(self):
+        orch = self._orchestrator()
+        start_resp = orch.start(_simple_schema())
+
+        from interview.models.api import SubmitRequest
+
+        response = orch.submit(
+            start_resp.session_id,
+            SubmitRequest(type="message", text="I'm John", since_version=7),
+        )
+
+        assert response.current_data == {"name": "John"}
+        assert response.patch is None
+
+
+class TestOrchestratorConcurrentSubmits:
+    def _orchestrator(self, delay: float = 0.05) -> tuple[InterviewOrchestrator, MagicMock]:
+        extractor = _mock_text_extractor({"name": "John"})
+        extracted = extractor.return_value
+
+        def slow_extract(**_: str) -> Any:
+            time.sleep(delay)
+            return extracted
+
+        extractor.side_effect = slow_extract
+        orch = InterviewOrchestrator(
+            store=InMemorySessionStore(),
+            interview_step=_mock_interview_step(),
+            text_extractor=extractor,
+        )
+        return orch, extractor
+
+    async def test_duplicate_submit_shares_in_flight_turn(self):
+        orch, extractor = self._orchestrator()
+        start_resp = orch.start(_simple_schema())
+
+        from interview.models.api import SubmitRequest
+
+        request = SubmitRequest(type="message", text="I'm John")
+        first, second = await asyncio.gather(
+            orch.submit_async(start_resp.session_id, request),
+            orch.submit_async(start_resp.session_id, request.model_copy()),
+        )
+
+        assert first == second
+        assert extractor.call_count == 1
+        session = orch._store.get(start_resp.session_id)
+        assert session is not None
+        assert len(session.conversation_history) == 4  # assistant, user, system, assistant
+
+    async def test_different_submits_are_serialised(self):
+        orch, extractor = self._orchestrator()
+        start_resp = orch.start(_simple_schema())
+
+        from interview.models.api import SubmitRequest
+
+        await asyncio.gather(
+            orch.submit_async(start_resp.session_id, SubmitRequest(type="message", text="a")),
+            orch.submit_async(start_resp.session_id, SubmitRequest(type="message", text="b")),
+        )
+
+        assert extractor.call_count == 2
+        session = orch._store.get(start_resp.session_id)
+        assert session is not None
+        user_turns = [t.content for t in session.conversation_history if t.role == "user"]
+        assert sorted(user_turns) == ["a", "b"]
+        assert not orch._locks
+
+    def test_stale_session_copy_rejected(self):
+        store = InMemorySessionStore()
+        session = store.create(_simple_schema(), {})
+        stale = session.model_copy()
+        store.update(session)
+
+        with pytest.raises(VersionConflictError):
+            store.update(stale)
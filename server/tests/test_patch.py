@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from typing import Any
+
+from interview.engine.patch import apply_patch, apply_patch_in_place, diff_data
+
+
+def test_diff_nested_change_is_single_op():
+    old = {"a": {"b": 1, "c": 2}, "items": [1, 2, 3]}
+    new = {"a": {"b": 1, "c": 5}, "items": [1, 2, 3]}
+    assert diff_data(old, new) == [{"op": "replace", "path": "/a/c", "value": 5}]
+
+
+def test_diff_list_append_and_truncate():
+    assert diff_data({"x": [1]}, {"x": [1, 2]}) == [{"op": "add", "path": "/x/1", "value": 2}]
+    assert diff_data({"x": [1, 2, 3]}, {"x": [1]}) == [
+        {"op": "remove", "path": "/x/2"},
+        {"op": "remove", "path": "/x/1"},
+    ]
+
+
+def test_diff_escapes_keys():
+    ops = diff_data({}, {"a/b~c": 1})
+    assert ops == [{"op": "add", "path": "/a~1b~0c", "value": 1}]
+    assert apply_patch({}, ops) == {"a/b~c": 1}
+
+
+def test_diff_bool_vs_int_is_a_change():
+    assert diff_data({"x": 1}, {"x": True}) == [{"op": "replace", "path": "/x", "value": True}]
+
+
+def test_apply_roundtrip():
+    old = {"a": {"b": [1, {"c": 2}]}, "d": "x", "gone": None}
+    new = {"a": {"b": [1, {"c": 3}, 4]}, "d": "y", "e": {"f": []}}
+    assert apply_patch(old, diff_data(old, new)) == new
+
+
+def test_apply_does_not_mutate_input():
+    doc = {"a": {"b": 1}}
+    apply_patch(doc, [{"op": "replace", "path": "/a/b", "value": 2}])
+    assert doc == {"a": {"b": 1}}
+
+
+def test_apply_in_place_keeps_op_values_separate():
+    doc: dict[str, Any] = {"a": {"b": 1}}
+    ops = [{"op": "add", "path": "/c", "value": {}}, {"op": "add", "path": "/c/d", "value": 2}]
+
+    assert apply_patch_in_place(doc, ops) is doc
+    assert doc == {"a": {"b": 1}, "c": {"d": 2}}
+    assert ops[0]["value"] == {}
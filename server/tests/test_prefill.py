@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import random
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from interview.engine import columnar
+from interview.engine.ingest import ParsedItem
+from interview.engine.prefill import (
+    NOT_AN_OBJECT,
+    analyze_record,
+    analyze_records,
+    analyze_stream,
+)
+from interview.models.schema import Condition, FieldSchema, InterviewSchema, ValidationRule
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+SCHEMA = InterviewSchema(
+    fields={
+        "name": FieldSchema(type="string", validation=[ValidationRule(type="required")]),
+        "age": FieldSchema(type="integer", validation=[ValidationRule(type="min", param=18)]),
+        "employer": FieldSchema(
+            type="string",
+            validation=[ValidationRule(type="required")],
+            conditions=[Condition(field="employed", op="eq", value=True)],
+        ),
+    }
+)
+
+RECORDS = [
+    {"name": "Ann", "age": 30},
+    {"age": 12},
+    {"name": "Bo", "employed": True},
+    "not a record",
+] * 50
+
+
+def _expected(index: int) -> tuple[list[str], dict[str, list[str]]]:
+    return [
+        ([], {}),
+        (["name"], {"age": ["Must be at least 18."]}),
+        (["employer"], {}),
+        ([], {}),
+    ][index % 4]
+
+
+class TestAnalyzeRecord:
+    def test_complete_record(self):
+        report = analyze_record(SCHEMA, {"name": "Ann", "age": 30})
+        assert report.is_complete
+        assert report.to_dict() == {"index": 0, "is_complete": True, "missing": [], "invalid": {}}
+
+    def test_missing_and_invalid(self):
+        report = analyze_record(SCHEMA, {"age": 12, "employed": True}, index=4)
+        assert report.index == 4
+        assert report.missing == ["name", "employer"]
+        assert set(report.invalid) == {"age"}
+        assert not report.is_complete
+
+    def test_non_object(self):
+        report = analyze_record(SCHEMA, [1, 2])
+        assert report.error == NOT_AN_OBJECT
+        assert not report.is_complete
+        assert report.to_dict() == {"index": 0, "error": NOT_AN_OBJECT}
+
+
+class TestAnalyzeRecords:
+    def test_in_process(self):
+        reports = list(analyze_records(SCHEMA, RECORDS, workers=0))
+        assert [r.index for r in reports] == list(range(len(RECORDS)))
+        assert [r.is_complete for r in reports[:4]] == [True, False, False, False]
+
+    def test_process_pool_keeps_order(self):
+        reports = list(analyze_records(SCHEMA, iter(RECORDS), workers=2, chunk_size=7))
+        assert [r.index for r in reports] == list(range(len(RECORDS)))
+        for report in reports:
+            if report.error is None:
+                assert (report.missing, report.invalid) == _expected(report.index)
+            else:
+                assert report.index % 4 == 3
+
+
+NESTED_SCHEMA = InterviewSchema(
+    fields={
+        "name": FieldSchema(
+            type="string",
+            validation=[
+                ValidationRule(type="required"),
+                ValidationRule(type="min_length", param=2),
+            ],
+        ),
+        "age": FieldSchema(type="integer", validation=[ValidationRule(type="min", param=18)]),
+        "employed": FieldSchema(type="boolean"),
+        "job": FieldSchema(
+            type="object",
+            conditions=[Condition(field="employed", op="eq", value=True)],
+            fields={
+                "title": FieldSchema(type="string", validation=[ValidationRule(type="required")]),
+                "years": FieldSchema(
+                    type="integer",
+                    validation=[
+                        ValidationRule(type="required"),
+                        ValidationRule(type="min", param=0),
+                    ],
+                    conditions=[Condition(field="age", op="gte", value=21)],
+                ),
+            },
+        ),
+        "children": FieldSchema(
+            type="array",
+            validation=[ValidationRule(type="max_items", param=2)],
+            item_schema=FieldSchema(
+                type="object",
+                fields={
+                    "name": FieldSchema(
+                        type="string", validation=[ValidationRule(type="required")]
+                    ),
+                },
+            ),
+        ),
+    }
+)
+
+NESTED_VALUES: dict[str, list[Any]] = {
+    "name": ["Al", "A", "", None, 7],
+    "age": [30, 17, 21, 18.5],
+    "employed": [True, False, None],
+    "job": [{}, {"title": "dev"}, {"years": -1}, {"title": "", "years": 3}, "n/a"],
+    "children": [[], [{"name": "Cy"}], [{}], [{"name": "A"}, {}, {"name": ""}], "none"],
+}
+
+
+def _nested_records(count: int) -> list[Any]:
+    rng = random.Random(11)  # noqa: S311
+    records: list[Any] = [
+        {path: rng.choice(values) for path, values in NESTED_VALUES.items() if rng.random() < 0.8}
+        for _ in range(count)
+    ]
+    return [*records, ["not", "a", "record"]]
+
+
+@pytest.fixture(params=["numpy", "python"])
+def engine(request, monkeypatch):
+    if request.param == "python":
+        monkeypatch.setattr(columnar, "np", None)
+    elif columnar.np is None:
+        pytest.skip("numpy is not installed")
+
+
+@pytest.mark.usefixtures("engine")
+class TestColumnarChunks:
+    def test_matches_per_record_analysis(self):
+        records = _nested_records(1000)
+        reports = list(analyze_records(NESTED_SCHEMA, records, workers=0, chunk_size=64))
+        assert len(reports) == len(records)
+        for report, record in zip(reports, records, strict=True):
+            assert report == analyze_record(NESTED_SCHEMA, record, report.index), record
+
+
+async def _items(*items: ParsedItem) -> AsyncIterator[ParsedItem]:
+    for item in items:
+        yield item
+
+
+class TestAnalyzeStream:
+    async def test_reports_parse_errors_in_order(self):
+        items = _items(
+            ParsedItem({"name": "Ann"}),
+            ParsedItem(None, "Invalid JSON"),
+            ParsedItem({}),
+        )
+        with ThreadPoolExecutor(2) as pool:
+            reports = [r async for r in analyze_stream(SCHEMA, items, pool, chunk_size=1)]
+        assert [r.index for r in reports] == [0, 1, 2]
+        assert reports[0].is_complete
+        assert reports[1].error == "Invalid JSON"
+        assert reports[2].missing == ["name"]
+
+    async def test_fatal_error_ends_stream(self):
+        items = _items(ParsedItem({}), ParsedItem(None, "Unterminated", fatal=True))
+        reports = [r async for r in analyze_stream(SCHEMA, items)]
+        assert [r.error for r in reports] == [None, "Unterminated"]
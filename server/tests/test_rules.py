@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import json
+import re
+
+import pytest
+
+from interview.engine.rules import RULES_FORMAT, compile_rules, js_regex, rule_bundle
+from interview.engine.validator import validate_field
+from interview.models.schema import Condition, FieldSchema, InterviewSchema, ValidationRule
+
+SCHEMA = InterviewSchema(
+    fields={
+        "email": FieldSchema(
+            type="string",
+            validation=[
+                ValidationRule(type="required"),
+                ValidationRule(type="pattern", param=r"(?i)^\S+@\S+\Z", message="Bad email."),
+            ],
+        ),
+        "employed": FieldSchema(type="boolean"),
+        "job": FieldSchema(
+            type="object",
+            conditions=[Condition(field="employed", op="eq", value=True)],
+            fields={
+                "title": FieldSchema(
+                    type="string", validation=[ValidationRule(type="max_length", param=20)]
+                ),
+                "years": FieldSchema(
+                    type="integer",
+                    conditions=[Condition(field="age", op="gte", value=21)],
+                    validation=[ValidationRule(type="pattern", param="(?x) a b")],
+                ),
+            },
+        ),
+        "age": FieldSchema(type="integer"),
+        "pets": FieldSchema(
+            type="array",
+            validation=[ValidationRule(type="max_items", param=3)],
+            item_schema=FieldSchema(
+                type="object",
+                fields={
+                    "name": FieldSchema(
+                        type="string", validation=[ValidationRule(type="required")]
+                    ),
+                    "vaccinated": FieldSchema(
+                        type="boolean",
+                        conditions=[Condition(field="employed", op="eq", value=True)],
+                    ),
+                },
+            ),
+        ),
+        "tags": FieldSchema(type="array", item_schema=FieldSchema(type="string")),
+    }
+)
+
+
+class TestRuleBundle:
+    def test_fields_and_rules(self):
+        bundle = rule_bundle(SCHEMA)
+        assert bundle["format"] == RULES_FORMAT
+        assert list(bundle["fields"]) == [
+            "email",
+            "employed",
+            "job.title",
+            "job.years",
+            "age",
+            "pets",
+            "tags",
+        ]
+        assert bundle["fields"]["email"]["rules"] == [
+            {"type": "required", "message": "This field is required."},
+            {
+                "type": "pattern",
+                "param": r"^\S+@\S+(?![\s\S])",
+                "flags": "i",
+                "message": "Bad email.",
+            },
+        ]
+        assert bundle["fields"]["employed"] == {"type": "boolean"}
+
+    def test_messages_match_the_server(self):
+        rules = rule_bundle(SCHEMA)["fields"]["job.title"]["rules"]
+        field = SCHEMA.fields["job"].fields["title"]
+        assert [r["message"] for r in rules] == validate_field("x" * 21, field)
+
+    def test_conditions_include_parents(self):
+        bundle = rule_bundle(SCHEMA)
+        conditions = bundle["conditions"]
+        fields = bundle["fields"]
+        assert [conditions[i] for i in fields["job.title"]["when"]] == [["employed", "eq", True]]
+        assert [conditions[i] for i in fields["job.years"]["when"]] == [
+            ["employed", "eq", True],
+            ["age", "gte", 21],
+        ]
+        # The same condition on pets[].vaccinated is stored once
+        assert len(conditions) == 2
+
+    def test_array_items(self):
+        items = rule_bundle(SCHEMA)["fields"]["pets"]["items"]
+        assert items["name"]["rules"] == [
+            {"type": "required", "message": "This field is required."}
+        ]
+        assert rule_bundle(SCHEMA)["fields"]["tags"]["items"] == {"": {"type": "string"}}
+
+    def test_dependency_graph(self):
+        assert rule_bundle(SCHEMA)["dependents"] == {
+            "employed": ["job.title", "job.years", "pets[].vaccinated"],
+            "age": ["job.years"],
+        }
+
+    def test_untranslatable_pattern_is_server_only(self):
+        entry = rule_bundle(SCHEMA)["fields"]["job.years"]
+        assert entry["partial"] is True
+        assert entry["rules"] == []
+
+
+class TestCompileRules:
+    def test_cached_with_stable_etag(self):
+        bundle = compile_rules(SCHEMA)
+        assert compile_rules(SCHEMA) is bundle
+        assert json.loads(bundle.body) == rule_bundle(SCHEMA)
+        copy = InterviewSchema.model_validate_json(SCHEMA.model_dump_json())
+        assert compile_rules(copy).etag == bundle.etag
+
+
+class TestJsRegex:
+    @pytest.mark.parametrize(
+        ("pattern", "expected"),
+        [
+            (r"^\d{5}$", (r"^\d{5}$", "")),
+            (r"(?is)\Aab", (r"(?<![\s\S])ab", "is")),
+            (r"(?m)^a\Z", (r"^a(?![\s\S])", "m")),
+            (r"(?P<x>a)(?P=x)", (r"(?<x>a)\k<x>", "")),
+            (r"\\A", (r"\\A", "")),
+            (r"(?:a)(?=b)(?<!c)", (r"(?:a)(?=b)(?<!c)", "")),
+            (r"(?i:a)", None),
+            (r"(?a)\w", None),
+            ("[", None),
+        ],
+    )
+    def test_translation(self, pattern, expected):
+        assert js_regex(pattern) == expected
+
+    @pytest.mark.parametrize("pattern", [r"(?m)^b\Z", r"(?m)\Ab$", r"(?m)\Aa$"])
+    def test_multiline_anchors_keep_whole_input_meaning(self, pattern):
+        # Both translations are also valid Python, so the search can be compared here
+        translated = js_regex(pattern)
+        assert translated is not None
+        source, flags = translated
+        js_flags = re.MULTILINE if "m" in flags else 0
+        for text in ("a\nb", "b\na", "a\nb\n"):
+            assert bool(re.search(source, text, js_flags)) == bool(re.search(pattern, text))
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from interview.engine.schema_analyzer import compile_schema
+from interview.engine.schema_registry import SchemaRegistry, schema_fingerprint
+from interview.models.schema import FieldSchema, InterviewSchema
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _schema(label: str = "Name") -> InterviewSchema:
+    return InterviewSchema(fields={"name": FieldSchema(type="string", label=label)})
+
+
+class TestSchemaFingerprint:
+    def test_equal_content_equal_fingerprint(self):
+        assert schema_fingerprint(_schema()) == schema_fingerprint(_schema())
+
+    def test_different_content_different_fingerprint(self):
+        assert schema_fingerprint(_schema("Name")) != schema_fingerprint(_schema("Full name"))
+
+
+class TestSchemaRegistry:
+    def test_register_is_idempotent(self):
+        registry = SchemaRegistry()
+        first = registry.register(_schema(), name="profile")
+        second = registry.register(_schema(), name="profile")
+
+        assert second is first
+        assert len(registry) == 1
+
+    def test_versions_count_per_name(self):
+        registry = SchemaRegistry()
+        v1 = registry.register(_schema("Name"), name="profile")
+        v2 = registry.register(_schema("Full name"), name="profile")
+        other = registry.register(_schema("Other"), name="other")
+
+        assert (v1.version, v2.version, other.version) == (1, 2, 1)
+        assert v1.schema_id != v2.schema_id
+
+    def test_compiled_once_and_shared(self):
+        registry = SchemaRegistry()
+        entry = registry.register(_schema())
+
+        assert compile_schema(entry.schema) is entry.compiled
+        assert set(entry.compiled.flat) == {"name"}
+
+    def test_load_directory(self, tmp_path: Path):
+        (tmp_path / "profile.json").write_text(_schema().model_dump_json())
+        registry = SchemaRegistry()
+
+        entries = registry.load_directory(tmp_path)
+
+        assert [e.name for e in entries] == ["profile"]
+        assert registry.get(entries[0].schema_id) is entries[0]
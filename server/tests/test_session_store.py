@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import gc
+
+from interview.engine.schema_registry import schema_fingerprint
+from interview.models.schema import FieldSchema, InterviewSchema
+from interview.models.session import ConversationTurn, Session, VersionedPatch
+from interview.session.bounded import BoundedSessionStore, approx_session_bytes
+from interview.session.store import InMemorySessionStore, SchemaInterner
+
+
+def _schema(label: str = "Name") -> InterviewSchema:
+    return InterviewSchema(fields={"name": FieldSchema(type="string", label=label)})
+
+
+class TestSchemaInterner:
+    def test_equal_schemas_share_one_instance(self):
+        interner = SchemaInterner()
+        first_id, first = interner.intern(_schema())
+        second_id, second = interner.intern(_schema())
+
+        assert second is first
+        assert first_id == second_id == schema_fingerprint(first)
+        assert len(interner) == 1
+
+    def test_different_schemas_kept_apart(self):
+        interner = SchemaInterner()
+        _, a = interner.intern(_schema("Name"))
+        _, b = interner.intern(_schema("Full name"))
+
+        assert a is not b
+        assert len(interner) == 2
+
+    def test_released_when_no_session_holds_it(self):
+        evicted: list[Session] = []
+        store = BoundedSessionStore(max_sessions=1, on_evict=evicted.append)
+        first = store.create(_schema("Name"), {})
+        schema_id = first.schema_id
+        store.create(_schema("Full name"), {})
+        del first
+        evicted.clear()
+        gc.collect()
+
+        assert schema_id is not None
+        assert store.interner.get(schema_id) is None
+        assert len(store.interner) == 1
+
+
+class TestInMemorySessionStoreInterning:
+    def test_create_dedupes_schema(self):
+        store = InMemorySessionStore()
+        s1 = store.create(_schema(), {})
+        s2 = store.create(_schema(), {})
+
+        assert s1.schema_ is s2.schema_
+        assert s1.schema_id == s2.schema_id
+
+    def test_load_dedupes_schema(self):
+        store = InMemorySessionStore()
+        live = store.create(_schema(), {"name": "Ana"})
+        payload = live.model_dump_json(by_alias=True)
+
+        restored = InMemorySessionStore(interner=store.interner).load(payload)
+
+        assert restored.schema_ is live.schema_
+        assert restored.current_data == {"name": "Ana"}
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestBoundedSessionStore:
+    def test_lru_eviction_by_count(self):
+        evicted: list[Session] = []
+        store = BoundedSessionStore(max_sessions=2, on_evict=evicted.append)
+        a = store.create(_schema(), {})
+        b = store.create(_schema(), {})
+        store.get(a.id)  # a is now most recently used
+        store.create(_schema(), {})
+
+        assert store.get(b.id) is None
+        assert store.get(a.id) is a
+        assert [s.id for s in evicted] == [b.id]
+        assert store.stats()["evictions"] == 1
+
+    def test_spilled_session_loads_back(self):
+        from interview.session.compact import dump_session
+
+        spilled: list[bytes] = []
+        store = BoundedSessionStore(
+            max_sessions=1, on_evict=lambda s: spilled.append(dump_session(s))
+        )
+        schema = _schema()
+        first = store.create(schema, {"name": "Ana"})
+        first.conversation_history.append(ConversationTurn(role="user", content="I'm Ana"))
+        store.update(first)
+        store.create(schema, {})
+
+        restored = BoundedSessionStore(max_sessions=1).load(spilled[0], schema)
+
+        assert restored.model_dump() == first.model_dump()
+
+    def test_eviction_by_bytes(self):
+        store = BoundedSessionStore(max_bytes=3 * approx_session_bytes(_session_like()))
+        ids = [store.create(_schema(), {}).id for _ in range(5)]
+
+        assert len(store) == 3
+        assert store.get(ids[0]) is None
+        assert store.approx_bytes <= store.max_bytes  # type: ignore[operator]
+
+    def test_idle_ttl_expiry_on_get_and_sweep(self):
+        clock = FakeClock()
+        evicted: list[Session] = []
+        store = BoundedSessionStore(idle_ttl=10, on_evict=evicted.append, clock=clock)
+        a = store.create(_schema(), {})
+        clock.now = 5
+        b = store.create(_schema(), {})
+        clock.now = 12
+
+        assert store.sweep() == 1
+        assert store.get(b.id) is b
+        clock.now = 30
+        assert store.get(b.id) is None
+        assert [s.id for s in evicted] == [a.id, b.id]
+        assert store.stats() == {
+            "sessions": 0,
+            "approx_bytes": 0,
+            "evictions": 0,
+            "expirations": 2,
+        }
+
+    def test_update_tracks_bytes(self):
+        store = BoundedSessionStore(max_sessions=10)
+        session = store.create(_schema(), {})
+        before = store.approx_bytes
+        _change(session, "x" * 1000)
+        session.conversation_history.append(ConversationTurn(role="user", content="y" * 500))
+        store.update(session)
+
+        assert store.approx_bytes >= before + 1500
+        assert store.approx_bytes == approx_session_bytes(session)
+
+    def test_counts_the_data_index(self):
+        from interview.engine.data_index import session_index
+
+        store = BoundedSessionStore(max_sessions=10)
+        session = store.create(_schema(), {"name": "Ana", "tags": ["a", "b"]})
+        before = store.approx_bytes
+        session_index(session)
+        store.update(session)
+
+        assert store.approx_bytes > before
+        assert store.approx_bytes == approx_session_bytes(session)
+
+    def test_repeated_changes_stay_bounded(self):
+        store = BoundedSessionStore(max_sessions=10)
+        session = store.create(_schema(), {})
+        for i in range(200):
+            _change(session, str(i) * 100)
+            del session.patch_log[:-4]
+            store.update(session)
+
+        assert store.approx_bytes <= 2 * approx_session_bytes(session)
+
+
+def _change(session: Session, name: str) -> None:
+    """Change the data the way the orchestrator does: with a recorded patch."""
+    op = "replace" if "name" in session.current_data else "add"
+    session.current_data["name"] = name
+    session.version += 1
+    session.patch_log.append(
+        VersionedPatch(version=session.version, ops=[{"op": op, "path": "/name", "value": name}])
+    )
+
+
+def _session_like() -> Session:
+    return Session(id="00000000-0000-0000-0000-000000000000", schema_=_schema())
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from interview.singleflight import SingleFlight
+
+
+class TestSingleFlight:
+    async def test_waiters_share_the_running_call(self):
+        flight: SingleFlight[int] = SingleFlight()
+        release = asyncio.Event()
+        calls = 0
+
+        async def compute() -> int:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return 42
+
+        first = asyncio.create_task(flight.run("k", "a", compute))
+        await asyncio.sleep(0)
+        inflight = flight.current("k")
+        assert inflight is not None
+        assert inflight.tag == "a"
+        waiter = asyncio.create_task(inflight.wait())
+        release.set()
+
+        assert await first == await waiter == 42
+        assert calls == 1
+        assert flight.current("k") is None
+
+    async def test_failure_reaches_waiters_and_clears_the_key(self):
+        flight: SingleFlight[int] = SingleFlight()
+
+        async def fail() -> int:
+            await asyncio.sleep(0)
+            raise RuntimeError("boom")
+
+        first = asyncio.create_task(flight.run("k", "a", fail))
+        await asyncio.sleep(0)
+        inflight = flight.current("k")
+        assert inflight is not None
+
+        with pytest.raises(RuntimeError):
+            await inflight.wait()
+        with pytest.raises(RuntimeError):
+            await first
+        assert len(flight) == 0
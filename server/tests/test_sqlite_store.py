@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+import pytest
+
+from interview.models.schema import FieldSchema, InterviewSchema
+from interview.models.session import ConversationTurn, Session
+from interview.session.sqlite import SQLiteSessionStore
+from interview.session.store import VersionConflictError
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _schema() -> InterviewSchema:
+    return InterviewSchema(fields={"name": FieldSchema(type="string", label="Name")})
+
+
+def _turn_rows(path: Path, session_id: str) -> list[tuple[int, str]]:
+    with sqlite3.connect(path) as conn:
+        return conn.execute(
+            "SELECT seq, content FROM turns WHERE session_id = ? ORDER BY seq", (session_id,)
+        ).fetchall()
+
+
+class TestSQLiteSessionStore:
+    def test_create_and_get_roundtrip(self, tmp_path: Path):
+        store = SQLiteSessionStore(tmp_path / "sessions.db")
+        created = store.create(_schema(), {"name": "Ana"})
+
+        loaded = store.get(created.id)
+
+        assert loaded is not None
+        assert loaded.current_data == {"name": "Ana"}
+        assert loaded.schema_ is created.schema_
+        assert loaded.created_at == created.created_at
+        assert store.get("missing") is None
+
+    def test_update_appends_only_new_turns(self, tmp_path: Path):
+        path = tmp_path / "sessions.db"
+        store = SQLiteSessionStore(path)
+        session = store.create(_schema(), {})
+        session.conversation_history.append(ConversationTurn(role="assistant", content="one"))
+        store.update(session)
+        session.conversation_history.append(ConversationTurn(role="user", content="two"))
+        session.current_data = {"name": "Ana"}
+        session.version = 1
+        session.is_complete = True
+        store.update(session)
+
+        assert _turn_rows(path, session.id) == [(0, "one"), (1, "two")]
+        loaded = store.get(session.id)
+        assert loaded is not None
+        assert [t.content for t in loaded.conversation_history] == ["one", "two"]
+        assert loaded.current_data == {"name": "Ana"}
+        assert loaded.version == 1
+        assert loaded.is_complete
+
+    def test_data_written_only_when_version_changes(self, tmp_path: Path):
+        path = tmp_path / "sessions.db"
+        store = SQLiteSessionStore(path)
+        session = store.create(_schema(), {})
+        with sqlite3.connect(path) as conn:
+            conn.execute("CREATE TABLE data_writes (n INTEGER)")
+            conn.execute(
+                "CREATE TRIGGER count_data_writes AFTER UPDATE OF current_data ON sessions "
+                "BEGIN INSERT INTO data_writes VALUES (1); END"
+            )
+
+        session.conversation_history.append(ConversationTurn(role="assistant", content="hi"))
+        store.update(session)
+        session.current_data = {"name": "Ana"}
+        session.version = 1
+        store.update(session)
+
+        with sqlite3.connect(path) as conn:
+            (writes,) = conn.execute("SELECT COUNT(*) FROM data_writes").fetchone()
+        assert writes == 1
+
+    def test_sessions_survive_reopen(self, tmp_path: Path):
+        path = tmp_path / "sessions.db"
+        first = SQLiteSessionStore(path)
+        session = first.create(_schema(), {"name": "Ana"})
+        first.close()
+
+        loaded = SQLiteSessionStore(path).get(session.id)
+
+        assert loaded is not None
+        assert loaded.schema_.fields["name"].label == "Name"
+
+    def test_update_inserts_unknown_session(self, tmp_path: Path):
+        store = SQLiteSessionStore(tmp_path / "sessions.db")
+        session = Session(id="external", schema_=_schema(), current_data={"name": "Bo"})
+        session.conversation_history.append(ConversationTurn(role="user", content="hi"))
+        store.update(session)
+
+        loaded = store.get("external")
+        assert loaded is not None
+        assert loaded.current_data == {"name": "Bo"}
+        assert len(loaded.conversation_history) == 1
+
+    def test_columns_use_the_compact_codec(self, tmp_path: Path):
+        from interview.session.compact import decode_value
+
+        path = tmp_path / "sessions.db"
+        store = SQLiteSessionStore(path)
+        session = store.create(_schema(), {"name": "Ana"})
+
+        with sqlite3.connect(path) as conn:
+            (data,) = conn.execute(
+                "SELECT current_data FROM sessions WHERE id = ?", (session.id,)
+            ).fetchone()
+        assert isinstance(data, bytes)
+        assert decode_value(data) == {"name": "Ana"}
+
+    def test_reads_json_rows(self, tmp_path: Path):
+        path = tmp_path / "sessions.db"
+        store = SQLiteSessionStore(path)
+        session = store.create(_schema(), {})
+        with sqlite3.connect(path) as conn:
+            conn.execute(
+                "UPDATE sessions SET current_data = ?, patch_log = ?, version = 1 WHERE id = ?",
+                (
+                    '{"name": "Ana"}',
+                    '[{"version": 1, "ops": [{"op": "add", "path": "/name", "value": "Ana"}]}]',
+                    session.id,
+                ),
+            )
+
+        loaded = store.get(session.id)
+
+        assert loaded is not None
+        assert loaded.current_data == {"name": "Ana"}
+        assert [(p.version, p.ops[0]["path"]) for p in loaded.patch_log] == [(1, "/name")]
+
+    def test_concurrent_writers(self, tmp_path: Path):
+        store = SQLiteSessionStore(tmp_path / "sessions.db", pool_size=4)
+
+        def work(i: int) -> str:
+            session = store.create(_schema(), {})
+            session.current_data = {"name": str(i)}
+            session.version += 1
+            session.conversation_history.append(ConversationTurn(role="user", content=str(i)))
+            store.update(session)
+            return session.id
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            ids = list(pool.map(work, range(40)))
+
+        assert store.stats()["sessions"] == 40
+        for i, session_id in enumerate(ids):
+            loaded = store.get(session_id)
+            assert loaded is not None
+            assert loaded.current_data == {"name": str(i)}
+
+
+class TestSQLiteOptimisticWrites:
+    def test_stale_update_rejected(self, tmp_path: Path):
+        store = SQLiteSessionStore(tmp_path / "sessions.db")
+        created = store.create(_schema(), {})
+        first = store.get(created.id)
+        second = store.get(created.id)
+        assert first is not None
+        assert second is not None
+
+        first.current_data = {"name": "Ana"}
+        first.version += 1
+        store.update(first)
+        second.current_data = {"name": "Bo"}
+        second.version += 1
+
+        with pytest.raises(VersionConflictError):
+            store.update(second)
+        assert store.get_revision(created.id) == first.revision == 1
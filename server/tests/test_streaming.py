@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import json
+from collections.abc import AsyncIterator
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock
+
+import anyio
+import dspy
+from dspy.utils.dummies import DummyLM
+from fastapi.testclient import TestClient
+
+from interview.engine.dspy_modules import InterviewStepOutput, create_interview_step
+from interview.engine.orchestrator import InterviewOrchestrator
+from interview.engine.streaming import TextBlockStreamParser, stream_program
+from interview.main import create_app
+from interview.models.api import SubmitRequest
+from interview.models.schema import FieldSchema, InterviewSchema, ValidationRule
+from interview.models.ui_blocks import FormBlock, InputElement, TextBlock, UIBlock
+from interview.session.store import InMemorySessionStore
+
+SIMPLE_SCHEMA = {"fields": {"name": {"type": "string", "validation": [{"type": "required"}]}}}
+GREETING = 'Hi there! Tell me your "name" — please \U0001f600'
+
+
+def _blocks() -> list[UIBlock]:
+    return [
+        TextBlock(value=GREETING),
+        FormBlock(elements=[InputElement(type="text", label="Name", binding="name")]),
+    ]
+
+
+class FakeStreamingStep:
+    """Stands in for a streaming LM: replays JSONAdapter-style output in small chunks."""
+
+    def __init__(self, blocks: list[UIBlock], chunk_size: int = 4) -> None:
+        self.blocks = blocks
+        self.chunk_size = chunk_size
+        self.calls = 0
+
+    async def __call__(self, **inputs: str) -> AsyncIterator[Any]:
+        self.calls += 1
+        output = json.dumps(
+            {
+                "reasoning": 'Ask for the "value" of name first {[',
+                "response": {"ui_blocks": [b.model_dump() for b in self.blocks]},
+            }
+        )
+        for i in range(0, len(output), self.chunk_size):
+            yield output[i : i + self.chunk_size]
+        prediction = MagicMock()
+        prediction.response = InterviewStepOutput(ui_blocks=self.blocks)
+        yield prediction
+
+
+class StreamingDummyLM(DummyLM):  # type: ignore[misc]
+    """DummyLM that also sends its answer in small chunks, as litellm does under streamify."""
+
+    def __call__(self, prompt: Any = None, messages: Any = None, **kwargs: Any) -> Any:
+        outputs = super().__call__(prompt=prompt, messages=messages, **kwargs)
+        stream = dspy.settings.send_stream
+        if stream is not None:
+            text = outputs[0]
+            for i in range(0, len(text), 5):
+                delta = SimpleNamespace(content=text[i : i + 5])
+                chunk = SimpleNamespace(choices=[SimpleNamespace(delta=delta)])
+                anyio.from_thread.run(stream.send, chunk)
+        return outputs
+
+
+def _dspy_step() -> Any:
+    step = create_interview_step()
+    answer = {
+        "reasoning": 'Ask for the "value" of name first {[',
+        "response": {"ui_blocks": [b.model_dump() for b in _blocks()]},
+    }
+    step.set_lm(StreamingDummyLM([answer]))
+    return step
+
+
+def _schema() -> InterviewSchema:
+    return InterviewSchema(
+        fields={
+            "name": FieldSchema(
+                type="string", label="Name", validation=[ValidationRule(type="required")]
+            ),
+            "age": FieldSchema(
+                type="integer",
+                label="Age",
+                validation=[ValidationRule(type="min", param=18)],
+            ),
+        }
+    )
+
+
+def _orchestrator(
+    stream: FakeStreamingStep | None = None,
+    store: InMemorySessionStore | None = None,
+) -> InterviewOrchestrator:
+    return InterviewOrchestrator(
+        store=store if store is not None else InMemorySessionStore(),
+        interview_step=MagicMock(),
+        text_extractor=MagicMock(),
+        interview_step_stream=stream or FakeStreamingStep(_blocks()),
+    )
+
+
+async def _collect(events: AsyncIterator[Any]) -> list[Any]:
+    return [event async for event in events]
+
+
+class TestTextBlockStreamParser:
+    def test_extracts_text_across_chunk_boundaries(self):
+        output = json.dumps({"response": {"ui_blocks": [b.model_dump() for b in _blocks()]}})
+        for size in (1, 2, 5, 50):
+            parser = TextBlockStreamParser()
+            text = "".join(parser.feed(output[i : i + size]) for i in range(0, len(output), size))
+            assert text == GREETING
+
+    def test_ignores_option_values_inside_forms(self):
+        output = json.dumps(
+            {
+                "ui_blocks": [
+                    {
+                        "kind": "form",
+                        "elements": [{"kind": "select", "options": [{"value": "x"}]}],
+                    },
+                    {"kind": "text", "value": "Later text"},
+                ]
+            }
+        )
+        assert TextBlockStreamParser().feed(output) == "Later text"
+
+    def test_stops_after_first_text_block(self):
+        parser = TextBlockStreamParser()
+        text = parser.feed('{"ui_blocks": [{"value": "one"}, {"value": "two"}]}')
+        assert text == "one"
+        assert parser.done
+
+
+class TestStreamProgram:
+    async def test_streamify_yields_text_chunks_then_prediction(self):
+        stream = stream_program(_dspy_step())
+        items = await _collect(
+            stream(
+                field_schema="{}",
+                current_data="{}",
+                missing_fields='["name"]',
+                conversation_history="[]",
+            )
+        )
+
+        chunks = items[:-1]
+        assert len(chunks) > 1
+        assert all(isinstance(chunk, str) for chunk in chunks)
+        assert isinstance(items[-1], dspy.Prediction)
+        assert items[-1].response.ui_blocks == _blocks()
+
+    async def test_orchestrator_streams_through_dspy(self):
+        orch = InterviewOrchestrator(
+            store=InMemorySessionStore(),
+            interview_step=_dspy_step(),
+            text_extractor=MagicMock(),
+        )
+        events = await _collect(orch.start_stream(_schema()))
+
+        kinds = [e.event for e in events]
+        assert kinds.count("text") > 1
+        assert kinds[-2:] == ["form", "state"]
+        assert "".join(e.data["delta"] for e in events if e.event == "text") == GREETING
+
+
+class TestOrchestratorStreaming:
+    async def test_start_stream_emits_text_form_then_state(self):
+        orch = _orchestrator()
+        events = await _collect(orch.start_stream(_schema()))
+
+        kinds = [e.event for e in events]
+        assert kinds[-1] == "state"
+        assert kinds.index("form") > max(i for i, k in enumerate(kinds) if k == "text")
+        text = "".join(e.data["delta"] for e in events if e.event == "text")
+        assert text == GREETING
+        state = events[-1].data
+        assert state["session_id"]
+        assert state["is_complete"] is False
+
+    async def test_submit_stream_errors_sent_without_llm_call(self):
+        stream = FakeStreamingStep(_blocks())
+        orch = _orchestrator(stream)
+        start = await _collect(orch.start_stream(_schema()))
+        session_id = start[-1].data["session_id"]
+
+        events = await _collect(
+            orch.submit_stream(session_id, SubmitRequest(type="form", data={"age": 5}))
+        )
+
+        assert [e.event for e in events] == ["errors", "state"]
+        assert "age" in events[0].data["errors"]
+        assert stream.calls == 1
+
+    async def test_submit_stream_completion(self):
+        orch = _orchestrator()
+        start = await _collect(orch.start_stream(_schema()))
+        session_id = start[-1].data["session_id"]
+
+        events = await _collect(
+            orch.submit_stream(session_id, SubmitRequest(type="form", data={"name": "Ana"}))
+        )
+
+        assert [e.event for e in events] == ["state"]
+        assert events[0].data["is_complete"] is True
+        assert events[0].data["current_data"] == {"name": "Ana"}
+
+
+def _parse_sse(body: str) -> list[tuple[str, dict[str, Any]]]:
+    events: list[tuple[str, dict[str, Any]]] = []
+    for chunk in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in chunk.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+class TestStreamingEndpoints:
+    def _client(self) -> TestClient:
+        app = create_app()
+        store = InMemorySessionStore()
+        app.state.orchestrator = _orchestrator(store=store)
+        app.state.store = store
+        return TestClient(app, raise_server_exceptions=False)
+
+    def test_start_stream_returns_sse(self):
+        client = self._client()
+        response = client.post("/api/interview/start/stream", json={"schema": SIMPLE_SCHEMA})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = _parse_sse(response.text)
+        assert events[-1][0] == "state"
+        assert any(name == "form" for name, _ in events)
+
+    def test_submit_stream_nonexistent_session(self):
+        client = self._client()
+        response = client.post(
+            "/api/interview/nonexistent/submit/stream",
+            json={"type": "form", "data": {"name": "John"}},
+        )
+
+        assert response.status_code == 404
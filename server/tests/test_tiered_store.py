@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from interview.models.schema import FieldSchema, InterviewSchema
+from interview.models.session import ConversationTurn
+from interview.session.sqlite import SQLiteSessionStore
+from interview.session.store import VersionConflictError
+from interview.session.tiered import TieredSessionStore, route_hint
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _schema() -> InterviewSchema:
+    return InterviewSchema(fields={"name": FieldSchema(type="string", label="Name")})
+
+
+class TestTieredSessionStore:
+    def test_reads_served_from_cache_when_revision_matches(self, tmp_path: Path):
+        store = TieredSessionStore(SQLiteSessionStore(tmp_path / "s.db"))
+        session = store.create(_schema(), {})
+
+        first = store.get(session.id)
+        second = store.get(session.id)
+
+        assert first is not None
+        assert second is not None
+        assert first is not second  # callers get private copies
+        assert first.current_data is second.current_data  # data is copy-on-write
+        assert store.stats()["cache_hits"] == 2
+        assert store.stats()["cache_misses"] == 0
+
+    def test_copies_share_one_data_index(self, tmp_path: Path):
+        from interview.engine.data_index import session_index
+
+        backend = SQLiteSessionStore(tmp_path / "s.db")
+        session = backend.create(_schema(), {"name": "Ana"})
+        store = TieredSessionStore(backend)
+
+        first = store.get(session.id)
+        second = store.get(session.id)
+
+        assert first is not None
+        assert second is not None
+        assert session_index(first) is session_index(second)
+
+    def test_write_from_other_worker_invalidates(self, tmp_path: Path):
+        backend = SQLiteSessionStore(tmp_path / "s.db")
+        worker_a = TieredSessionStore(backend)
+        worker_b = TieredSessionStore(SQLiteSessionStore(tmp_path / "s.db"))
+        session = worker_a.create(_schema(), {})
+        worker_a.get(session.id)
+
+        remote = worker_b.get(session.id)
+        assert remote is not None
+        remote.current_data = {"name": "Ana"}
+        remote.version += 1
+        worker_b.update(remote)
+
+        fresh = worker_a.get(session.id)
+        assert fresh is not None
+        assert fresh.current_data == {"name": "Ana"}
+        assert worker_a.stats()["cache_misses"] == 1
+
+    def test_conflicting_write_raises_and_drops_cache(self, tmp_path: Path):
+        worker_a = TieredSessionStore(SQLiteSessionStore(tmp_path / "s.db"))
+        worker_b = TieredSessionStore(SQLiteSessionStore(tmp_path / "s.db"))
+        session = worker_a.create(_schema(), {})
+        stale = worker_a.get(session.id)
+        remote = worker_b.get(session.id)
+        assert stale is not None
+        assert remote is not None
+        worker_b.update(remote)
+
+        stale.current_data = {"name": "lost"}
+        with pytest.raises(VersionConflictError):
+            worker_a.update(stale)
+        assert worker_a.stats()["conflicts"] == 1
+        assert worker_a.stats()["cached_sessions"] == 0
+
+    def test_unsaved_mutation_does_not_leak_into_cache(self, tmp_path: Path):
+        store = TieredSessionStore(SQLiteSessionStore(tmp_path / "s.db"))
+        session = store.create(_schema(), {})
+        loaded = store.get(session.id)
+        assert loaded is not None
+        loaded.current_data = {"name": "unsaved"}
+        loaded.conversation_history.append(ConversationTurn(role="user", content="unsaved"))
+
+        again = store.get(session.id)
+        assert again is not None
+        assert again.current_data == {}
+        assert again.conversation_history == []
+
+    def test_revision_check_skipped_within_revalidate_window(self, tmp_path: Path):
+        now = [0.0]
+        backend = SQLiteSessionStore(tmp_path / "s.db")
+        store = TieredSessionStore(backend, revalidate_after=5, clock=lambda: now[0])
+        session = store.create(_schema(), {})
+        checks: list[str] = []
+        get_revision = backend.get_revision
+
+        def counted(session_id: str) -> int | None:
+            checks.append(session_id)
+            return get_revision(session_id)
+
+        backend.get_revision = counted  # type: ignore[method-assign]
+
+        assert store.get(session.id) is not None
+        assert checks == []
+        now[0] = 6
+        assert store.get(session.id) is not None
+        assert checks == [session.id]
+        assert store.stats()["cache_hits"] == 2
+
+    def test_stale_cached_write_still_conflicts(self, tmp_path: Path):
+        worker_a = TieredSessionStore(SQLiteSessionStore(tmp_path / "s.db"), revalidate_after=60)
+        worker_b = TieredSessionStore(SQLiteSessionStore(tmp_path / "s.db"))
+        session = worker_a.create(_schema(), {})
+        remote = worker_b.get(session.id)
+        assert remote is not None
+        worker_b.update(remote)
+
+        stale = worker_a.get(session.id)
+        assert stale is not None
+        with pytest.raises(VersionConflictError):
+            worker_a.update(stale)
+        fresh = worker_a.get(session.id)
+        assert fresh is not None
+        assert fresh.revision == remote.revision
+
+    def test_route_prefix(self, tmp_path: Path):
+        store = TieredSessionStore(SQLiteSessionStore(tmp_path / "s.db"), route_prefix="w2")
+        session = store.create(_schema(), {})
+
+        assert route_hint(session.id) == "w2"
+        assert route_hint("3f2b-no-prefix") is None
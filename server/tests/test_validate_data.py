@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from interview.engine.validator import validate_data
+from interview.engine.validator import validate_array_indexes, validate_data
 from interview.models.schema import (
     Condition,
     FieldSchema,
@@ -124,3 +124,55 @@ class TestValidateData:
         # name and age should pass since they're in the submitted data dict
         assert "name" not in errors
         assert "age" not in errors
+
+
+def _schema_with_children(max_items: int | None = None) -> InterviewSchema:
+    rules = [] if max_items is None else [ValidationRule(type="max_items", param=max_items)]
+    return InterviewSchema(
+        fields={
+            "children": FieldSchema(
+                type="array",
+                validation=rules,
+                item_schema=FieldSchema(
+                    type="object",
+                    fields={
+                        "name": FieldSchema(type="string"),
+                        "toys": FieldSchema(type="array", item_schema=FieldSchema(type="string")),
+                    },
+                ),
+            ),
+        }
+    )
+
+
+class TestValidateArrayIndexes:
+    def test_index_within_max_items(self):
+        errors = validate_array_indexes({"children[2].name": "Al"}, _schema_with_children(3), 100)
+        assert errors == {}
+
+    def test_index_beyond_max_items(self):
+        errors = validate_array_indexes({"children[3].name": "Al"}, _schema_with_children(3), 100)
+        assert list(errors) == ["children[3].name"]
+        assert "out of range" in errors["children[3].name"][0]
+
+    def test_global_cap_applies_without_rule(self):
+        schema = _schema_with_children()
+        assert validate_array_indexes({"children[99].name": "Al"}, schema, 100) == {}
+        assert "children[5000000].name" in validate_array_indexes(
+            {"children[5000000].name": "Al"}, schema, 100
+        )
+
+    def test_nested_arrays_and_unknown_paths_use_cap(self):
+        schema = _schema_with_children(3)
+        errors = validate_array_indexes(
+            {"children[0].toys[100]": "ball", "other[100]": 1, "children[1].toys[5]": "car"},
+            schema,
+            100,
+        )
+        assert set(errors) == {"children[0].toys[100]", "other[100]"}
+
+    def test_rule_custom_message(self):
+        schema = _schema_with_children(1)
+        schema.fields["children"].validation[0].message = "Only one child, please."
+        errors = validate_array_indexes({"children[1].name": "Al"}, schema, 100)
+        assert errors == {"children[1].name": ["Only one child, please."]}
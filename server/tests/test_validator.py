@@ -50,6 +50,12 @@ def test_max_length():
     assert len(validate_field("Jonathan", field)) == 1
 
 
+def test_max_items():
+    field = FieldSchema(type="array", validation=[ValidationRule(type="max_items", param=2)])
+    assert validate_field(["a", "b"], field) == []
+    assert len(validate_field(["a", "b", "c"], field)) == 1
+
+
 def test_pattern():
     field = FieldSchema(
         type="string",
@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from interview.engine.dspy_modules import InterviewStepOutput
+from interview.engine.orchestrator import InterviewOrchestrator, _merge_into_session
+from interview.engine.patch import apply_patch
+from interview.main import create_app
+from interview.models.ui_blocks import FormBlock, InputElement, TextBlock
+from interview.session.store import InMemorySessionStore
+from interview.websocket import SESSION_NOT_FOUND_CODE
+
+SCHEMA = {
+    "fields": {
+        "name": {"type": "string", "validation": [{"type": "required"}]},
+        "age": {"type": "integer", "validation": [{"type": "required"}]},
+    }
+}
+
+
+def _blocks() -> list[Any]:
+    return [
+        TextBlock(value="Hello!"),
+        FormBlock(
+            elements=[
+                InputElement(type="text", label="Name", binding="name"),
+                InputElement(type="integer", label="Age", binding="age"),
+            ]
+        ),
+    ]
+
+
+def _mock_interview_step() -> MagicMock:
+    mock = MagicMock()
+    mock.return_value.response = InterviewStepOutput(ui_blocks=_blocks())
+    return mock
+
+
+async def _fake_stream(**inputs: str) -> AsyncIterator[Any]:
+    yield '{"response": {"ui_blocks": [{"kind": "text", "value": "Hel'
+    yield 'lo!"}]}}'
+    prediction = MagicMock()
+    prediction.response = InterviewStepOutput(ui_blocks=_blocks())
+    yield prediction
+
+
+def _mock_text_extractor() -> MagicMock:
+    mock = MagicMock()
+    mock.return_value.response.extracted = {"name": "Ana"}
+    mock.return_value.response.unresolved = None
+    return mock
+
+
+def _create_test_client() -> TestClient:
+    app = create_app()
+    store = InMemorySessionStore()
+    app.state.orchestrator = InterviewOrchestrator(
+        store=store,
+        interview_step=_mock_interview_step(),
+        text_extractor=_mock_text_extractor(),
+        interview_step_stream=_fake_stream,
+    )
+    app.state.store = store
+    return TestClient(app)
+
+
+def _start(client: TestClient) -> str:
+    response = client.post("/api/interview/start", json={"schema": SCHEMA})
+    return str(response.json()["session_id"])
+
+
+def _merge_elsewhere(client: TestClient, session_id: str, bindings: dict[str, Any]) -> None:
+    """Change the session's data as another connection's turn would."""
+    _merge_into_session(client.app.state.store.get(session_id), bindings)  # type: ignore[attr-defined]
+
+
+class TestSessionSocket:
+    def test_ready_frame_carries_state(self):
+        client = _create_test_client()
+        session_id = _start(client)
+
+        with client.websocket_connect(f"/api/interview/{session_id}/ws") as ws:
+            ready = ws.receive_json()
+
+        assert ready["type"] == "ready"
+        assert ready["turn"] == 1
+        assert ready["data"] == {}
+        assert ready["blocks"][0]["kind"] == "text"
+
+    def test_resume_at_current_turn_skips_state(self):
+        client = _create_test_client()
+        session_id = _start(client)
+
+        with client.websocket_connect(f"/api/interview/{session_id}/ws?turn=1") as ws:
+            ready = ws.receive_json()
+
+        assert "data" not in ready
+        assert "blocks" not in ready
+
+    def test_message_turn_streams_frames_and_patch(self):
+        client = _create_test_client()
+        session_id = _start(client)
+
+        with client.websocket_connect(f"/api/interview/{session_id}/ws") as ws:
+            ready = ws.receive_json()
+            ws.send_json({"type": "message", "text": "I'm Ana"})
+            frames = [ws.receive_json()]
+            while frames[-1]["type"] not in ("step", "complete"):
+                frames.append(ws.receive_json())
+
+        types = [f["type"] for f in frames]
+        assert "text" in types
+        assert "block" in types
+        step = frames[-1]
+        assert step["type"] == "step"
+        assert step["patch"] == [{"op": "add", "path": "/name", "value": "Ana"}]
+        assert apply_patch(ready["data"], step["patch"]) == {"name": "Ana"}
+
+    def test_patch_covers_changes_made_elsewhere(self):
+        client = _create_test_client()
+        session_id = _start(client)
+
+        with client.websocket_connect(f"/api/interview/{session_id}/ws") as ws:
+            ready = ws.receive_json()
+            _merge_elsewhere(client, session_id, {"age": 30})
+            ws.send_json({"type": "message", "text": "I'm Ana"})
+            frame = ws.receive_json()
+            while frame["type"] not in ("step", "complete"):
+                frame = ws.receive_json()
+
+        assert apply_patch(ready["data"], frame["patch"]) == {"age": 30, "name": "Ana"}
+
+    def test_whole_document_when_log_does_not_reach_back(self):
+        client = _create_test_client()
+        session_id = _start(client)
+
+        with client.websocket_connect(f"/api/interview/{session_id}/ws") as ws:
+            ready = ws.receive_json()
+            _merge_elsewhere(client, session_id, {"age": 30})
+            client.app.state.store.get(session_id).patch_log.clear()  # type: ignore[attr-defined]
+            ws.send_json({"type": "message", "text": "I'm Ana"})
+            frame = ws.receive_json()
+            while frame["type"] not in ("step", "complete"):
+                frame = ws.receive_json()
+
+        assert frame["patch"] == [
+            {"op": "replace", "path": "", "value": {"age": 30, "name": "Ana"}}
+        ]
+        assert apply_patch(ready["data"], frame["patch"]) == {"age": 30, "name": "Ana"}
+
+    def test_completion_frame(self):
+        client = _create_test_client()
+        session_id = _start(client)
+
+        with client.websocket_connect(f"/api/interview/{session_id}/ws") as ws:
+            ws.receive_json()
+            ws.send_json({"type": "form", "data": {"name": "Ana", "age": 30}})
+            frame = ws.receive_json()
+
+        assert frame["type"] == "complete"
+        assert len(frame["patch"]) == 2
+
+    def test_validation_errors_sent_as_error_frame(self):
+        client = _create_test_client()
+        session_id = _start(client)
+
+        with client.websocket_connect(f"/api/interview/{session_id}/ws") as ws:
+            ws.receive_json()
+            ws.send_json({"type": "form", "data": {}})
+            frame = ws.receive_json()
+
+        assert frame["type"] == "error"
+        assert "name" in frame["errors"]
+
+    def test_ping_and_malformed_frames(self):
+        client = _create_test_client()
+        session_id = _start(client)
+
+        with client.websocket_connect(f"/api/interview/{session_id}/ws") as ws:
+            ws.receive_json()
+            ws.send_json({"type": "ping"})
+            assert ws.receive_json() == {"type": "pong"}
+            ws.send_json({"type": "bogus"})
+            assert ws.receive_json()["type"] == "error"
+
+    def test_unknown_session_closes(self):
+        client = _create_test_client()
+
+        with (
+            pytest.raises(WebSocketDisconnect) as exc_info,
+            client.websocket_connect("/api/interview/nonexistent/ws") as ws,
+        ):
+            ws.receive_json()
+
+        assert exc_info.value.code == SESSION_NOT_FOUND_CODE